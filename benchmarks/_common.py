@@ -0,0 +1,53 @@
+import asyncio
+import time
+import timeit
+from typing import Awaitable, Callable, Dict, Tuple
+
+BenchmarkCases = Dict[str, Callable[[], object]]
+"""Mapping from benchmark case name to a function performing one iteration of that case."""
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Measure the best observed duration of a single call to fn, in seconds."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_cases(cases: BenchmarkCases) -> Dict[str, float]:
+    """Measure and print the duration of each benchmark case."""
+    results = {}
+    for name, fn in cases.items():
+        results[name] = measure(fn)
+        print(f"{name:60s} {results[name] * 1e6:12.2f} us")
+    return results
+
+
+def max_event_loop_block(work: Callable[[], Awaitable[object]]) -> Tuple[float, float]:
+    """Run the coroutine produced by work alongside a probe task which continually yields to the event loop.
+
+    Returns:
+        * Total duration of work, in seconds
+        * Longest duration the probe task was prevented from running, in seconds
+    """
+    async def run() -> Tuple[float, float]:
+        done = False
+        max_block = 0.0
+
+        async def probe():
+            nonlocal max_block
+            while not done:
+                t0 = time.perf_counter()
+                await asyncio.sleep(0)
+                max_block = max(max_block, time.perf_counter() - t0)
+
+        probe_task = asyncio.ensure_future(probe())
+        await asyncio.sleep(0)
+        t_start = time.perf_counter()
+        await work()
+        duration = time.perf_counter() - t_start
+        done = True
+        await probe_task
+        return duration, max_block
+
+    return asyncio.run(run())
@@ -0,0 +1,79 @@
+"""Measure how long serializing and parsing large payloads blocks the event loop, with and without implicitdict.aio."""
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from implicitdict import ImplicitDict
+from implicitdict.aio import iter_json_bytes, write_json
+
+from _common import BenchmarkCases, max_event_loop_block, run_cases
+from models import OperationalIntent, operational_intent, operational_intent_json
+
+
+class _NullWriter(object):
+    def write(self, data: bytes) -> None:
+        pass
+
+    async def drain(self) -> None:
+        pass
+
+
+def _response() -> list:
+    return [operational_intent(n_volumes=5) for _ in range(1000)]
+
+
+def cases() -> BenchmarkCases:
+    response = _response()
+
+    async def consume():
+        async for _ in iter_json_bytes(response):
+            pass
+
+    source = operational_intent_json(n_volumes=200)
+
+    return {
+        "aio/1000 intents: json.dumps": lambda: json.dumps(response).encode("utf-8"),
+        "aio/1000 intents: iter_json_bytes": lambda: max_event_loop_block(consume),
+        "aio/200-volume intent: parse": lambda: ImplicitDict.parse(source, OperationalIntent),
+        "aio/200-volume intent: parse_async": lambda: max_event_loop_block(
+            lambda: ImplicitDict.parse_async(source, OperationalIntent)),
+    }
+
+
+def _report_event_loop_blocking() -> None:
+    response = _response()
+
+    async def blocking():
+        _NullWriter().write(json.dumps(response).encode("utf-8"))
+
+    print(f"{'Approach':40s} {'Total (ms)':>12s} {'Max loop block (ms)':>20s}")
+    duration, max_block = max_event_loop_block(blocking)
+    print(f"{'json.dumps on event loop':40s} {duration * 1e3:12.1f} {max_block * 1e3:20.2f}")
+    for chunk_size in (1024, 16 * 1024, 64 * 1024, 256 * 1024):
+        duration, max_block = max_event_loop_block(lambda: write_json(_NullWriter(), response, chunk_size))
+        print(f"{f'write_json, chunk_size={chunk_size}':40s} {duration * 1e3:12.1f} {max_block * 1e3:20.2f}")
+
+
+def _report_parse_event_loop_blocking() -> None:
+    source = operational_intent_json(n_volumes=2000)
+
+    async def blocking():
+        ImplicitDict.parse(source, OperationalIntent)
+
+    print(f"{'Approach':40s} {'Total (ms)':>12s} {'Max loop block (ms)':>20s}")
+    duration, max_block = max_event_loop_block(blocking)
+    print(f"{'parse on event loop':40s} {duration * 1e3:12.1f} {max_block * 1e3:20.2f}")
+    for time_slice in (0.001, 0.005, 0.02):
+        duration, max_block = max_event_loop_block(
+            lambda: ImplicitDict.parse_async(source, OperationalIntent, time_slice=time_slice))
+        print(f"{f'parse_async, time_slice={time_slice}':40s} {duration * 1e3:12.1f} {max_block * 1e3:20.2f}")
+    with ThreadPoolExecutor(1) as executor:
+        duration, max_block = max_event_loop_block(
+            lambda: ImplicitDict.parse_async(source, OperationalIntent, executor=executor))
+    print(f"{'parse_async, thread executor':40s} {duration * 1e3:12.1f} {max_block * 1e3:20.2f}")
+
+
+if __name__ == "__main__":
+    run_cases(cases())
+    _report_event_loop_blocking()
+    _report_parse_event_loop_blocking()
@@ -0,0 +1,38 @@
+"""Compare ImplicitDict's type-aware copy implementations against the default copy machinery."""
+
+import copy
+
+from implicitdict import ImplicitDict
+
+from _common import BenchmarkCases, run_cases
+from models import operational_intent
+
+
+def _with_default_copy(fn):
+    """Call fn with ImplicitDict's custom copy methods removed so that the default copy machinery is used."""
+    def wrapper():
+        copy_method = ImplicitDict.__dict__["__copy__"]
+        deepcopy_method = ImplicitDict.__dict__["__deepcopy__"]
+        del ImplicitDict.__copy__
+        del ImplicitDict.__deepcopy__
+        try:
+            return fn()
+        finally:
+            ImplicitDict.__copy__ = copy_method
+            ImplicitDict.__deepcopy__ = deepcopy_method
+    return wrapper
+
+
+def cases() -> BenchmarkCases:
+    intent = operational_intent(n_volumes=20)
+
+    return {
+        "copy/deepcopy: default": _with_default_copy(lambda: copy.deepcopy(intent)),
+        "copy/deepcopy: type-aware": lambda: copy.deepcopy(intent),
+        "copy/copy: default": _with_default_copy(lambda: copy.copy(intent)),
+        "copy/copy: type-aware": lambda: copy.copy(intent),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
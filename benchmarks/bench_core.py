@@ -0,0 +1,46 @@
+"""Measure the core ImplicitDict operations across model shapes.
+
+Covers parse (and therefore _parse_value), construction (__init__), attribute access (__getattribute__),
+StringBasedDateTime, and make_json_schema.
+"""
+
+from datetime import datetime, timezone
+
+from implicitdict import ImplicitDict, StringBasedDateTime, _parse_value
+from implicitdict.jsonschema import make_json_schema
+
+from _common import BenchmarkCases, run_cases
+from bench_jsonschema import _resolver
+from models import SHAPES
+
+
+def _attribute_access(value: ImplicitDict):
+    fields = list(value.keys())
+
+    def access():
+        for field in fields:
+            getattr(value, field)
+    return access
+
+
+def cases() -> BenchmarkCases:
+    result = {}
+    for shape, (t, make_json) in SHAPES.items():
+        source = make_json()
+        parsed = ImplicitDict.parse(source, t)
+        result[f"core/{shape}: parse"] = lambda source=source, t=t: ImplicitDict.parse(source, t)
+        result[f"core/{shape}: construct"] = lambda parsed=parsed, t=t: t(**parsed)
+        result[f"core/{shape}: attribute access"] = _attribute_access(parsed)
+        result[f"core/{shape}: make_json_schema"] = lambda t=t: make_json_schema(t, _resolver, {})
+
+    timestamp = "2024-01-02T03:04:05.123456Z"
+    dt = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    result["core/StringBasedDateTime: from str"] = lambda: StringBasedDateTime(timestamp)
+    result["core/StringBasedDateTime: from datetime"] = lambda: StringBasedDateTime(dt)
+    result["core/StringBasedDateTime: _parse_value"] = lambda: _parse_value(timestamp, StringBasedDateTime)
+    result["core/StringBasedDateTime: .datetime"] = lambda: StringBasedDateTime(timestamp).datetime
+    return result
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,33 @@
+"""Compare diff/apply_patch on large trees with small changes against serializing and re-parsing the whole tree."""
+
+import json
+
+from implicitdict import ImplicitDict
+from implicitdict.diff import apply_patch, diff, merge_diff
+from implicitdict.evolution import evolve_in
+from implicitdict.serialization import dumps
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent
+
+
+def cases() -> BenchmarkCases:
+    intent = operational_intent(n_volumes=500)
+    changed = evolve_in(intent, "details.volumes[250].time_start.value", "2024-01-02T00:00:00Z")
+    unshared = ImplicitDict.parse(json.loads(dumps(changed)), OperationalIntent)
+    patch = diff(intent, changed)
+    merge_patch = merge_diff(intent, changed)
+    changed_json = json.loads(dumps(changed))
+
+    return {
+        "diff/small change: diff of evolved copy": lambda: diff(intent, changed),
+        "diff/small change: diff of independent copy": lambda: diff(intent, unshared),
+        "diff/small change: merge_diff of evolved copy": lambda: merge_diff(intent, changed),
+        "patch/small change: parse full JSON": lambda: ImplicitDict.parse(changed_json, OperationalIntent),
+        "patch/small change: apply_patch JSON Patch": lambda: apply_patch(intent, patch),
+        "patch/small change: apply_patch Merge Patch": lambda: apply_patch(intent, merge_patch),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,34 @@
+"""Compare evolve/evolve_in against deepcopy-then-mutate and the copy constructor."""
+
+import copy
+
+from implicitdict.evolution import evolve, evolve_in
+
+from _common import BenchmarkCases, run_cases
+from models import operational_intent
+
+
+def cases() -> BenchmarkCases:
+    intent = operational_intent(n_volumes=50)
+
+    def deepcopy_then_mutate_top_level():
+        result = copy.deepcopy(intent)
+        result.details = intent.details
+        return result
+
+    def deepcopy_then_mutate_nested():
+        result = copy.deepcopy(intent)
+        result.details.volumes[25].time_start.value = "2024-01-02T00:00:00Z"
+        return result
+
+    return {
+        "evolve/top-level: constructor": lambda: type(intent)(intent, details=intent.details),
+        "evolve/top-level: deepcopy then mutate": deepcopy_then_mutate_top_level,
+        "evolve/top-level: evolve": lambda: evolve(intent, details=intent.details),
+        "evolve/nested: deepcopy then mutate": deepcopy_then_mutate_nested,
+        "evolve/nested: evolve_in": lambda: evolve_in(intent, "details.volumes[25].time_start.value", "2024-01-02T00:00:00Z"),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,44 @@
+"""Measure the cold-start cost of importing implicitdict, which defers importing arrow, pytimeparse, and jsonschema."""
+
+import subprocess
+import sys
+from typing import List, Tuple
+
+from _common import BenchmarkCases, run_cases
+
+
+def _python(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], check=True, capture_output=True, text=True)
+
+
+def import_times(module: str) -> List[Tuple[str, int]]:
+    """Cumulative import time, in microseconds, of module and each module it imports, as reported by -X importtime."""
+    result = []
+    for line in _python(f"import {module}", "-X", "importtime").stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            result.append((fields[2].strip(), int(fields[1])))
+    return result
+
+
+def cases() -> BenchmarkCases:
+    return {
+        "import/interpreter startup (baseline)": lambda: _python("pass"),
+        "import/import implicitdict": lambda: _python("import implicitdict"),
+        "import/import implicitdict + first StringBasedDateTime": lambda: _python(
+            "import implicitdict; implicitdict.StringBasedDateTime('2024-01-02T03:04:05Z')"),
+        "import/import implicitdict.validation + validate_native": lambda: _python(
+            "from implicitdict import ImplicitDict\n"
+            "from implicitdict.validation import validate_native\n"
+            "class Data(ImplicitDict):\n"
+            "    foo: str\n"
+            "validate_native({'foo': 'bar'}, Data)"),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
+    print()
+    print("Slowest imports under `import implicitdict` (cumulative, -X importtime):")
+    for name, us in sorted(import_times("implicitdict"), key=lambda t: -t[1])[:10]:
+        print(f"  {name:58s} {us:12d} us")
@@ -0,0 +1,40 @@
+"""Measure the cost of per-type instrumentation counters on parsing, while disabled and while enabled."""
+
+from implicitdict import ImplicitDict
+from implicitdict import instrumentation
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent_json, FlatRecord, flat_json
+
+
+def _enabled(fn):
+    def wrapper():
+        instrumentation.enable()
+        try:
+            fn()
+        finally:
+            instrumentation.disable()
+    return wrapper
+
+
+def cases() -> BenchmarkCases:
+    intent_source = operational_intent_json(n_volumes=5)
+    flat_source = flat_json()
+
+    def parse_intent():
+        ImplicitDict.parse(intent_source, OperationalIntent)
+
+    def parse_flat():
+        for _ in range(100):
+            ImplicitDict.parse(flat_source, FlatRecord)
+
+    return {
+        "instrumentation/operational intent: disabled": parse_intent,
+        "instrumentation/operational intent: enabled": _enabled(parse_intent),
+        "instrumentation/flat x100: disabled": parse_flat,
+        "instrumentation/flat x100: enabled": _enabled(parse_flat),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
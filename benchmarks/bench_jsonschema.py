@@ -0,0 +1,73 @@
+"""Benchmark JSON Schema generation and serving.
+
+Compares cached, AST-based field docstring extraction against per-class regex scanning during generation, and serving a
+cached bundled schema against re-serializing the schema repository on every request.
+"""
+
+import inspect
+import json
+import re
+from typing import Dict, Type
+
+import implicitdict.jsonschema
+from implicitdict.jsonschema import make_bundled_json_schema, make_json_schema, SchemaVars
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent
+
+
+def _resolver(t: Type) -> SchemaVars:
+    return SchemaVars(name=t.__module__ + t.__qualname__, path_to=lambda t_dest, t_src: "#/$defs/" + t_dest.__qualname__)
+
+
+def _regex_field_docs_for(t: Type) -> Dict[str, str]:
+    """Field docstring extraction as performed before AST-based extraction was introduced."""
+    result = {}
+    src = inspect.getsource(t)
+    doc_pattern = r"\n([ \t]+)([_a-zA-Z][_a-zA-Z0-9]*)(?:: [^\n]+)?\n\1(?:\"\"\"|''')((?:.|\s)*?)(?:\"\"\"|''')"
+    for m in re.finditer(doc_pattern, src):
+        indent = m.group(1)
+        lines = m.group(3).split("\n")
+        for i in range(1, len(lines)):
+            if lines[i].startswith(indent):
+                lines[i] = lines[i][len(indent):]
+        while not lines[-1]:
+            lines = lines[0:-1]
+        result[m.group(2)] = "\n".join(lines)
+    return result
+
+
+def _generate():
+    make_json_schema(OperationalIntent, _resolver, {})
+
+
+def _generate_cold():
+    implicitdict.jsonschema._field_docs_by_type.clear()
+    implicitdict.jsonschema._field_docs_by_module.clear()
+    _generate()
+
+
+def _generate_with_regex():
+    field_docs_for = implicitdict.jsonschema._field_docs_for
+    implicitdict.jsonschema._field_docs_for = _regex_field_docs_for
+    try:
+        _generate()
+    finally:
+        implicitdict.jsonschema._field_docs_for = field_docs_for
+
+
+def cases() -> BenchmarkCases:
+    repository = {}
+    make_json_schema(OperationalIntent, _resolver, repository)
+
+    return {
+        "jsonschema/generate: regex docstrings": _generate_with_regex,
+        "jsonschema/generate: AST docstrings, cold caches": _generate_cold,
+        "jsonschema/generate: AST docstrings, warm caches": _generate,
+        "jsonschema/serve: json.dumps(repository)": lambda: json.dumps(repository).encode("utf-8"),
+        "jsonschema/serve: make_bundled_json_schema().content": lambda: make_bundled_json_schema(OperationalIntent, _resolver).content,
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
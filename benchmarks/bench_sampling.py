@@ -0,0 +1,45 @@
+"""Measure the hot-path overhead of SamplingValidator on parsing and serialization."""
+
+from implicitdict import ImplicitDict
+from implicitdict.sampling import SamplingValidator
+from implicitdict.serialization import dumps
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent_json
+
+
+def _with_sampler(fn):
+    def wrapper():
+        with SamplingValidator(sample_every=1000, max_validations_per_second=10):
+            for _ in range(100):
+                fn()
+    return wrapper
+
+
+def _without_sampler(fn):
+    def wrapper():
+        for _ in range(100):
+            fn()
+    return wrapper
+
+
+def cases() -> BenchmarkCases:
+    source = operational_intent_json(n_volumes=5)
+    intent = ImplicitDict.parse(source, OperationalIntent)
+
+    def parse():
+        ImplicitDict.parse(source, OperationalIntent)
+
+    def serialize():
+        dumps(intent)
+
+    return {
+        "sampling/parse x100: no sampler": _without_sampler(parse),
+        "sampling/parse x100: 1 in 1000 sampled": _with_sampler(parse),
+        "sampling/dumps x100: no sampler": _without_sampler(serialize),
+        "sampling/dumps x100: 1 in 1000 sampled": _with_sampler(serialize),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,41 @@
+"""Compare loading JSON Schemas from SchemaCache against generating them in a fresh process."""
+
+import tempfile
+
+import implicitdict.jsonschema
+import implicitdict.schema_cache
+from implicitdict.jsonschema import make_json_schema
+from implicitdict.schema_cache import SchemaCache
+
+from _common import BenchmarkCases, run_cases
+from bench_jsonschema import _resolver
+from models import OperationalIntent
+
+
+def _clear_process_caches():
+    """Reset the caches which would be empty at process startup."""
+    implicitdict.jsonschema._field_docs_by_type.clear()
+    implicitdict.jsonschema._field_docs_by_module.clear()
+    implicitdict.schema_cache._source_hashes.clear()
+
+
+def cases() -> BenchmarkCases:
+    cache = SchemaCache(tempfile.mkdtemp())
+    cache.make_json_schema(OperationalIntent, _resolver, {})
+
+    def generate():
+        _clear_process_caches()
+        make_json_schema(OperationalIntent, _resolver, {})
+
+    def load():
+        _clear_process_caches()
+        cache.make_json_schema(OperationalIntent, _resolver, {})
+
+    return {
+        "schema_cache/startup: make_json_schema": generate,
+        "schema_cache/startup: SchemaCache, fresh entries": load,
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,33 @@
+"""Compare serial and parallel JSON Schema generation for many ImplicitDict types."""
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from implicitdict.jsonschema import make_json_schema, make_json_schemas
+
+from _common import BenchmarkCases, run_cases
+from bench_jsonschema import _resolver
+import synthetic_models
+
+
+def cases() -> BenchmarkCases:
+    thread_pool = ThreadPoolExecutor(4)
+    process_pool = ProcessPoolExecutor(4)
+    atexit.register(process_pool.shutdown)
+    n = synthetic_models.N_TYPES
+
+    def serial():
+        repository = {}
+        for t in synthetic_models.TYPES:
+            make_json_schema(t, _resolver, repository)
+
+    return {
+        f"schema_generation/{n} types: make_json_schema": serial,
+        f"schema_generation/{n} types: make_json_schemas": lambda: make_json_schemas(synthetic_models, _resolver, {}),
+        f"schema_generation/{n} types: make_json_schemas, 4 threads": lambda: make_json_schemas(synthetic_models, _resolver, {}, executor=thread_pool),
+        f"schema_generation/{n} types: make_json_schemas, 4 processes": lambda: make_json_schemas(synthetic_models, _resolver, {}, executor=process_pool),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
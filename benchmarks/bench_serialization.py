@@ -0,0 +1,32 @@
+"""Compare implicitdict.serialization against json.dumps."""
+
+import json
+
+from implicitdict.serialization import dumps, iter_json, to_json_bytes
+
+from _common import BenchmarkCases, run_cases
+from models import operational_intent
+
+
+def cases() -> BenchmarkCases:
+    intent = operational_intent(n_volumes=20)
+    intents = [operational_intent(n_volumes=5) for _ in range(100)]
+
+    def consume(chunks):
+        for _ in chunks:
+            pass
+
+    return {
+        "serialization/single: json.dumps": lambda: json.dumps(intent),
+        "serialization/single: dumps": lambda: dumps(intent),
+        "serialization/single: json.dumps().encode()": lambda: json.dumps(intent).encode("utf-8"),
+        "serialization/single: to_json_bytes": lambda: to_json_bytes(intent),
+        "serialization/single: iter_json": lambda: consume(iter_json(intent)),
+        "serialization/list: json.dumps": lambda: json.dumps(intents),
+        "serialization/list: dumps": lambda: dumps(intents),
+        "serialization/list: iter_json": lambda: consume(iter_json(intents)),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
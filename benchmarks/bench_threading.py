@@ -0,0 +1,48 @@
+"""Measure multi-threaded parse throughput, which scales with cores only on free-threaded Python (e.g., 3.13t)."""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+
+from implicitdict import ImplicitDict
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent_json
+
+N_PARSES = 48
+"""Number of objects parsed in each iteration, divided evenly among the threads."""
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def cases() -> BenchmarkCases:
+    source = operational_intent_json(n_volumes=2)
+
+    def parse(n: int):
+        for _ in range(n):
+            ImplicitDict.parse(source, OperationalIntent)
+
+    def threaded(n_threads: int):
+        executor = ThreadPoolExecutor(max_workers=n_threads)
+
+        def run():
+            for future in [executor.submit(parse, N_PARSES // n_threads) for _ in range(n_threads)]:
+                future.result()
+        return run
+
+    return {f"threading/parse x{N_PARSES} across {n} thread(s)": threaded(n) for n in THREAD_COUNTS}
+
+
+if __name__ == "__main__":
+    print(f"GIL enabled: {_gil_enabled()}; CPUs: {os.cpu_count()}")
+    results = run_cases(cases())
+    print()
+    single = results[f"threading/parse x{N_PARSES} across 1 thread(s)"]
+    for n in THREAD_COUNTS:
+        duration = results[f"threading/parse x{N_PARSES} across {n} thread(s)"]
+        print(f"{n} thread(s): {N_PARSES / duration:10.0f} objects/s ({single / duration:.2f}x single-threaded)")
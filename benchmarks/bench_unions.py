@@ -0,0 +1,85 @@
+"""Compare parsing Union fields (with and without a discriminator) against the hand-rolled approach of trying each type."""
+
+from typing import List, Literal, Union
+
+from implicitdict import ImplicitDict
+
+from _common import BenchmarkCases, run_cases
+
+N_ALTERNATIVES = 20
+
+
+class _Tagged(ImplicitDict):
+    __discriminator__ = "kind"
+
+
+def _alternative(i: int) -> type:
+    annotations = {"kind": Literal[f"kind{i}"], "name": str, "values": List[float]}
+    return type(f"Alternative{i}", (_Tagged,), {"__annotations__": annotations, "kind": f"kind{i}", "__module__": __name__})
+
+
+def _untagged_alternative(i: int) -> type:
+    annotations = {"name": str, "values": List[float], f"field{i}": str}
+    return type(f"UntaggedAlternative{i}", (ImplicitDict,), {"__annotations__": annotations, "__module__": __name__})
+
+
+ALTERNATIVES = [_alternative(i) for i in range(N_ALTERNATIVES)]
+UNTAGGED_ALTERNATIVES = [_untagged_alternative(i) for i in range(N_ALTERNATIVES)]
+
+AnyAlternative = Union[tuple(ALTERNATIVES)]
+AnyUntaggedAlternative = Union[tuple(UNTAGGED_ALTERNATIVES)]
+
+
+class Tagged(ImplicitDict):
+    items: List[AnyAlternative]
+
+
+class Untagged(ImplicitDict):
+    items: List[AnyUntaggedAlternative]
+
+
+class Untyped(ImplicitDict):
+    items: List[dict]
+
+
+def _try_each(value: dict, alternatives: List[type]) -> ImplicitDict:
+    """Hand-rolled dispatch: parse value as each alternative in turn until one succeeds."""
+    for t in alternatives:
+        try:
+            return ImplicitDict.parse(value, t)
+        except ValueError:
+            pass
+    raise ValueError("Value does not match any alternative")
+
+
+def cases() -> BenchmarkCases:
+    # Values spread evenly across the alternatives, so trial parsing fails N_ALTERNATIVES / 2 times per value on average
+    source = {"items": [{"kind": f"kind{i % N_ALTERNATIVES}", "name": "item", "values": [1.0, 2.0]} for i in range(100)]}
+
+    def tagged():
+        ImplicitDict.parse(source, Tagged)
+
+    def try_each():
+        parsed = ImplicitDict.parse(source, Untyped)
+        parsed.items = [_try_each(item, ALTERNATIVES) for item in parsed["items"]]
+
+    # Without a discriminator, each alternative is identified by a distinct required field
+    untagged_source = {"items": [{"name": "item", "values": [1.0, 2.0], f"field{i % N_ALTERNATIVES}": "x"} for i in range(100)]}
+
+    def untagged():
+        ImplicitDict.parse(untagged_source, Untagged)
+
+    def untagged_try_each():
+        parsed = ImplicitDict.parse(untagged_source, Untyped)
+        parsed.items = [_try_each(item, UNTAGGED_ALTERNATIVES) for item in parsed["items"]]
+
+    return {
+        f"unions/100 items of {N_ALTERNATIVES} alternatives: discriminator dispatch": tagged,
+        f"unions/100 items of {N_ALTERNATIVES} alternatives: try each type (baseline)": try_each,
+        f"unions/100 items of {N_ALTERNATIVES} untagged alternatives: narrowed by fields": untagged,
+        f"unions/100 items of {N_ALTERNATIVES} untagged alternatives: try each type (baseline)": untagged_try_each,
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,36 @@
+"""Compare validation approaches: uncached jsonschema.validate, cached jsonschema validators, native checks, and parsing."""
+
+import jsonschema
+
+from implicitdict import ImplicitDict
+from implicitdict.validation import _compile_validator, _schema_vars, validate, validate_native
+from implicitdict.jsonschema import make_json_schema
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent_json
+
+
+def cases() -> BenchmarkCases:
+    payload = operational_intent_json(n_volumes=5)
+    intent = OperationalIntent(payload)
+
+    repository = {}
+    make_json_schema(OperationalIntent, _schema_vars, repository)
+    schema = repository[_schema_vars(OperationalIntent).name]
+
+    def uncached():
+        resolver = jsonschema.RefResolver.from_schema(schema, store=repository)
+        jsonschema.validate(payload, schema, cls=jsonschema.Draft202012Validator, resolver=resolver)
+
+    return {
+        "validation/dict: jsonschema.validate": uncached,
+        "validation/dict: compile validator per call": lambda: _compile_validator(OperationalIntent).validate(payload),
+        "validation/dict: validate": lambda: validate(payload, OperationalIntent),
+        "validation/ImplicitDict: validate": lambda: validate(intent, OperationalIntent),
+        "validation/dict: validate_native": lambda: validate_native(payload, OperationalIntent),
+        "validation/dict: ImplicitDict.parse": lambda: ImplicitDict.parse(payload, OperationalIntent),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
@@ -0,0 +1,66 @@
+"""Measure when field metadata is computed: at subclass definition, on first use, or via warmup."""
+
+import itertools
+import time
+from typing import List, Optional
+
+from implicitdict import ImplicitDict, warmup
+
+from _common import BenchmarkCases, run_cases
+from models import OperationalIntent, operational_intent_json
+
+N_FIELDS = 30
+
+
+_defined = itertools.count()
+
+
+def _define_type(forward_reference: bool) -> type:
+    """Define a new type; with forward_reference, its children refer to itself by a name that is not yet defined."""
+    name = f"Generated{next(_defined)}"
+    annotations = {f"field{i}": Optional[int] for i in range(N_FIELDS)}
+    # Since the name is not resolvable when the type is defined, its metadata is deferred until first use
+    annotations["children"] = Optional[List[name]] if forward_reference else Optional[List[int]]
+    return type(name, (ImplicitDict,), {"__annotations__": annotations, "__module__": __name__})
+
+
+def first_use_latency(forward_reference: bool, warm: bool, n: int = 200):
+    """Average duration of defining a type, (optionally) warming it up, and then constructing its first instance."""
+    source = {f"field{i}": i for i in range(N_FIELDS)}
+    define = warming = first_use = 0.0
+    for _ in range(n):
+        t0 = time.perf_counter()
+        t = _define_type(forward_reference)
+        t1 = time.perf_counter()
+        # The forward reference becomes resolvable once the rest of the (simulated) module has been defined
+        globals()[t.__name__] = t
+        if warm:
+            warmup(t)
+        t2 = time.perf_counter()
+        t(**source)
+        t3 = time.perf_counter()
+        define += t1 - t0
+        warming += t2 - t1
+        first_use += t3 - t2
+    return define / n, warming / n, first_use / n
+
+
+def cases() -> BenchmarkCases:
+    intent_source = operational_intent_json()
+    return {
+        "warmup/define type (metadata computed at definition)": lambda: _define_type(False),
+        "warmup/define type (forward reference; metadata deferred)": lambda: _define_type(True),
+        "warmup/parse operational intent (cached type hints)": lambda: ImplicitDict.parse(intent_source, OperationalIntent),
+    }
+
+
+if __name__ == "__main__":
+    run_cases(cases())
+    print()
+    for label, forward_reference, warm in (
+        ("metadata computed at definition", False, False),
+        ("metadata deferred to first use", True, False),
+        ("metadata deferred, then warmup", True, True),
+    ):
+        define, warming, first_use = first_use_latency(forward_reference, warm)
+        print(f"{label:40s} define {define * 1e6:8.1f} us, warmup {warming * 1e6:8.1f} us, first instance {first_use * 1e6:8.1f} us")
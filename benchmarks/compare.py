@@ -0,0 +1,62 @@
+"""Compare benchmark results (from run.py) against a baseline and flag regressions.
+
+Usage:
+    python compare.py baseline.json results.json [--threshold 0.1]
+
+Exits with status 1 if any case is slower than its baseline by more than the threshold fraction.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+
+def load_results(path: str) -> Dict[str, float]:
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float], threshold: float) -> Tuple[List[str], List[str]]:
+    """Print a comparison of the cases in current against baseline.
+
+    Returns:
+        * Names of regressed cases
+        * Names of improved cases
+    """
+    regressions = []
+    improvements = []
+    for name in sorted(current):
+        if name not in baseline:
+            print(f"  {name:60s} {current[name] * 1e6:12.2f} us  (new)")
+            continue
+        ratio = current[name] / baseline[name]
+        if ratio > 1 + threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = "improved"
+            improvements.append(name)
+        else:
+            flag = ""
+        print(f"  {name:60s} {baseline[name] * 1e6:12.2f} us -> {current[name] * 1e6:12.2f} us  {ratio:6.2f}x  {flag}")
+    for name in sorted(set(baseline) - set(current)):
+        print(f"  {name:60s} (missing from current results)")
+    return regressions, improvements
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Flag benchmark regressions against a baseline")
+    parser.add_argument("baseline", help="Baseline results JSON file from run.py")
+    parser.add_argument("current", help="Current results JSON file from run.py")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Fraction by which a case may be slower than its baseline before it is flagged")
+    args = parser.parse_args()
+
+    regressions, improvements = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(f"{len(regressions)} regression(s), {len(improvements)} improvement(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
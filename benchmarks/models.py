@@ -0,0 +1,266 @@
+"""ImplicitDict models for benchmarking.
+
+The main model is realistic (loosely based on ASTM F3548-21 operational intents).  The remaining models each exaggerate
+one shape of data: flat, deep, wide, list-heavy, container-heavy, and datetime-heavy.
+"""
+
+from enum import Enum
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+from implicitdict import ImplicitDict, StringBasedDateTime, StringBasedTimeDelta
+
+
+class AltitudeReference(str, Enum):
+    W84 = "W84"
+
+
+class LatLngPoint(ImplicitDict):
+    lat: float
+    lng: float
+
+
+class Radius(ImplicitDict):
+    value: float
+    units: str = "M"
+
+
+class Altitude(ImplicitDict):
+    value: float
+    reference: AltitudeReference
+    units: str = "M"
+
+
+class Polygon(ImplicitDict):
+    vertices: List[LatLngPoint]
+
+
+class Circle(ImplicitDict):
+    center: LatLngPoint
+    radius: Radius
+
+
+class Volume3D(ImplicitDict):
+    outline_circle: Optional[Circle]
+    outline_polygon: Optional[Polygon]
+    altitude_lower: Optional[Altitude]
+    altitude_upper: Optional[Altitude]
+
+
+class Time(ImplicitDict):
+    value: StringBasedDateTime
+    format: str = "RFC3339"
+
+
+class Volume4D(ImplicitDict):
+    volume: Volume3D
+    """Spatial extent of the volume."""
+
+    time_start: Optional[Time]
+    """Beginning time of this volume.  Must be before time_end."""
+
+    time_end: Optional[Time]
+    """End time of this volume.  Must be after time_start."""
+
+
+class OperationalIntentState(str, Enum):
+    Accepted = "Accepted"
+    Activated = "Activated"
+    Nonconforming = "Nonconforming"
+    Contingent = "Contingent"
+
+
+class OperationalIntentReference(ImplicitDict):
+    id: str
+    """Identifier for an operational intent.
+
+    Generated by the DSS when the operational intent is created."""
+
+    manager: str
+    """Created by the DSS based on the creating client's ID (via access token)."""
+
+    uss_availability: str
+    """Availability of the USS which manages this operational intent."""
+
+    version: int
+    """Numeric version of this operational intent which increments upon each change."""
+
+    state: OperationalIntentState
+    ovn: Optional[str]
+    """Opaque version number of this operational intent."""
+
+    time_start: Time
+    time_end: Time
+    uss_base_url: str
+    """The base URL of a USS implementation that implements the parts of the USS-USS API."""
+
+    subscription_id: str
+
+
+class OperationalIntentDetails(ImplicitDict):
+    volumes: List[Volume4D]
+    off_nominal_volumes: List[Volume4D]
+    priority: int = 0
+
+
+class OperationalIntent(ImplicitDict):
+    reference: OperationalIntentReference
+    details: OperationalIntentDetails
+
+
+def _time(minute: int) -> dict:
+    return {"value": f"2024-01-01T{minute // 60 % 24:02d}:{minute % 60:02d}:00Z", "format": "RFC3339"}
+
+
+def volume4d_json(index: int, n_vertices: int = 8) -> dict:
+    return {
+        "volume": {
+            "outline_polygon": {
+                "vertices": [{"lat": 34.0 + 0.001 * v, "lng": -118.0 - 0.001 * (v + index)} for v in range(n_vertices)],
+            },
+            "altitude_lower": {"value": 10.0 * index, "reference": "W84", "units": "M"},
+            "altitude_upper": {"value": 10.0 * index + 100, "reference": "W84", "units": "M"},
+        },
+        "time_start": _time(index),
+        "time_end": _time(index + 10),
+    }
+
+
+def operational_intent_json(n_volumes: int = 10, n_vertices: int = 8) -> dict:
+    """Plain-JSON operational intent with the specified number of volumes, each with the specified number of vertices."""
+    return {
+        "reference": {
+            "id": "2f8343be-6482-4d1b-a474-16847e01af1e",
+            "manager": "uss1",
+            "uss_availability": "Normal",
+            "version": 3,
+            "state": "Accepted",
+            "ovn": "8d6c5f1e-2f43-4d1b-a474-16847e01af1e",
+            "time_start": _time(0),
+            "time_end": _time(n_volumes + 10),
+            "uss_base_url": "https://uss1.example.com/utm",
+            "subscription_id": "78ea3fe8-71c2-4f5c-9b44-9c02f5563c6f",
+        },
+        "details": {
+            "volumes": [volume4d_json(i, n_vertices) for i in range(n_volumes)],
+            "off_nominal_volumes": [],
+            "priority": 0,
+        },
+    }
+
+
+def operational_intent(n_volumes: int = 10, n_vertices: int = 8) -> OperationalIntent:
+    return ImplicitDict.parse(operational_intent_json(n_volumes, n_vertices), OperationalIntent)
+
+
+class FlatRecord(ImplicitDict):
+    id: str
+    name: str
+    count: int
+    ratio: float
+    enabled: bool
+    owner: Optional[str]
+    notes: Optional[str]
+    priority: int = 0
+
+
+def flat_json() -> dict:
+    return {"id": "a1b2", "name": "flat", "count": 3, "ratio": 0.5, "enabled": True, "owner": "uss1", "priority": 2}
+
+
+class DeepNode(ImplicitDict):
+    depth: int
+    child: Optional["DeepNode"]
+
+
+def deep_json(depth: int = 50) -> dict:
+    result = {"depth": depth}
+    for d in range(depth - 1, -1, -1):
+        result = {"depth": d, "child": result}
+    return result
+
+
+N_WIDE_FIELDS = 200
+
+WideRecord = type("WideRecord", (ImplicitDict,), {
+    "__annotations__": {f"field{i}": [str, int, float, Optional[str]][i % 4] for i in range(N_WIDE_FIELDS)},
+    "__module__": __name__,
+})
+
+
+def wide_json() -> dict:
+    values = ["value", 1, 1.5, None]
+    return {f"field{i}": values[i % 4] for i in range(N_WIDE_FIELDS)}
+
+
+class ListHeavyRecord(ImplicitDict):
+    values: List[float]
+    labels: List[str]
+    matrix: List[List[int]]
+    points: List[LatLngPoint]
+    index: Dict[str, List[int]]
+
+
+def list_heavy_json(n: int = 500) -> dict:
+    return {
+        "values": [0.5 * i for i in range(n)],
+        "labels": [f"label{i}" for i in range(n)],
+        "matrix": [[i, i + 1, i + 2] for i in range(n // 10)],
+        "points": [{"lat": 34.0 + 0.001 * i, "lng": -118.0} for i in range(n // 10)],
+        "index": {f"key{i}": list(range(10)) for i in range(n // 10)},
+    }
+
+
+class ContainerHeavyRecord(ImplicitDict):
+    coordinates: List[Tuple[float, float]]
+    samples: Tuple[int, ...]
+    tags: Set[str]
+    ids: FrozenSet[int]
+    points: Sequence[LatLngPoint]
+    ranges: Mapping[str, Tuple[int, int]]
+
+
+def container_heavy_json(n: int = 500) -> dict:
+    return {
+        "coordinates": [[34.0 + 0.001 * i, -118.0] for i in range(n // 5)],
+        "samples": list(range(n)),
+        "tags": [f"tag{i}" for i in range(n // 5)],
+        "ids": list(range(n)),
+        "points": [{"lat": 34.0 + 0.001 * i, "lng": -118.0} for i in range(n // 10)],
+        "ranges": {f"key{i}": [i, i + 10] for i in range(n // 10)},
+    }
+
+
+class TimedEvent(ImplicitDict):
+    start: StringBasedDateTime
+    end: StringBasedDateTime
+    duration: StringBasedTimeDelta
+    updated: Optional[StringBasedDateTime]
+
+
+class Timeline(ImplicitDict):
+    created: StringBasedDateTime
+    events: List[TimedEvent]
+
+
+def datetime_heavy_json(n: int = 100) -> dict:
+    return {
+        "created": "2024-01-01T00:00:00Z",
+        "events": [{
+            "start": f"2024-01-01T{i // 60 % 24:02d}:{i % 60:02d}:00Z",
+            "end": f"2024-01-01T{i // 60 % 24:02d}:{i % 60:02d}:30.5+01:00",
+            "duration": "30s",
+            "updated": "2024-01-02T03:04:05.123456Z",
+        } for i in range(n)],
+    }
+
+
+SHAPES = {
+    "flat": (FlatRecord, flat_json),
+    "deep": (DeepNode, deep_json),
+    "wide": (WideRecord, wide_json),
+    "list-heavy": (ListHeavyRecord, list_heavy_json),
+    "container-heavy": (ContainerHeavyRecord, container_heavy_json),
+    "datetime-heavy": (Timeline, datetime_heavy_json),
+    "operational-intent": (OperationalIntent, operational_intent_json),
+}
+"""Model type and function producing plain-JSON data for that type, by shape name."""
@@ -0,0 +1,59 @@
+"""Run all (or selected) benchmark cases and save the results to JSON.
+
+Usage:
+    PYTHONPATH=../src python run.py [-o results.json] [-k SUBSTRING] [bench_module ...]
+
+The saved results can be compared against a baseline with compare.py.
+"""
+
+import argparse
+from datetime import datetime, timezone
+import glob
+import importlib
+import json
+import os
+import platform
+import sys
+from typing import List
+
+from _common import BenchmarkCases, run_cases
+
+
+def collect_cases(modules: List[str], substring: str) -> BenchmarkCases:
+    result = {}
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for name, fn in module.cases().items():
+            if substring in name:
+                result[name] = fn
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run implicitdict benchmarks and save the results to JSON")
+    parser.add_argument("modules", nargs="*", help="Benchmark modules to run (default: all bench_*.py)")
+    parser.add_argument("-o", "--output", default="results.json", help="Path of the JSON results file to write")
+    parser.add_argument("-k", dest="substring", default="", help="Only run cases whose names contain this substring")
+    args = parser.parse_args()
+
+    modules = [m[:-3] if m.endswith(".py") else m for m in args.modules]
+    if not modules:
+        this_folder = os.path.dirname(os.path.abspath(__file__))
+        modules = sorted(os.path.basename(f)[:-3] for f in glob.glob(os.path.join(this_folder, "bench_*.py")))
+
+    results = run_cases(collect_cases(modules, args.substring))
+    with open(args.output, "w") as f:
+        json.dump({
+            "metadata": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": sys.version,
+                "platform": platform.platform(),
+            },
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+    print(f"Wrote {len(results)} results to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""Many interrelated ImplicitDict types, created programmatically but importable (and therefore picklable)."""
+
+from typing import List, Optional
+
+from implicitdict import ImplicitDict
+
+N_TYPES = 300
+
+TYPES = []
+for _i in range(N_TYPES):
+    _annotations = {"id": str, "count": int, "ratio": Optional[float], "tags": List[str]}
+    if TYPES:
+        _annotations["parent"] = Optional[TYPES[(_i - 1) // 2]]
+        _annotations["siblings"] = List[TYPES[-1]]
+    _t = type(f"Synthetic{_i}", (ImplicitDict,), {"__annotations__": _annotations, "__module__": __name__})
+    globals()[_t.__name__] = _t
+    TYPES.append(_t)
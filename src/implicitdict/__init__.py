@@ -1,22 +1,102 @@
-import inspect
-from dataclasses import dataclass
-import re
+import _thread
+import collections.abc
+import copyreg
+import enum
+import itertools
+import time
 
-import arrow
 import datetime
 from datetime import datetime as datetime_type
-from typing import get_args, get_origin, get_type_hints, Dict, Literal, \
-    Optional, Type, Union, Set, Tuple
+import types
+from types import ModuleType
+from typing import get_args, get_origin, get_type_hints, Callable, Dict, Generic, Iterable, List, Literal, \
+    Optional, Type, TypeVar, Union, Set, Tuple, TYPE_CHECKING
 
-import pytimeparse
+# arrow (which imports dateutil), pytimeparse, copy, and re are imported where they are first used rather than here so
+# that importing implicitdict stays fast for applications that never use them; see benchmarks/bench_import.py.
+if TYPE_CHECKING:
+    import arrow
 
 
 _DICT_FIELDS = set(dir({}))
+_GENERIC_FIELDS = set(dir(Generic))
 _KEY_FIELDS_INFO = '_fields_info'
+_KEY_DISCRIMINATOR = '__discriminator__'
+_KEY_GENERIC_ORIGIN = '__generic_origin__'
+_KEY_GENERIC_ARGS = '__generic_args__'
 _PARSING_ERRORS = (ValueError, TypeError)
 
+_CONCRETE_CONTAINERS = {
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Mapping: dict,
+    collections.abc.MutableMapping: dict,
+    collections.abc.Set: set,
+    collections.abc.MutableSet: set,
+}
+"""Container into which values are parsed for each abstract collection type (e.g., Sequence[int] values are parsed
+into lists)."""
+
+_parse_hooks: List[Callable[[Dict, Type], None]] = []
+"""Functions called with the source data and type after each successful ImplicitDict.parse or implicitdict.aio.parse
+(including nested types)."""
+
+
+class _TypeCounters(object):
+    """Instrumentation counters for one type; see implicitdict.instrumentation."""
+
+    __slots__ = ("parses", "parse_time", "max_parse_time", "constructions", "orig_bases_fallbacks", "untyped_fields", "errors")
+
+    def __init__(self):
+        self.parses = 0
+        self.parse_time = 0.0
+        self.max_parse_time = 0.0
+        self.constructions = 0
+        self.orig_bases_fallbacks = 0
+        self.untyped_fields = 0
+        self.errors = 0
+
+
+_type_counters: Optional[Dict[Type, _TypeCounters]] = None
+"""Instrumentation counters by type while instrumentation is enabled, or None while it is disabled."""
+
+
+def _counters_in(type_counters: Dict[Type, _TypeCounters], t: Type) -> _TypeCounters:
+    counters = type_counters.get(t)
+    if counters is None:
+        counters = type_counters.setdefault(t, _TypeCounters())
+    return counters
+
+
+def _finish_parse(source: Dict, parse_type: Type, type_counters: Optional[Dict[Type, _TypeCounters]], t0: float,
+                  succeeded: bool) -> None:
+    """Record the end of a parse of source into parse_type which started at t0.
+
+    Updates the instrumentation counters of parse_type (if type_counters is not None) and, if the parse succeeded,
+    calls the parse hooks.
+    """
+    if type_counters is not None:
+        elapsed = time.perf_counter() - t0
+        counters = _counters_in(type_counters, parse_type)
+        counters.parses += 1
+        counters.parse_time += elapsed
+        if elapsed > counters.max_parse_time:
+            counters.max_parse_time = elapsed
+        if not succeeded:
+            counters.errors += 1
+    if succeeded and _parse_hooks:
+        for hook in _parse_hooks:
+            hook(source, parse_type)
+
+
+def _record_untyped_field(parse_type: Type) -> None:
+    type_counters = _type_counters
+    if type_counters is not None:
+        _counters_in(type_counters, parse_type).untyped_fields += 1
+
 
 def _bubble_up_parse_error(child: Union[ValueError, TypeError], field: str) -> Union[ValueError, TypeError]:
+    import re
     location_regex = r'^At ([A-Za-z0-9_.[\]]*):((?:.|[\n\r])*)$'
     m = re.search(location_regex, str(child))
     if m:
@@ -77,6 +157,51 @@ class ImplicitDict(dict):
       print(y.d)
         >> foo
 
+    A field may hold one of several ImplicitDict types (a Union) when those types
+    declare a common discriminator field with __discriminator__, and each type
+    declares its value for that field with a Literal type hint (or default value):
+
+      class Circle(ImplicitDict):
+        __discriminator__ = 'kind'
+        kind: Literal['circle'] = 'circle'
+        radius: float
+
+      class Square(ImplicitDict):
+        __discriminator__ = 'kind'
+        kind: Literal['square'] = 'square'
+        side: float
+
+      class Drawing(ImplicitDict):
+        shape: Union[Circle, Square]
+
+    When parsing, the type of `shape` is selected according to its `kind`:
+
+      z: Drawing = ImplicitDict.parse({'shape': {'kind': 'square', 'side': 2}}, Drawing)
+      print(type(z.shape).__name__)
+        >> Square
+
+    Unions of ImplicitDict types without a discriminator are also supported; the
+    type is then selected according to which fields are present, and data which
+    could be parsed into more than one of the types is rejected as ambiguous.
+
+    Generic subclasses are specialized by subscripting them with the types of
+    their type variables:
+
+      T = TypeVar('T')
+
+      class Page(ImplicitDict, Generic[T]):
+        items: List[T]
+        cursor: Optional[str]
+
+      p = ImplicitDict.parse({'items': [{'a': 1, 'b': 2}]}, Page[MySubclass1])
+      print(type(p.items[0]).__name__)
+        >> MySubclass1
+
+    Each specialization (e.g., Page[MySubclass1]) is a subclass of the generic
+    class, created once and then reused, so it has its own field metadata and
+    JSON Schema.  Type variables that are never specified are parsed as their
+    bound, if any, or otherwise left as-is (like untyped fields).
+
     If __init__ is overridden, ImplicitDict.__init__ should be called with
     **kwargs.  For example:
 
@@ -91,23 +216,67 @@ class ImplicitDict(dict):
           super(ImplicitDict, self).__init__(**kwargs)
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if _KEY_GENERIC_ORIGIN in cls.__dict__:
+            # Specialization created by __class_getitem__, whose field metadata is computed once its type hints are
+            # complete
+            cls.__parameters__ = _type_vars_in(cls.__dict__[_KEY_GENERIC_ARGS])
+            return
+        if "__orig_bases__" not in cls.__dict__:
+            # Subclasses of generic ImplicitDicts remain generic in the type variables their bases have not specified,
+            # even without listing Generic among their bases
+            parameters = _type_vars_in(tuple(base for base in cls.__bases__ if issubclass(base, ImplicitDict)))
+            if parameters:
+                cls.__parameters__ = parameters
+        # Compute field metadata when the subclass is defined so that the first instance of each type doesn't incur it
+        try:
+            _get_fields(cls)
+        except NameError:
+            # Type hints include forward references to types not yet defined (including cls itself, which is not yet
+            # bound to its name).  The metadata will be computed on first use instead, which will raise the error then
+            # if it is still applicable.
+            pass
+
+    def __class_getitem__(cls, params):
+        if not isinstance(params, tuple):
+            params = (params,)
+        parameters = getattr(cls, "__parameters__", ())
+        if not parameters:
+            raise TypeError(f"{cls.__name__} is not a generic class")
+        if len(params) != len(parameters):
+            raise TypeError(f"Too {'many' if len(params) > len(parameters) else 'few'} arguments for {cls.__name__}; expected {len(parameters)} but found {len(params)}")
+        if params == parameters:
+            return cls
+        substitutions = dict(zip(parameters, params))
+        generic_origin = cls.__dict__.get(_KEY_GENERIC_ORIGIN)
+        if generic_origin is not None:
+            # Specifying the remaining type variables of a partial specialization specializes the original generic class
+            params = tuple(_substitute_type_vars(arg, substitutions) for arg in cls.__dict__[_KEY_GENERIC_ARGS])
+            cls = generic_origin
+        return _specialization_of(cls, params)
+
     @classmethod
     def parse(cls, source: Dict, parse_type: Type):
-        if not isinstance(source, dict):
-            raise ValueError(f'Expected to find dictionary data to populate {parse_type.__name__} object but instead found {type(source).__name__} type')
-        kwargs = {}
-        hints = get_type_hints(parse_type)
-        for key, value in source.items():
-            if key in hints:
-                # This entry has an explicit type
-                try:
-                    kwargs[key] = _parse_value(value, hints[key])
-                except _PARSING_ERRORS as e:
-                    raise _bubble_up_parse_error(e, key)
-            else:
-                # This entry's type isn't specified
-                kwargs[key] = value
-        return parse_type(**kwargs)
+        type_counters = _type_counters
+        if type_counters is None and not _parse_hooks:
+            return _parse(source, parse_type)
+
+        t0 = time.perf_counter()
+        succeeded = False
+        try:
+            result = _parse(source, parse_type)
+            succeeded = True
+            return result
+        finally:
+            _finish_parse(source, parse_type, type_counters, t0, succeeded)
+
+    @classmethod
+    async def parse_async(cls, source: Dict, parse_type: Type, **kwargs):
+        """Equivalent of parse which does not block the event loop; see implicitdict.aio.parse for options."""
+        # Imported here so that asyncio is only loaded when asynchronous parsing is actually used
+        from .aio import parse
+        return await parse(source, parse_type, **kwargs)
 
     def __init__(self, previous_instance: Optional[dict]=None, **kwargs):
         ancestor_kwargs = {}
@@ -145,67 +314,209 @@ class ImplicitDict(dict):
 
         super(ImplicitDict, self).__init__(**ancestor_kwargs)
 
+        type_counters = _type_counters
+        if type_counters is not None:
+            _counters_in(type_counters, subtype).constructions += 1
+
     def __getattribute__(self, item):
         self_type = type(self)
-        if hasattr(self_type, _KEY_FIELDS_INFO):
-            fields_info_by_type: Dict[str, FieldsInfo] = getattr(self_type, _KEY_FIELDS_INFO)
-            self_type_name = _fullname(self_type)
-            if self_type_name in fields_info_by_type:
-                if item in fields_info_by_type[self_type_name].all_fields:
-                    try:
-                        return self[item]
-                    except KeyError:
-                        raise AttributeError
+        fields_info: Optional[FieldsInfo] = self_type.__dict__.get(_KEY_FIELDS_INFO)
+        if fields_info is not None:
+            if item in fields_info.all_fields:
+                try:
+                    return self[item]
+                except KeyError:
+                    raise AttributeError
         return super(ImplicitDict, self).__getattribute__(item)
 
     def __setattr__(self, key, value):
         self_type = type(self)
-        if hasattr(self_type, _KEY_FIELDS_INFO):
-            fields_info_by_type: Dict[str, FieldsInfo] = getattr(self_type, _KEY_FIELDS_INFO)
-            self_type_name = _fullname(self_type)
-            if self_type_name in fields_info_by_type:
-                if key in fields_info_by_type[self_type_name].all_fields:
-                    self[key] = value
-                    return
-                else:
-                    raise AttributeError('Attribute "{}" is not defined for "{}" object'.format(key, type(self).__name__))
+        fields_info: Optional[FieldsInfo] = self_type.__dict__.get(_KEY_FIELDS_INFO)
+        if fields_info is not None:
+            if key in fields_info.all_fields:
+                self[key] = value
+                return
+            else:
+                raise AttributeError('Attribute "{}" is not defined for "{}" object'.format(key, type(self).__name__))
         super(ImplicitDict, self).__setattr__(key, value)
 
     def has_field_with_value(self, field_name: str) -> bool:
         return field_name in self and self[field_name] is not None
 
+    def __copy__(self):
+        result = dict.__new__(type(self))
+        dict.update(result, self)
+        instance_dict = object.__getattribute__(self, '__dict__')
+        if instance_dict:
+            object.__getattribute__(result, '__dict__').update(instance_dict)
+        return result
+
+    def __deepcopy__(self, memo):
+        # Rather than reconstructing this object via the generic __reduce_ex__ machinery, create it directly and only
+        # copy the values which may be mutable.
+        result = dict.__new__(type(self))
+        memo[id(self)] = result
+        for key, value in dict.items(self):
+            dict.__setitem__(result, key, value if type(value) in _IMMUTABLE_TYPES else _deepcopy_value(value, memo))
+        instance_dict = object.__getattribute__(self, '__dict__')
+        if instance_dict:
+            import copy
+            object.__getattribute__(result, '__dict__').update(copy.deepcopy(instance_dict, memo))
+        return result
+
+
+def _parse(source: Dict, parse_type: Type):
+    if not isinstance(source, dict):
+        raise ValueError(f'Expected to find dictionary data to populate {parse_type.__name__} object but instead found {type(source).__name__} type')
+    kwargs = {}
+    hints = _get_hints(parse_type)
+    for key, value in source.items():
+        if key in hints:
+            # This entry has an explicit type
+            try:
+                kwargs[key] = _parse_value(value, hints[key])
+            except _PARSING_ERRORS as e:
+                raise _bubble_up_parse_error(e, key)
+        else:
+            # This entry's type isn't specified
+            kwargs[key] = value
+            if _type_counters is not None:
+                _record_untyped_field(parse_type)
+    return parse_type(**kwargs)
 
-def _parse_value(value, value_type: Type):
+
+def _generic_origin(value_type):
+    """Get the unsubscripted version of a generic type, like get_origin, except that abstract collection types are
+    replaced by the concrete containers into which their values are parsed (e.g., list for Sequence[int])."""
     generic_type = get_origin(value_type)
+    return _CONCRETE_CONTAINERS.get(generic_type, generic_type)
+
+
+def _tuple_item_types(arg_types: tuple) -> Optional[tuple]:
+    """Get the type of each item of a fixed-length Tuple with the specified type arguments, or None if the Tuple is
+    variable-length (e.g., Tuple[int, ...])."""
+    if len(arg_types) == 2 and arg_types[1] is Ellipsis:
+        return None
+    if arg_types == ((),):
+        # Tuple[()] on Python 3.10 and earlier
+        return ()
+    return arg_types
+
+
+class _ParseItems(object):
+    """Items nested in a container being parsed (see _parse_step), which must be parsed to complete the container."""
+
+    __slots__ = ("values", "types", "keys", "build")
+
+    values: Iterable
+    """Raw value of each item."""
+
+    types: Iterable
+    """Type into which each item is to be parsed, in the same order as values."""
+
+    keys: Optional[Iterable]
+    """Raw key of each item if the container is a dict, or None if the container's items are identified by index."""
+
+    build: Optional[Callable]
+    """Function to construct the container from a list of its parsed items, or None if that list is the result."""
+
+    def __init__(self, values: Iterable, types: Iterable, keys: Optional[Iterable], build: Optional[Callable]):
+        self.values = values
+        self.types = types
+        self.keys = keys
+        self.build = build
+
+    def location(self, i: int) -> str:
+        """Describe the location of the i-th item for a parsing error."""
+        return f"[{i}]" if self.keys is None else list(self.keys)[i]
+
+    def finish(self, parsed_items: list):
+        """Construct the parsed container from the parsed values of its items, in order."""
+        return parsed_items if self.build is None else self.build(parsed_items)
+
+
+class _ParseObject(object):
+    """ImplicitDict to be parsed from source data (see _parse_step)."""
+
+    __slots__ = ("source", "parse_type")
+
+    def __init__(self, source, parse_type: Type["ImplicitDict"]):
+        self.source = source
+        self.parse_type = parse_type
+
+
+class _ParseAs(object):
+    """Value to be parsed as a different type and then converted into the requested type (see _parse_step)."""
+
+    __slots__ = ("value", "value_type", "build")
+
+    def __init__(self, value, value_type: Type, build: Callable):
+        self.value = value
+        self.value_type = value_type
+        self.build = build
+
+    def finish(self, parsed_value):
+        return self.build(parsed_value)
+
+
+_PARSE_STEPS = frozenset((_ParseItems, _ParseObject, _ParseAs))
+"""Types returned by _parse_step when it has not fully parsed the value."""
+
+
+def _parse_step(value, value_type: Type):
+    """Perform the part of parsing value into value_type which does not involve parsing the values nested in it.
+
+    This is the single definition of how each type is parsed, shared by _parse_value and the other parsers (e.g.,
+    aio._SlicedParser) which differ only in how they parse nested values.
+
+    Returns:
+        * _ParseItems if value is a container whose items must each be parsed,
+        * _ParseObject if value is the source data of an ImplicitDict,
+        * _ParseAs if value must be parsed as another type and then converted, or
+        * the fully-parsed value otherwise.
+    """
+    generic_type = _generic_origin(value_type)
     if generic_type:
         # Type is generic
         arg_types = get_args(value_type)
         if generic_type is list:
             try:
-                value_list = [v for v in value]
-            except TypeError as e:
-                if "not iterable" in str(e):
-                    raise ValueError(f"Cannot parse non-iterable value '{value}' of type '{type(value).__name__}' into list type '{value_type}'")
-                raise
-            result = []
-            for i, v in enumerate(value_list):
-                try:
-                    result.append(_parse_value(v, arg_types[0]))
-                except _PARSING_ERRORS as e:
-                    raise _bubble_up_parse_error(e, f"[{i}]")
-            return result
+                items = iter(value)
+            except TypeError:
+                raise ValueError(f"Cannot parse non-iterable value '{value}' of type '{type(value).__name__}' into list type '{value_type}'")
+            return _ParseItems(items, itertools.repeat(arg_types[0]), None, None)
 
         elif generic_type is dict:
             # value is a dict of some kind
-            result = {}
-            for k, v in value.items():
-                parsed_key = k if arg_types[0] is str else _parse_value(k, arg_types[0])
-                try:
-                    parsed_value = _parse_value(v, arg_types[1])
-                except _PARSING_ERRORS as e:
-                    raise _bubble_up_parse_error(e, k)
-                result[parsed_key] = parsed_value
-            return result
+            keys = value.keys()
+            if arg_types[0] is str:
+                parsed_keys = keys
+            else:
+                parsed_keys = [_parse_value(k, arg_types[0]) for k in keys]
+            return _ParseItems(value.values(), itertools.repeat(arg_types[1]), keys,
+                               lambda parsed_values: dict(zip(parsed_keys, parsed_values)))
+
+        elif generic_type is tuple:
+            try:
+                items = iter(value)
+            except TypeError:
+                raise ValueError(f"Cannot parse non-iterable value '{value}' of type '{type(value).__name__}' into tuple type '{value_type}'")
+            item_types = _tuple_item_types(arg_types)
+            if item_types is None:
+                item_types = itertools.repeat(arg_types[0])
+            else:
+                if not isinstance(value, (list, tuple)):
+                    value = items = list(items)
+                if len(value) != len(item_types):
+                    raise ValueError(f"Expected {len(item_types)} items to populate tuple type '{value_type}' but found {len(value)}")
+            return _ParseItems(items, item_types, None, tuple)
+
+        elif generic_type is set or generic_type is frozenset:
+            try:
+                items = iter(value)
+            except TypeError:
+                raise ValueError(f"Cannot parse non-iterable value '{value}' of type '{type(value).__name__}' into {generic_type.__name__} type '{value_type}'")
+            return _ParseItems(items, itertools.repeat(arg_types[0]), None, generic_type)
 
         elif generic_type is Union and len(arg_types) == 2 and arg_types[1] is type(None):
             # Type is an Optional declaration
@@ -214,7 +525,20 @@ def _parse_value(value, value_type: Type):
                 # omitting the field's value
                 return None
             else:
-                return _parse_value(value, arg_types[0])
+                return _parse_step(value, arg_types[0])
+
+        elif generic_type is Union:
+            tagged_union = _tagged_union_for(value_type)
+            if tagged_union is not None:
+                if value is None and tagged_union.optional:
+                    return None
+                return _ParseObject(value, tagged_union.type_for(value))
+            untagged_union = _untagged_union_for(value_type)
+            if untagged_union is None:
+                raise ValueError(f'Automatic parsing of {value_type} type is not yet implemented')
+            if value is None and untagged_union.optional:
+                return None
+            return untagged_union.parse(value)
 
         elif generic_type is Literal and len(arg_types) == 1:
             # Type is a Literal (parsed value must match specified value)
@@ -225,87 +549,601 @@ def _parse_value(value, value_type: Type):
         else:
             raise ValueError(f'Automatic parsing of {value_type} type is not yet implemented')
 
+    elif isinstance(value_type, TypeVar):
+        # Type variable of a generic ImplicitDict that was not specialized
+        return value if value_type.__bound__ is None else _parse_step(value, value_type.__bound__)
+
     elif issubclass(value_type, ImplicitDict):
         # value is an ImplicitDict
-        return ImplicitDict.parse(value, value_type)
+        return _ParseObject(value, value_type)
 
     if hasattr(value_type, "__orig_bases__") and value_type.__orig_bases__:
-        return value_type(_parse_value(value, value_type.__orig_bases__[0]))
+        type_counters = _type_counters
+        if type_counters is not None:
+            _counters_in(type_counters, value_type).orig_bases_fallbacks += 1
+        return _ParseAs(value, value_type.__orig_bases__[0], value_type)
 
     else:
         # value is a non-generic type that is not an ImplicitDict
         return value_type(value) if value_type else value
 
 
-@dataclass
+def _parse_value(value, value_type: Type):
+    step = _parse_step(value, value_type)
+    return _finish_step(step) if type(step) in _PARSE_STEPS else step
+
+
+def _finish_step(step):
+    """Complete a parse begun by _parse_step which did not fully parse its value (i.e., returned one of _PARSE_STEPS)."""
+    step_type = type(step)
+    if step_type is _ParseItems:
+        result = []
+        for i, (v, item_type) in enumerate(zip(step.values, step.types)):
+            try:
+                # Most items are fully parsed by _parse_step, so _finish_step is only invoked for those which aren't
+                item = _parse_step(v, item_type)
+                result.append(_finish_step(item) if type(item) in _PARSE_STEPS else item)
+            except _PARSING_ERRORS as e:
+                raise _bubble_up_parse_error(e, step.location(i))
+        return step.finish(result)
+    elif step_type is _ParseObject:
+        return ImplicitDict.parse(step.source, step.parse_type)
+    else:
+        return step.finish(_parse_value(step.value, step.value_type))
+
+
+class _TaggedUnion(object):
+    """Dispatch table for a Union of ImplicitDict types which declare a common discriminator field."""
+
+    discriminator: str
+    """Name of the field whose value identifies the type of the data."""
+
+    types_by_tag: Dict[str, Type["ImplicitDict"]]
+    """Type in the Union for each discriminator value."""
+
+    optional: bool
+    """True if the Union also includes None."""
+
+    def __init__(self, discriminator: str, types_by_tag: Dict[str, Type["ImplicitDict"]], optional: bool):
+        self.discriminator = discriminator
+        self.types_by_tag = types_by_tag
+        self.optional = optional
+
+    def type_for(self, value) -> Type["ImplicitDict"]:
+        """Select the type of the specified data according to its discriminator value."""
+        if not isinstance(value, dict):
+            names = ", ".join(t.__name__ for t in self.types_by_tag.values())
+            raise ValueError(f'Expected to find dictionary data to populate one of {names} but instead found {type(value).__name__} type')
+        if self.discriminator not in value:
+            raise ValueError(f'Discriminator field "{self.discriminator}" not specified; expected one of {list(self.types_by_tag)}')
+        tag = value[self.discriminator]
+        result = self.types_by_tag.get(tag) if isinstance(tag, str) else None
+        if result is None:
+            raise ValueError(f'At {self.discriminator}: Value {tag!r} is not one of {list(self.types_by_tag)}')
+        return result
+
+
+_tagged_unions: Dict[object, Optional[_TaggedUnion]] = {}
+"""Dispatch table for each Union type evaluated, or None if that Union is not a tagged union."""
+
+
+def _tagged_union_for(union_type) -> Optional[_TaggedUnion]:
+    """Get the dispatch table for the specified Union type, or None if it is not a Union of ImplicitDict types which
+    declare a common discriminator field via __discriminator__.
+
+    Raises:
+        ValueError: The types in the Union declare different discriminators, or their discriminator values are missing
+            or ambiguous.
+    """
+    if union_type in _tagged_unions:
+        return _tagged_unions[union_type]
+    return _tagged_unions.setdefault(union_type, _make_tagged_union(union_type))
+
+
+def _make_tagged_union(union_type) -> Optional[_TaggedUnion]:
+    arg_types = get_args(union_type)
+    member_types = [t for t in arg_types if t is not type(None)]
+    if not all(isinstance(t, type) and issubclass(t, ImplicitDict) for t in member_types):
+        return None
+    discriminators = {getattr(t, _KEY_DISCRIMINATOR, None) for t in member_types}
+    if discriminators == {None}:
+        return None
+    if len(discriminators) > 1:
+        raise ValueError(f"Types in {union_type} must all declare the same {_KEY_DISCRIMINATOR}; found {discriminators}")
+    discriminator = discriminators.pop()
+
+    types_by_tag = {}
+    for t in member_types:
+        tag = _discriminator_value(t, discriminator)
+        if tag in types_by_tag:
+            raise ValueError(f'{types_by_tag[tag].__name__} and {t.__name__} in {union_type} both use discriminator value "{tag}"')
+        types_by_tag[tag] = t
+    return _TaggedUnion(discriminator, types_by_tag, type(None) in arg_types)
+
+
+def _discriminator_value(t: Type["ImplicitDict"], discriminator: str) -> str:
+    """Determine the discriminator value identifying data of the specified type, from its Literal type hint or default."""
+    hint = _get_hints(t).get(discriminator)
+    if get_origin(hint) is Literal and len(get_args(hint)) == 1:
+        result = get_args(hint)[0]
+    elif hasattr(t, discriminator):
+        result = getattr(t, discriminator)
+    else:
+        raise ValueError(f'{t.__name__} must declare its value for discriminator field "{discriminator}" as a Literal type hint or default value')
+    if isinstance(result, enum.Enum):
+        result = result.value
+    if not isinstance(result, str):
+        raise ValueError(f'Discriminator value for {t.__name__} must be a string; found {type(result).__name__}')
+    return result
+
+
+class _UntaggedUnion(object):
+    """Parser for a Union of ImplicitDict types without a discriminator.
+
+    The candidate types for a value are first narrowed according to the value's field names: a type is a candidate only
+    if the value specifies all of the type's required fields and, when any candidate type recognizes all of the value's
+    fields, only such types remain candidates.  Only the remaining candidates are then parsed.
+    """
+
+    _MAX_CACHED_SIGNATURES = 1024
+    """Maximum number of distinct sets of field names for which candidates are cached."""
+
+    types: Tuple[Type["ImplicitDict"], ...]
+    """Types in the Union."""
+
+    optional: bool
+    """True if the Union also includes None."""
+
+    def __init__(self, types: Tuple[Type["ImplicitDict"], ...], optional: bool):
+        self.types = types
+        self.optional = optional
+        self._signatures: List[Tuple[Type["ImplicitDict"], frozenset, frozenset]] = []
+        for t in types:
+            all_fields, optional_fields = _get_fields(t)
+            required = frozenset(f for f in all_fields if f not in optional_fields and not hasattr(t, f))
+            self._signatures.append((t, required, frozenset(all_fields)))
+        self._candidates_by_fields: Dict[frozenset, Tuple[Type["ImplicitDict"], ...]] = {}
+
+    def candidates_for(self, value: dict) -> Tuple[Type["ImplicitDict"], ...]:
+        """Types in the Union which may be able to represent the specified data, according to its field names."""
+        fields = frozenset(value)
+        result = self._candidates_by_fields.get(fields)
+        if result is None:
+            complete = [(t, known) for t, required, known in self._signatures if required <= fields]
+            recognized = [t for t, known in complete if fields <= known]
+            result = tuple(recognized) if recognized else tuple(t for t, _ in complete)
+            if len(self._candidates_by_fields) < self._MAX_CACHED_SIGNATURES:
+                self._candidates_by_fields[fields] = result
+        return result
+
+    def parse(self, value) -> "ImplicitDict":
+        """Parse the specified data into the only type in the Union which can represent it."""
+        if not isinstance(value, dict):
+            raise ValueError(f'Expected to find dictionary data to populate one of {self._names(self.types)} but instead found {type(value).__name__} type')
+        candidates = self.candidates_for(value)
+        if len(candidates) == 1:
+            return ImplicitDict.parse(value, candidates[0])
+        if not candidates:
+            missing = "; ".join(f"{t.__name__} requires {sorted(required - set(value))}" for t, required, _ in self._signatures)
+            raise ValueError(f"Fields {sorted(value)} do not match any of {self._names(self.types)} ({missing})")
+
+        results = []
+        errors = []
+        for t in candidates:
+            try:
+                results.append(ImplicitDict.parse(value, t))
+            except _PARSING_ERRORS as e:
+                errors.append(f"{t.__name__}: {e}")
+        if len(results) == 1:
+            return results[0]
+        if not results:
+            raise ValueError(f"Value does not match any of {self._names(candidates)} ({'; '.join(errors)})")
+        raise ValueError(f"Value is ambiguous between {self._names(type(r) for r in results)}; declare a {_KEY_DISCRIMINATOR} for these types to distinguish them")
+
+    @staticmethod
+    def _names(types: Iterable[Type]) -> str:
+        return ", ".join(t.__name__ for t in types)
+
+
+_untagged_unions: Dict[object, Optional[_UntaggedUnion]] = {}
+"""Parser for each Union type evaluated without a discriminator, or None if that Union is not of ImplicitDict types."""
+
+
+def _untagged_union_for(union_type) -> Optional[_UntaggedUnion]:
+    """Get the parser for the specified Union type, or None if it is not a Union of ImplicitDict types (and None)."""
+    result = _untagged_unions.get(union_type)
+    if result is None and union_type not in _untagged_unions:
+        arg_types = get_args(union_type)
+        member_types = tuple(t for t in arg_types if t is not type(None))
+        if all(isinstance(t, type) and issubclass(t, ImplicitDict) for t in member_types):
+            result = _UntaggedUnion(member_types, type(None) in arg_types)
+        result = _untagged_unions.setdefault(union_type, result)
+    return result
+
+
+def _deepcopy_value(value, memo: dict):
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+
+    value_id = id(value)
+    if value_id in memo:
+        return memo[value_id]
+
+    if value_type is list:
+        result = []
+        memo[value_id] = result
+        for v in value:
+            result.append(v if type(v) in _IMMUTABLE_TYPES else _deepcopy_value(v, memo))
+        return result
+
+    elif value_type is dict:
+        result = {}
+        memo[value_id] = result
+        for k, v in value.items():
+            result[k] = v if type(v) in _IMMUTABLE_TYPES else _deepcopy_value(v, memo)
+        return result
+
+    elif isinstance(value, ImplicitDict):
+        return type(value).__deepcopy__(value, memo)
+
+    else:
+        import copy
+        return copy.deepcopy(value, memo)
+
+
+_specializations: Dict[Tuple[Type[ImplicitDict], tuple], Type[ImplicitDict]] = {}
+"""Specialization of each generic ImplicitDict subclass for each tuple of type arguments."""
+
+_specializing: Dict[Tuple[Type[ImplicitDict], tuple], Type[ImplicitDict]] = {}
+"""Specializations whose field type hints are still being determined, so that recursive references resolve to them."""
+
+_specialization_lock = _thread.RLock()
+"""Serializes creating specializations so that each is created once and only published once complete.
+
+Looking up a specialization that has already been published never takes this lock.
+"""
+
+
+def _specialization_of(generic_type: Type[ImplicitDict], args: tuple) -> Type[ImplicitDict]:
+    key = (generic_type, args)
+    result = _specializations.get(key)
+    if result is None:
+        with _specialization_lock:
+            result = _specializations.get(key) or _specializing.get(key)
+            if result is None:
+                result = _make_specialization(generic_type, args)
+    return result
+
+
+def _make_specialization(generic_type: Type[ImplicitDict], args: tuple) -> Type[ImplicitDict]:
+    key = (generic_type, args)
+    # Type arguments are named in full so that the qualified names (and therefore JSON Schema names) of different
+    # specializations never collide
+    arg_names = ", ".join(_type_name(arg) for arg in args)
+    annotations = {}
+    result = _specialization_metaclass(type(generic_type))(f"{generic_type.__name__}[{arg_names}]", (generic_type,), {
+        "__module__": generic_type.__module__,
+        "__qualname__": f"{generic_type.__qualname__}[{arg_names}]",
+        "__doc__": generic_type.__doc__,
+        "__annotations__": annotations,
+        _KEY_GENERIC_ORIGIN: generic_type,
+        _KEY_GENERIC_ARGS: args,
+        "__reduce_ex__": _reduce_specialization,
+    })
+    _specializing[key] = result
+    try:
+        substitutions = dict(zip(generic_type.__parameters__, args))
+        for field, hint in _get_hints(generic_type).items():
+            annotations[field] = _substitute_type_vars(hint, substitutions)
+    finally:
+        del _specializing[key]
+    _get_fields(result)
+    _specializations[key] = result
+    return result
+
+
+class _SpecializationMeta(type):
+    """Metaclass of specializations, which pickle by their generic type and type arguments since they can't be
+    located by their names."""
+
+
+_specialization_metaclasses: Dict[type, type] = {type: _SpecializationMeta}
+
+
+def _specialization_metaclass(metaclass: type) -> type:
+    if issubclass(metaclass, _SpecializationMeta):
+        return metaclass
+    result = _specialization_metaclasses.get(metaclass)
+    if result is None:
+        # Generic type with a custom metaclass (e.g., ABCMeta)
+        result = _specialization_metaclasses.setdefault(
+            metaclass, type(metaclass)(f"_Specialization{metaclass.__name__}", (_SpecializationMeta, metaclass), {}))
+        copyreg.pickle(result, _reduce_specialization_type)
+    return result
+
+
+def _reduce_specialization_type(cls: type):
+    generic_type = cls.__dict__.get(_KEY_GENERIC_ORIGIN)
+    if generic_type is None:
+        # Named subclass of a specialization, which can be located by name as usual
+        return cls.__qualname__
+    return _specialization_of, (generic_type, cls.__dict__[_KEY_GENERIC_ARGS])
+
+
+copyreg.pickle(_SpecializationMeta, _reduce_specialization_type)
+
+
+def _reduce_specialization(self, protocol):
+    """Pickle instances of specializations, which can't be located by their names, by their generic type and type
+    arguments instead."""
+    cls = type(self)
+    if cls.__reduce__ is not object.__reduce__:
+        # E.g., frozen types, which define their own reconstruction
+        return cls.__reduce__(self)
+    generic_type = cls.__dict__.get(_KEY_GENERIC_ORIGIN)
+    if generic_type is None:
+        # Named subclass of a specialization, which can be located normally
+        constructor, args = copyreg.__newobj__, (cls,)
+    else:
+        constructor, args = _new_specialization, (generic_type, cls.__dict__[_KEY_GENERIC_ARGS])
+    # The state is assembled directly since fields (e.g., "items") may shadow the dict methods the default would use
+    state = object.__getattribute__(self, "__dict__") or None
+    return constructor, args, state, None, iter(dict.items(self))
+
+
+def _new_specialization(generic_type: Type[ImplicitDict], args: tuple) -> ImplicitDict:
+    cls = _specialization_of(generic_type, args)
+    return cls.__new__(cls)
+
+
+def _type_name(t) -> str:
+    if isinstance(t, type):
+        return _fullname(t)
+    if isinstance(t, TypeVar):
+        return t.__name__
+    return repr(t)
+
+
+def _type_vars_in(args: tuple) -> tuple:
+    """List the distinct type variables in the specified type arguments, in order of appearance."""
+    result = []
+    for arg in args:
+        if isinstance(arg, TypeVar):
+            found = (arg,)
+        elif isinstance(arg, type):
+            found = getattr(arg, "__parameters__", ())
+        else:
+            found = _type_vars_in(get_args(arg))
+        for type_var in found:
+            if type_var not in result:
+                result.append(type_var)
+    return tuple(result)
+
+
+def _substitute_type_vars(hint, substitutions: Dict[TypeVar, object]):
+    """Replace the type variables in the specified type hint according to substitutions."""
+    if isinstance(hint, TypeVar):
+        return substitutions.get(hint, hint)
+
+    if isinstance(hint, type):
+        parameters = getattr(hint, "__parameters__", ())
+        if parameters and issubclass(hint, ImplicitDict):
+            # Generic ImplicitDict (possibly partially specialized) used within another generic ImplicitDict
+            return hint[tuple(_substitute_type_vars(p, substitutions) for p in parameters)]
+        return hint
+
+    args = get_args(hint)
+    new_args = tuple(_substitute_type_vars(arg, substitutions) for arg in args)
+    if new_args == args:
+        return hint
+    generic_type = get_origin(hint)
+    if generic_type is Union or generic_type is getattr(types, "UnionType", Union):
+        return Union[new_args]
+    if hasattr(hint, "copy_with"):
+        # typing generics (e.g., List[T])
+        return hint.copy_with(new_args)
+    # Standard collection generics (e.g., list[T])
+    return types.GenericAlias(generic_type, new_args)
+
+
 class FieldsInfo(object):
     all_fields: Set[str]
     optional_fields: Set[str]
+    hints: Dict[str, Type]
+
+    def __init__(self, all_fields: Set[str], optional_fields: Set[str], hints: Dict[str, Type]):
+        self.all_fields = all_fields
+        self.optional_fields = optional_fields
+        self.hints = hints
+
+
+_publish_lock = _thread.allocate_lock()  # Equivalent to threading.Lock(), without importing threading
+"""Serializes publishing newly-determined FieldsInfo so all threads use the same FieldsInfo for each type.
+
+Looking up FieldsInfo that has already been published never takes this lock.
+"""
 
 
+def _get_hints(subtype: Type) -> Dict[str, Type]:
+    """Get the resolved type hints for the specified type (equivalent to get_type_hints, but cached).
+
+    The result must not be modified.
+    """
+    return _get_fields_info(subtype).hints
+
 
 def _get_fields(subtype: Type) -> Tuple[Set[str], Set[str]]:
     """Determine all fields and optional fields for the specified type.
 
-    When all & optional fields are determined for a type, the result is cached
-    as an entry in the _KEY_FIELDS_INFO attribute added to the type itself so
-    this evaluation only needs to be performed once per type.
-
     Returns:
         * Names of all fields for subtype
         * Names of all optional fields for subtype
     """
-    if not hasattr(subtype, _KEY_FIELDS_INFO):
-        setattr(subtype, _KEY_FIELDS_INFO, {})
-    fields_info_by_type: Dict[str, FieldsInfo] = getattr(subtype, _KEY_FIELDS_INFO)
-    subtype_name = _fullname(subtype)
-    if subtype_name not in fields_info_by_type:
-        # Enumerate fields defined for superclasses
-        all_fields = set()
-        optional_fields = set()
-        ancestors = inspect.getmro(subtype)
-        for ancestor in ancestors:
-            if issubclass(ancestor, ImplicitDict) and ancestor is not subtype and ancestor is not ImplicitDict:
-                ancestor_all_fields, ancestor_optional_fields = _get_fields(ancestor)
-                all_fields = all_fields.union(ancestor_all_fields)
-                optional_fields = optional_fields.union(ancestor_optional_fields)
-
-        # Enumerate all fields defined for the subclass
-        annotations = get_type_hints(subtype)
-        for key in annotations:
-            all_fields.add(key)
+    result = _get_fields_info(subtype)
+    return result.all_fields, result.optional_fields
 
-        attributes = set()
-        for key in dir(subtype):
-            if (
-                    key != _KEY_FIELDS_INFO
-                    and key not in _DICT_FIELDS
-                    and key[0:2] != '__'
-                    and not callable(getattr(subtype, key))
-                    and not isinstance(getattr(subtype, key), property)
-            ):
-                all_fields.add(key)
-                attributes.add(key)
-
-        # Identify which fields are Optional
-        for key, field_type in annotations.items():
-            generic_type = get_origin(field_type)
-            if generic_type is Optional:
-                optional_fields.add(key)
-            elif generic_type is Union:
-                generic_args = get_args(field_type)
-                if len(generic_args) == 2 and generic_args[1] is type(None):
-                    optional_fields.add(key)
-        for key in attributes:
-            if key not in annotations:
+
+def _get_fields_info(subtype: Type) -> FieldsInfo:
+    """Get the FieldsInfo for the specified type, determining it if necessary.
+
+    When the FieldsInfo for a type is determined, the result is cached in the _KEY_FIELDS_INFO attribute of the type
+    itself (not inherited by subclasses) so this evaluation only needs to be performed once per type.  Concurrent first
+    uses of a type (e.g., under free-threaded Python) may each determine the FieldsInfo, but only one result is
+    published and used by all of them.
+    """
+    result = subtype.__dict__.get(_KEY_FIELDS_INFO)
+    if result is not None:
+        return result
+
+    # Enumerate fields defined for superclasses
+    all_fields = set()
+    optional_fields = set()
+    ancestors = subtype.__mro__
+    for ancestor in ancestors:
+        if issubclass(ancestor, ImplicitDict) and ancestor is not subtype and ancestor is not ImplicitDict:
+            ancestor_all_fields, ancestor_optional_fields = _get_fields(ancestor)
+            all_fields = all_fields.union(ancestor_all_fields)
+            optional_fields = optional_fields.union(ancestor_optional_fields)
+
+    # Enumerate all fields defined for the subclass
+    annotations = get_type_hints(subtype)
+    for key in annotations:
+        all_fields.add(key)
+
+    attributes = set()
+    for key in dir(subtype):
+        if (
+                key != _KEY_FIELDS_INFO
+                and key not in _DICT_FIELDS
+                and key not in _GENERIC_FIELDS
+                and key[0:2] != '__'
+                and not callable(getattr(subtype, key))
+                and not isinstance(getattr(subtype, key), property)
+        ):
+            all_fields.add(key)
+            attributes.add(key)
+
+    # Identify which fields are Optional
+    for key, field_type in annotations.items():
+        generic_type = get_origin(field_type)
+        if generic_type is Optional:
+            optional_fields.add(key)
+        elif generic_type is Union:
+            if type(None) in get_args(field_type):
                 optional_fields.add(key)
+    for key in attributes:
+        if key not in annotations:
+            optional_fields.add(key)
+
+    result = FieldsInfo(
+        all_fields=all_fields,
+        optional_fields=optional_fields,
+        hints=annotations,
+    )
+    with _publish_lock:
+        published = subtype.__dict__.get(_KEY_FIELDS_INFO)
+        if published is not None:
+            return published
+        setattr(subtype, _KEY_FIELDS_INFO, result)
+    return result
+
+
+def _discover_types(module_or_types) -> List[Type[ImplicitDict]]:
+    if isinstance(module_or_types, type):
+        return [module_or_types]
+    if isinstance(module_or_types, ModuleType):
+        modules = [module_or_types]
+        if hasattr(module_or_types, "__path__"):
+            import importlib
+            import pkgutil
+            for submodule_info in pkgutil.walk_packages(module_or_types.__path__, module_or_types.__name__ + "."):
+                modules.append(importlib.import_module(submodule_info.name))
+        return [v for module in modules for v in vars(module).values()
+                if isinstance(v, type) and issubclass(v, ImplicitDict) and v is not ImplicitDict and v.__module__ == module.__name__]
+    result = []
+    for item in module_or_types:
+        result.extend(_discover_types(item))
+    return result
+
+
+def _referenced_types(value_type) -> List[Type]:
+    """List the ImplicitDict types referenced by the specified type hint, in order of appearance.
+
+    Used by _dependencies_of to find the types a field depends upon.
+    """
+    if get_origin(value_type):
+        return [t for arg_type in get_args(value_type) for t in _referenced_types(arg_type)]
+    if isinstance(value_type, TypeVar):
+        return _referenced_types(value_type.__bound__) if value_type.__bound__ is not None else []
+    if not isinstance(value_type, type):
+        return []
+    if issubclass(value_type, ImplicitDict):
+        return [value_type]
+    if getattr(value_type, "__orig_bases__", None):
+        # Subclasses of generic types (e.g., class SpecialList(List[MyImplicitDict])) are described by their base
+        return _referenced_types(value_type.__orig_bases__[0])
+    return []
+
+
+def _dependencies_of(
+        types: Iterable[Type[ImplicitDict]],
+        skip: Optional[Callable[[Type[ImplicitDict]], bool]] = None,
+) -> List[Type[ImplicitDict]]:
+    """List the specified ImplicitDict types and all ImplicitDict types referenced by their fields (recursively).
+
+    Types are listed once each, in the order a depth-first traversal of the fields of each type would first reach
+    them.  Used by warmup, jsonschema (make_json_schemas and bundles), and schema_cache to find the types whose schemas
+    a schema depends upon.
+
+    Args:
+        types: ImplicitDict types from which to start.
+        skip: If specified, types for which skip returns True are neither listed nor traversed.
+    """
+    result = []
+    visited = set()
+    pending = list(types)
+    pending.reverse()
+    while pending:
+        t = pending.pop()
+        if t in visited:
+            continue
+        visited.add(t)
+        if skip is not None and skip(t):
+            continue
+        result.append(t)
+        all_fields, _ = _get_fields(t)
+        hints = _get_hints(t)
+        dependencies = []
+        for field in all_fields:
+            if field in hints:
+                dependencies.extend(_referenced_types(hints[field]))
+            elif hasattr(t, field):
+                dependencies.extend(_referenced_types(type(getattr(t, field))))
+        dependencies.reverse()
+        pending.extend(dependencies)
+    return result
+
+
+def warmup(module_or_types: Union[ModuleType, Type[ImplicitDict], Iterable[Union[ModuleType, Type[ImplicitDict]]]]) -> List[Type[ImplicitDict]]:
+    """Compute the metadata of ImplicitDict types ahead of their first use (e.g., while a service is starting).
+
+    Field metadata is normally computed when each ImplicitDict subclass is defined, but it is deferred until first use
+    when the type hints of the subclass can't be resolved at that time (e.g., because they refer to types defined later
+    in the module).  Calling warmup once all types have been defined avoids that cost on first use of those types.
+
+    Args:
+        module_or_types: Module (including all its submodules, if a package), ImplicitDict subclass, or iterable of
+            these.  All ImplicitDict subclasses defined in the modules, and the ImplicitDict types referenced by their
+            fields, are warmed up.
 
-        fields_info_by_type[subtype_name] = FieldsInfo(
-            all_fields=all_fields,
-            optional_fields=optional_fields
-        )
-    result = fields_info_by_type[subtype_name]
-    return result.all_fields, result.optional_fields
+    Returns:
+        ImplicitDict types warmed up.
+
+    Raises:
+        NameError: The type hints of a type still can't be resolved.
+    """
+    return _dependencies_of(_discover_types(module_or_types))
 
 
 def _fullname(class_type: Type) -> str:
@@ -330,6 +1168,7 @@ class StringBasedTimeDelta(str):
             reformat: If true, override a provided string with a string representation of the parsed timedelta.
         """
         if isinstance(value, str):
+            import pytimeparse
             dt = datetime.timedelta(seconds=pytimeparse.parse(value))
             s = str(dt) if reformat else value
         elif isinstance(value, float) or isinstance(value, int):
@@ -351,7 +1190,7 @@ class StringBasedDateTime(str):
     datetime: datetime.datetime
     """Timezone-aware datetime matching the string value of this instance."""
 
-    def __new__(cls, value: Union[str, datetime_type, arrow.Arrow], reformat: bool = False):
+    def __new__(cls, value: Union[str, datetime_type, "arrow.Arrow"], reformat: bool = False):
         """Create a new StringBasedDateTime instance.
 
         Args:
@@ -359,6 +1198,7 @@ class StringBasedDateTime(str):
               is not specified, UTC will be assumed.
             reformat: If true, override a provided string with a string representation of the parsed datetime.
         """
+        import arrow
         t_arrow = arrow.get(value)
         if isinstance(value, str):
             s = t_arrow.isoformat() if reformat else value
@@ -371,3 +1211,15 @@ class StringBasedDateTime(str):
         str_value = str.__new__(cls, s)
         str_value.datetime = t_arrow.datetime
         return str_value
+
+
+_IMMUTABLE_TYPES = {str, int, float, bool, bytes, type(None), StringBasedDateTime, StringBasedTimeDelta}
+"""Types whose instances can be shared rather than copied when deep-copying ImplicitDicts."""
+
+
+def __getattr__(name: str):
+    # Functionality defined in submodules is imported on first access so that it does not slow down importing implicitdict
+    if name == "memory_usage":
+        from .memory import memory_usage
+        return memory_usage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,179 @@
+import asyncio
+from concurrent.futures import Executor
+import time
+from typing import get_args, AsyncIterator, Dict, Optional, Type, TypeVar, Union
+
+import implicitdict
+from . import ImplicitDict, _bubble_up_parse_error, _generic_origin, _get_hints, _parse_step, _parse_value, \
+    _PARSING_ERRORS, _ParseAs, _ParseItems, _ParseObject, _finish_parse, _parse_hooks, _record_untyped_field, \
+    _tagged_union_for
+from .serialization import DEFAULT_CHUNK_SIZE, iter_json
+
+
+DEFAULT_TIME_SLICE = 0.005
+"""Default maximum duration, in seconds, that parse may run before returning control to the event loop."""
+
+DEFAULT_OFFLOAD_THRESHOLD = 100000
+"""Default number of JSON values in a source at or above which parse hands off parsing to an executor, if provided."""
+
+T = TypeVar("T")
+
+
+async def iter_json_bytes(obj, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Serialize the specified ImplicitDict (or list of them, or other JSON-compatible value) to JSON asynchronously.
+
+    The JSON is produced as UTF-8-encoded chunks of approximately chunk_size bytes (see serialization.iter_json), and
+    control is returned to the event loop after each chunk so that serializing a large value does not block other tasks
+    for longer than it takes to produce one chunk.  Chunks are only produced as they are consumed, so a consumer that
+    awaits its destination between chunks (e.g., `write_json`) applies backpressure to the serialization.
+    """
+    for chunk in iter_json(obj, chunk_size):
+        yield chunk.encode("utf-8")
+        await asyncio.sleep(0)
+
+
+async def write_json(writer: asyncio.StreamWriter, obj, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Serialize the specified ImplicitDict (or list of them, or other JSON-compatible value) to a StreamWriter.
+
+    Each chunk is written and then the writer is drained, so serialization pauses whenever the writer's buffer is full.
+    """
+    async for chunk in iter_json_bytes(obj, chunk_size):
+        writer.write(chunk)
+        await writer.drain()
+
+
+async def parse(
+        source: Dict,
+        parse_type: Type[T],
+        time_slice: float = DEFAULT_TIME_SLICE,
+        executor: Optional[Executor] = None,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+) -> T:
+    """Parse the specified source data into the specified ImplicitDict type without blocking the event loop.
+
+    The result, and any error raised, is identical to `ImplicitDict.parse(source, parse_type)`.
+
+    Args:
+        source: Dictionary data (e.g., from json.loads) to parse.
+        parse_type: ImplicitDict subclass to parse the source into.
+        time_slice: Parsing is performed on the event loop in slices of at most approximately this many seconds, after
+            each of which control is returned to the event loop.
+        executor: If specified, sources containing at least offload_threshold JSON values are parsed synchronously in
+            this executor instead of on the event loop.  If the executor is a ProcessPoolExecutor, parse_type must be
+            picklable and the cost of pickling the source and result should be considered.
+        offload_threshold: Minimum number of JSON values (objects, arrays, and primitives, counted recursively) in
+            source for parsing to be performed in executor.
+    """
+    if executor is not None and _count_values(source, offload_threshold) >= offload_threshold:
+        return await asyncio.get_running_loop().run_in_executor(executor, ImplicitDict.parse, source, parse_type)
+    return await _SlicedParser(time_slice).parse(source, parse_type)
+
+
+def _count_values(source, limit: int) -> int:
+    """Count the JSON values in source, stopping early once limit is reached."""
+    count = 0
+    pending = [source]
+    while pending and count < limit:
+        value = pending.pop()
+        count += 1
+        if isinstance(value, dict):
+            pending.extend(dict.values(value))
+        elif isinstance(value, list):
+            pending.extend(value)
+    return count
+
+
+_CONTAINERS = frozenset((list, dict, tuple, set, frozenset))
+"""Generic origins (per _generic_origin) of the types parsed into containers."""
+
+
+def _descends(value_type) -> bool:
+    """Determine whether _SlicedParser.parse_value descends into values of the specified type."""
+    generic_type = _generic_origin(value_type)
+    if generic_type in _CONTAINERS:
+        return True
+    elif generic_type is Union:
+        arg_types = get_args(value_type)
+        if len(arg_types) == 2 and arg_types[1] is type(None):
+            return _descends(arg_types[0])
+        return _tagged_union_for(value_type) is not None
+    elif generic_type or not isinstance(value_type, type):
+        return False
+    elif issubclass(value_type, ImplicitDict):
+        return True
+    return bool(getattr(value_type, "__orig_bases__", None)) and _descends(value_type.__orig_bases__[0])
+
+
+class _SlicedParser(object):
+    """Equivalent of ImplicitDict.parse and _parse_value which periodically yields to the event loop.
+
+    Each value is parsed by _parse_step, exactly as _parse_value parses it, but the nested values of containers and
+    ImplicitDicts are parsed by this parser so that it can yield between them.  Values without nested containers or
+    ImplicitDicts (see _descends) are parsed synchronously by _parse_value.
+    """
+
+    def __init__(self, time_slice: float):
+        self._time_slice = time_slice
+        self._slice_start = time.perf_counter()
+
+    async def _checkpoint(self) -> None:
+        if time.perf_counter() - self._slice_start >= self._time_slice:
+            await asyncio.sleep(0)
+            self._slice_start = time.perf_counter()
+
+    async def parse(self, source: Dict, parse_type: Type):
+        type_counters = implicitdict._type_counters
+        if type_counters is None and not _parse_hooks:
+            return await self._parse(source, parse_type)
+
+        # Note that the recorded parse time includes the time other tasks run while parsing yields to the event loop
+        t0 = time.perf_counter()
+        succeeded = False
+        try:
+            result = await self._parse(source, parse_type)
+            succeeded = True
+            return result
+        finally:
+            _finish_parse(source, parse_type, type_counters, t0, succeeded)
+
+    async def _parse(self, source: Dict, parse_type: Type):
+        if not isinstance(source, dict):
+            raise ValueError(f'Expected to find dictionary data to populate {parse_type.__name__} object but instead found {type(source).__name__} type')
+        kwargs = {}
+        hints = _get_hints(parse_type)
+        for key, value in source.items():
+            if key in hints:
+                try:
+                    if _descends(hints[key]):
+                        kwargs[key] = await self.parse_value(value, hints[key])
+                    else:
+                        kwargs[key] = _parse_value(value, hints[key])
+                except _PARSING_ERRORS as e:
+                    raise _bubble_up_parse_error(e, key)
+            else:
+                kwargs[key] = value
+                _record_untyped_field(parse_type)
+            await self._checkpoint()
+        return parse_type(**kwargs)
+
+    async def parse_value(self, value, value_type: Type):
+        step = _parse_step(value, value_type)
+        step_type = type(step)
+        if step_type is _ParseItems:
+            result = []
+            descend_type = descend = None
+            for i, (v, item_type) in enumerate(zip(step.values, step.types)):
+                if item_type is not descend_type:
+                    descend_type = item_type
+                    descend = _descends(item_type)
+                try:
+                    result.append(await self.parse_value(v, item_type) if descend else _parse_value(v, item_type))
+                except _PARSING_ERRORS as e:
+                    raise _bubble_up_parse_error(e, step.location(i))
+                await self._checkpoint()
+            return step.finish(result)
+        elif step_type is _ParseObject:
+            return await self.parse(step.source, step.parse_type)
+        elif step_type is _ParseAs:
+            return step.finish(await self.parse_value(step.value, step.value_type))
+        return step
@@ -0,0 +1,429 @@
+"""Structural differences between ImplicitDicts, as JSON Patch (RFC 6902) or JSON Merge Patch (RFC 7396) documents."""
+
+from typing import Callable, Dict, List, Sequence, TypeVar, Union
+
+from . import ImplicitDict, _bubble_up_parse_error, _generic_origin, _get_fields, _get_hints, _parse_value, \
+    _PARSING_ERRORS
+from .evolution import _copy_instance_dict, _format_path, PathElement
+from .frozen import freeze, is_frozen
+
+
+T = TypeVar("T")
+
+Patch = Union[List[dict], dict]
+"""JSON Patch (list of operations) or JSON Merge Patch (object) document."""
+
+
+def diff(a, b) -> List[dict]:
+    """Determine the JSON Patch which transforms a into b.
+
+    Values are compared as the JSON they serialize to, so, e.g., a StringBasedDateTime is equal to the equivalent str
+    and a tuple is equal to the equivalent list.  Subtrees which are the same object in both a and b (as is the case
+    for every subtree not along the path of a change made with evolution.evolve_in or apply_patch) are skipped without
+    being inspected, so the cost of diffing two versions of a large tree is proportional to the size of the changes
+    rather than the size of the tree.
+
+    Lists are compared item by item, so inserting or removing an item other than at the end of a list produces a
+    "replace" operation for each subsequent item rather than a single "add" or "remove".  Tuples and sets which differ
+    are replaced in their entirety since their items can't be patched individually.
+
+    Args:
+        a: Original ImplicitDict (or other JSON-compatible value).
+        b: New ImplicitDict (or other JSON-compatible value).
+
+    Returns:
+        JSON Patch operations.  Values in the operations are those of b (not copies) and may need to be serialized
+        with implicitdict.serialization.
+    """
+    result = []
+    _diff(a, b, "", result)
+    return result
+
+
+def merge_diff(a, b):
+    """Determine the JSON Merge Patch which transforms a into b.
+
+    See `diff` regarding how values are compared.  In accordance with RFC 7396, lists which differ are replaced in
+    their entirety, and a None value in b is not distinguished from an omitted value.
+
+    Returns:
+        JSON Merge Patch document, which is an empty dict when a and b are equivalent.
+    """
+    if a is b:
+        return {}
+    if isinstance(a, dict) and isinstance(b, dict):
+        return _merge_diff(a, b)
+    return {} if _equal(a, b) else b
+
+
+def apply_patch(instance: T, patch: Patch) -> T:
+    """Produce a copy of an ImplicitDict instance with the specified JSON Patch or JSON Merge Patch applied.
+
+    Only the values added or replaced by the patch are parsed (and therefore validated) according to the type hints
+    of the locations they are placed; the rest of the instance is not re-parsed.  As with evolution.evolve_in, only
+    the ImplicitDicts, dicts, and lists along the paths of the changes are copied, and every other subtree is shared
+    with the original instance.  If the instance is frozen, the result is also frozen.
+
+    Args:
+        instance: ImplicitDict instance to patch.  It is not modified.
+        patch: JSON Patch (list of operations, as produced by `diff`) or JSON Merge Patch (dict, as produced by
+            `merge_diff`) to apply.
+
+    Returns:
+        New instance of the same type as `instance` with the patch applied.
+
+    Raises:
+        ValueError: The patch is malformed, refers to a location which does not exist, fails a "test" operation, or
+            would produce an invalid instance (e.g., by removing a required field or adding a value which can't be
+            parsed into the type of its location).
+    """
+    if not isinstance(instance, ImplicitDict):
+        raise ValueError(f"Only ImplicitDict instances can be patched; found {type(instance).__name__} instead")
+    if isinstance(patch, dict):
+        return _merge(instance, type(instance), patch, [])
+    result = instance
+    for i, operation in enumerate(patch):
+        try:
+            result = _apply_operation(result, operation)
+        except ValueError as e:
+            raise ValueError(f"In patch operation {i}: {e}")
+    return result
+
+
+def _pointer(path: str, key) -> str:
+    return path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _diff(a, b, path: str, result: List[dict]) -> None:
+    if a is b:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        shared = 0
+        for k, v in dict.items(a):
+            if k in b:
+                shared += 1
+                if v is not b[k]:
+                    _diff(v, b[k], _pointer(path, k), result)
+            else:
+                result.append({"op": "remove", "path": _pointer(path, k)})
+        if len(b) > shared:
+            for k, v in dict.items(b):
+                if k not in a:
+                    result.append({"op": "add", "path": _pointer(path, k), "value": v})
+    elif isinstance(a, list) and isinstance(b, list):
+        for i in range(min(len(a), len(b))):
+            if a[i] is not b[i]:
+                _diff(a[i], b[i], _pointer(path, i), result)
+        for i in range(len(a) - 1, len(b) - 1, -1):
+            result.append({"op": "remove", "path": _pointer(path, i)})
+        for i in range(len(a), len(b)):
+            result.append({"op": "add", "path": _pointer(path, i), "value": b[i]})
+    elif not _equal(a, b):
+        result.append({"op": "replace", "path": path, "value": b})
+
+
+def _merge_diff(a: dict, b: dict) -> dict:
+    result = {}
+    for k, v in dict.items(a):
+        if k not in b or b[k] is None:
+            if v is not None:
+                result[k] = None
+        elif b[k] is not v:
+            if isinstance(v, dict) and isinstance(b[k], dict):
+                child = _merge_diff(v, b[k])
+                if child:
+                    result[k] = child
+            elif not _equal(v, b[k]):
+                result[k] = b[k]
+    for k, v in dict.items(b):
+        if k not in a and v is not None:
+            result[k] = v
+    return result
+
+
+_COLLECTIONS = (list, tuple, set, frozenset)
+
+
+def _equal(a, b) -> bool:
+    """Determine whether a and b serialize to equivalent JSON."""
+    if a is b:
+        return True
+    if isinstance(a, dict):
+        return isinstance(b, dict) and len(a) == len(b) and all(k in b and _equal(v, b[k]) for k, v in dict.items(a))
+    if isinstance(a, (set, frozenset)) or isinstance(b, (set, frozenset)):
+        # Sets serialize to lists of their items in an arbitrary (or sorted) order
+        if not isinstance(a, _COLLECTIONS) or not isinstance(b, _COLLECTIONS) or len(a) != len(b):
+            return False
+        try:
+            return set(a) == set(b)
+        except TypeError:
+            return False
+    if isinstance(a, (list, tuple)):
+        return isinstance(b, (list, tuple)) and len(a) == len(b) and all(_equal(u, v) for u, v in zip(a, b))
+    if isinstance(a, bool) or isinstance(b, bool):
+        # JSON distinguishes true from 1
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(b, dict) or isinstance(b, _COLLECTIONS):
+        return False
+    return a == b
+
+
+# Patch application
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f'Could not interpret "{pointer}" as a JSON Pointer')
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer.split("/")[1:]]
+
+
+def _apply_operation(instance: ImplicitDict, operation: dict) -> ImplicitDict:
+    if not isinstance(operation, dict) or "op" not in operation or "path" not in operation:
+        raise ValueError("Each operation must be an object with op and path")
+    op = operation["op"]
+    tokens = _parse_pointer(operation["path"])
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise ValueError(f'The "{op}" operation requires a value')
+
+    if op == "add" or op == "replace":
+        return _set_at(instance, tokens, operation["value"], insert=op == "add")
+    elif op == "remove":
+        return _remove_at(instance, tokens)
+    elif op == "test":
+        if not _equal(_get_at(instance, tokens), operation["value"]):
+            raise ValueError(f"Value at {operation['path']} does not match the tested value")
+        return instance
+    elif op == "move" or op == "copy":
+        if "from" not in operation:
+            raise ValueError(f'The "{op}" operation requires from')
+        from_tokens = _parse_pointer(operation["from"])
+        value = _get_at(instance, from_tokens)
+        if op == "move":
+            if len(tokens) > len(from_tokens) and tokens[0:len(from_tokens)] == from_tokens:
+                raise ValueError("A value may not be moved into one of its own children")
+            instance = _remove_at(instance, from_tokens)
+        return _set_at(instance, tokens, value, insert=True)
+    else:
+        raise ValueError(f'Unsupported patch operation "{op}"')
+
+
+def _get_at(instance: ImplicitDict, tokens: List[str]):
+    value = instance
+    hint = type(instance)
+    path = []
+    for token in tokens:
+        key = _key_in(value, hint, token, path, allow_end=False)
+        path.append(key)
+        hint = _child_hint(value, hint, key)
+        value = _child(value, key, path)
+    return value
+
+
+def _set_at(instance: ImplicitDict, tokens: List[str], value, insert: bool) -> ImplicitDict:
+    if not tokens:
+        result = _parsed(value, type(instance), [])
+        return freeze(result) if is_frozen(instance) else result
+
+    def set_item(container, key, child_hint, path):
+        if not insert:
+            _child(container, key, path)
+        elif isinstance(container, list):
+            return _with_item(container, key, _parsed(value, child_hint, path), insert=True)
+        return _with_item(container, key, _parsed(value, child_hint, path))
+    return _modify(instance, type(instance), tokens, [], set_item, allow_end=insert)
+
+
+def _remove_at(instance: ImplicitDict, tokens: List[str]) -> ImplicitDict:
+    if not tokens:
+        raise ValueError("The root value may not be removed")
+
+    def remove_item(container, key, child_hint, path):
+        _child(container, key, path)
+        return _without_item(container, key, path)
+    return _modify(instance, type(instance), tokens, [], remove_item, allow_end=False)
+
+
+def _modify(container, hint, tokens: List[str], path: List[PathElement], change: Callable, allow_end: bool):
+    """Copy container with change(parent, key, hint of value, path of value) applied to the parent of the value at
+    tokens (relative to container, which is located at path)."""
+    last = len(path) + 1 == len(tokens)
+    key = _key_in(container, hint, tokens[len(path)], path, allow_end and last)
+    child_path = path + [key]
+    child_hint = _child_hint(container, hint, key)
+    if last:
+        return change(container, key, child_hint, child_path)
+    child = _modify(_child(container, key, child_path), child_hint, tokens, child_path, change, allow_end)
+    return _with_item(container, key, child)
+
+
+def _key_in(container, hint, token: str, path: List[PathElement], allow_end: bool):
+    if isinstance(container, ImplicitDict):
+        return token
+    if isinstance(container, dict):
+        hint = _container_hint(container, hint)
+        key_type = hint.__args__[0] if hint is not None and len(getattr(hint, "__args__", ())) == 2 else str
+        if key_type is str:
+            return token
+        # JSON object keys are always strings, so keys of other types are identified by their string form
+        try:
+            return _parse_value(token, key_type)
+        except _PARSING_ERRORS as e:
+            raise ValueError(f'At {_format_path(path)}: "{token}" is not a valid key ({e})')
+    if isinstance(container, list):
+        if token == "-" and allow_end:
+            return len(container)
+        if not token.isdigit() or (token != "0" and token.startswith("0")):
+            raise ValueError(f'At {_format_path(path)}: "{token}" is not a valid list index')
+        index = int(token)
+        if index > len(container) or (index == len(container) and not allow_end):
+            raise ValueError(f"At {_format_path(path)}: List index {index} is out of range")
+        return index
+    raise ValueError(f"At {_format_path(path)}: Cannot patch values of type {type(container).__name__}")
+
+
+def _child(container, key, path: List[PathElement]):
+    try:
+        return container[key]
+    except (KeyError, IndexError):
+        raise ValueError(f"At {_format_path(path)}: No value present")
+
+
+def _container_hint(container, hint):
+    """Remove the Optionals, Unions, and generic subclasses from the type hint of an already-parsed container."""
+    while hint is not None:
+        generic_type = _generic_origin(hint)
+        if generic_type is Union:
+            # Only the alternatives for containers of the same kind could have produced container
+            arg_types = [t for t in hint.__args__ if isinstance(_generic_origin(t), type) and isinstance(container, _generic_origin(t))]
+            hint = arg_types[0] if len(arg_types) == 1 else None
+        elif not generic_type and getattr(hint, "__orig_bases__", None):
+            # Subclasses of generic types (e.g., class SpecialList(List[str]))
+            hint = hint.__orig_bases__[0]
+        else:
+            return hint
+    return None
+
+
+def _child_hint(container, hint, key):
+    """Determine the type hint for the value at key within container (whose type hint is hint), if any."""
+    if isinstance(container, ImplicitDict):
+        return _get_hints(type(container)).get(key)
+    hint = _container_hint(container, hint)
+    generic_type = _generic_origin(hint) if hint is not None else None
+    if generic_type is list:
+        return hint.__args__[0]
+    elif generic_type is dict and len(hint.__args__) == 2:
+        return hint.__args__[1]
+    return None
+
+
+def _parsed(value, hint, path: List[PathElement]):
+    if hint is None:
+        return value
+    try:
+        return _parse_value(value, hint)
+    except _PARSING_ERRORS as e:
+        if path:
+            raise _bubble_up_parse_error(e, _format_path(path))
+        raise
+
+
+def _with_item(container, key, value, insert: bool = False):
+    """Copy container with value placed at key (or inserted before index key, for lists)."""
+    return _with_changes(container, {key: value}, (), insert)
+
+
+def _without_item(container, key, path: List[PathElement]):
+    if isinstance(container, ImplicitDict):
+        _, optional_fields = _get_fields(type(container))
+        if key not in optional_fields and not hasattr(type(container), key):
+            raise ValueError(f'At {_format_path(path)}: Required field "{key}" may not be removed from {type(container).__name__}')
+    return _with_changes(container, {}, (key,))
+
+
+def _with_changes(container, changes: Dict, removals: Sequence, insert: bool = False):
+    frozen = is_frozen(container)
+    if isinstance(container, dict):
+        if isinstance(container, ImplicitDict):
+            all_fields, optional_fields = _get_fields(type(container))
+        result = dict.__new__(type(container))
+        dict.update(result, container)
+        for key in removals:
+            dict.__delitem__(result, key)
+        for key, value in changes.items():
+            if isinstance(container, ImplicitDict):
+                if key not in all_fields:
+                    raise ValueError(f'Field "{key}" is not defined for {type(container).__name__}')
+                if value is None and key in optional_fields:
+                    # As with the constructor, None for an Optional field omits the field's value
+                    dict.pop(result, key, None)
+                    continue
+            dict.__setitem__(result, key, freeze(value) if frozen else value)
+    else:
+        result = list.__new__(type(container))
+        list.extend(result, container)
+        for key in removals:
+            list.__delitem__(result, key)
+        for key, value in changes.items():
+            if frozen:
+                value = freeze(value)
+            if insert:
+                list.insert(result, key, value)
+            else:
+                list.__setitem__(result, key, value)
+    _copy_instance_dict(container, result)
+    return result
+
+
+def _merge(container, hint, patch, path: List[PathElement]):
+    if not isinstance(patch, dict):
+        return _parsed(patch, hint, path)
+    if not isinstance(container, dict):
+        # A merge patch replaces a non-object with an object containing only the patch's non-null members
+        return _parsed(_without_nulls(patch), hint, path)
+    changes = {}
+    removals = []
+    for k, v in dict.items(patch):
+        child_path = path + [k]
+        if v is None:
+            if k in container:
+                _without_item(container, k, child_path)  # Verifies the removal is allowed
+                removals.append(k)
+        elif isinstance(v, dict) and isinstance(dict.get(container, k), dict):
+            child = _merge(container[k], _child_hint(container, hint, k), v, child_path)
+            if child is not container[k]:
+                changes[k] = child
+        elif isinstance(v, list) and isinstance(dict.get(container, k), list):
+            changes[k] = _merge_list(container[k], _child_hint(container, hint, k), v, child_path)
+        else:
+            changes[k] = _parsed(_without_nulls(v), _child_hint(container, hint, k), child_path)
+    if not changes and not removals:
+        return container
+    return _with_changes(container, changes, removals)
+
+
+def _merge_list(container: list, hint, patch: list, path: List[PathElement]) -> list:
+    """Parse the list replacing container, reusing the items of container which are also present (as the same
+    object at the same index) in patch, as is the case for patches produced by merge_diff."""
+    item_hint = _child_hint(container, hint, 0)
+    if item_hint is None:
+        return _parsed(_without_nulls(patch), hint, path)
+    frozen = is_frozen(container)
+    items = []
+    for i, item in enumerate(patch):
+        if i < len(container) and container[i] is item:
+            items.append(item)
+        else:
+            parsed = _parsed(_without_nulls(item), item_hint, path + [i])
+            items.append(freeze(parsed) if frozen else parsed)
+    # As with JSON Patch operations, the result is the same type as container (e.g., a subclass of List[T])
+    result = list.__new__(type(container))
+    list.extend(result, items)
+    _copy_instance_dict(container, result)
+    return result
+
+
+def _without_nulls(value):
+    if isinstance(value, dict):
+        return {k: _without_nulls(v) for k, v in dict.items(value) if v is not None}
+    return value
@@ -0,0 +1,138 @@
+import re
+from typing import List, Sequence, TypeVar, Union
+
+from . import ImplicitDict, _get_fields
+from .frozen import _KEY_HASH, freeze, is_frozen
+
+
+T = TypeVar("T")
+
+PathElement = Union[str, int]
+
+_PATH_ELEMENT_REGEX = re.compile(r'\.?([^.[\]]+)|\[(-?[0-9]+)]')
+
+
+def evolve(instance: T, **changes) -> T:
+    """Produce a copy of an ImplicitDict instance with the specified fields changed.
+
+    The result is equivalent to `type(instance)(instance, **changes)`, but unchanged field values are shared with the
+    original instance rather than passing through the constructor, and only the changed fields are checked.  As with the
+    constructor, an explicit None for an Optional field which is not present in the original instance is considered to
+    omit that field's value.  Non-field attributes of the original instance are carried over, but __init__ is not run.
+
+    If the instance is frozen, the result is also frozen.
+
+    Args:
+        instance: ImplicitDict instance to evolve.  It is not modified.
+        changes: New values for fields of the instance.
+
+    Returns:
+        New instance of the same type as `instance` with the specified changes applied.
+    """
+    subtype = type(instance)
+    if not isinstance(instance, ImplicitDict):
+        raise ValueError(f"Only ImplicitDict instances can be evolved; found {subtype.__name__} instead")
+    all_fields, optional_fields = _get_fields(subtype)
+    frozen = is_frozen(instance)
+
+    result = dict.__new__(subtype)
+    dict.update(result, instance)
+    for key, value in changes.items():
+        if key not in all_fields:
+            raise ValueError(f'Field "{key}" is not defined for {subtype.__name__}')
+        if value is None and key in optional_fields and key not in instance:
+            if hasattr(subtype, key):
+                dict.__setitem__(result, key, getattr(subtype, key))
+            continue
+        dict.__setitem__(result, key, freeze(value) if frozen else value)
+
+    _copy_instance_dict(instance, result)
+    return result
+
+
+def evolve_in(instance: T, path: Union[str, Sequence[PathElement]], value) -> T:
+    """Produce a copy of an ImplicitDict instance with the value at the specified nested path changed.
+
+    Only the ImplicitDicts, dicts, and lists along the path are copied; every other subtree is shared with the original
+    instance.  ImplicitDicts along the path are evolved with `evolve`, so the same field checks apply.
+
+    Args:
+        instance: ImplicitDict instance to evolve.  It is not modified.
+        path: Location of the value to change, either as a sequence of field names, dict keys, and list indices or as a
+            string in the same format used to locate parsing errors (e.g., "details.volumes[0].time_start").
+        value: New value to place at the specified path.
+
+    Returns:
+        New instance of the same type as `instance` with the specified change applied.
+    """
+    keys = _parse_path(path) if isinstance(path, str) else list(path)
+    if not keys:
+        raise ValueError("Path to value to change may not be empty")
+    return _evolve_in(instance, keys, 0, value)
+
+
+def _evolve_in(container, keys: List[PathElement], i: int, value):
+    key = keys[i]
+    if i + 1 < len(keys):
+        try:
+            child = container[key]
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f"At {_format_path(keys[0:i + 1])}: No value present to evolve")
+        value = _evolve_in(child, keys, i + 1, value)
+
+    if isinstance(container, ImplicitDict):
+        if not isinstance(key, str):
+            raise ValueError(f"At {_format_path(keys[0:i + 1])}: ImplicitDict fields must be identified by name")
+        return evolve(container, **{key: value})
+
+    frozen = is_frozen(container)
+    if frozen:
+        value = freeze(value)
+    if isinstance(container, dict):
+        result = dict.__new__(type(container))
+        dict.update(result, container)
+        dict.__setitem__(result, key, value)
+    elif isinstance(container, list):
+        result = list.__new__(type(container))
+        list.extend(result, container)
+        try:
+            list.__setitem__(result, key, value)
+        except (IndexError, TypeError):
+            raise ValueError(f"At {_format_path(keys[0:i + 1])}: No list element present to replace")
+    else:
+        raise ValueError(f"At {_format_path(keys[0:i])}: Cannot evolve values of type {type(container).__name__}")
+
+    _copy_instance_dict(container, result)
+    return result
+
+
+def _copy_instance_dict(source, target) -> None:
+    instance_dict = getattr(source, "__dict__", None)
+    if instance_dict:
+        target_dict = object.__getattribute__(target, "__dict__")
+        target_dict.update(instance_dict)
+        target_dict.pop(_KEY_HASH, None)
+
+
+def _parse_path(path: str) -> List[PathElement]:
+    keys = []
+    end = 0
+    for m in _PATH_ELEMENT_REGEX.finditer(path):
+        is_name = m.group(1) is not None
+        if m.start() != end or (is_name and m.group(0).startswith(".") != bool(keys)):
+            break
+        keys.append(m.group(1) if is_name else int(m.group(2)))
+        end = m.end()
+    if end != len(path):
+        raise ValueError(f'Could not interpret "{path}" as a path to a value')
+    return keys
+
+
+def _format_path(keys: Sequence[PathElement]) -> str:
+    path = ""
+    for key in keys:
+        if isinstance(key, int):
+            path += f"[{key}]"
+        else:
+            path += f".{key}" if path else key
+    return path
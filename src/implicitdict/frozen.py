@@ -0,0 +1,200 @@
+from typing import Dict, Type, TypeVar
+
+from . import ImplicitDict, _get_fields
+
+
+_KEY_HASH = "__implicitdict_hash__"
+_KEY_MUTABLE_TYPE = "__implicitdict_mutable_type__"
+
+_ATOMIC_TYPES = {str, int, float, bool, bytes, type(None)}
+
+T = TypeVar("T")
+
+
+def _raise_frozen(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is frozen and does not support mutation")
+
+
+class _Frozen(object):
+    """Behavior shared by all frozen containers.
+
+    The structural hash of a frozen container is computed on first use and then cached on the instance, which is
+    safe because neither the container nor (since they are frozen as well) any of its contents may change.
+    """
+
+    __slots__ = ()
+
+    def _structural_hash(self) -> int:
+        raise NotImplementedError()
+
+    def __hash__(self):
+        instance_dict = object.__getattribute__(self, "__dict__")
+        h = instance_dict.get(_KEY_HASH)
+        if h is None:
+            h = self._structural_hash()
+            instance_dict[_KEY_HASH] = h
+        return h
+
+    def __eq__(self, other):
+        if isinstance(other, _Frozen) and hash(self) != hash(other):
+            return False
+        return super(_Frozen, self).__eq__(other)
+
+    def __ne__(self, other):
+        if isinstance(other, _Frozen) and hash(self) != hash(other):
+            return True
+        return super(_Frozen, self).__ne__(other)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Cannot set attribute \"{key}\" of frozen \"{type(self).__name__}\" object")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"Cannot delete attribute \"{key}\" of frozen \"{type(self).__name__}\" object")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # The default reconstruction of containers populates them by mutation, which is not allowed
+        return freeze, (thaw(self),)
+
+
+class _FrozenMapping(_Frozen):
+    __slots__ = ()
+
+    def _structural_hash(self) -> int:
+        return hash(frozenset(dict.items(self)))
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _raise_frozen
+
+
+class _FrozenSequence(_Frozen):
+    __slots__ = ()
+
+    def _structural_hash(self) -> int:
+        return hash(tuple(self))
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_frozen
+    append = clear = extend = insert = pop = remove = reverse = sort = _raise_frozen
+
+
+class _FrozenSet(_Frozen):
+    __slots__ = ()
+
+    def _structural_hash(self) -> int:
+        return hash(frozenset(self))
+
+    __ior__ = __iand__ = __isub__ = __ixor__ = _raise_frozen
+    add = clear = discard = pop = remove = update = _raise_frozen
+    difference_update = intersection_update = symmetric_difference_update = _raise_frozen
+
+
+_frozen_types: Dict[type, type] = {}
+
+
+def frozen_type(mutable_type: Type[T]) -> Type[T]:
+    """Get the frozen counterpart of the specified dict, list, or set type (including ImplicitDict subclasses).
+
+    The frozen type is a subclass of the mutable type, so instances of the frozen type still satisfy isinstance checks
+    against the mutable type.  Frozen types are created once per mutable type and then reused.
+    """
+    if issubclass(mutable_type, _Frozen):
+        return mutable_type
+    result = _frozen_types.get(mutable_type)
+    if result is None:
+        if issubclass(mutable_type, dict):
+            mixin = _FrozenMapping
+        elif issubclass(mutable_type, list):
+            mixin = _FrozenSequence
+        elif issubclass(mutable_type, set):
+            mixin = _FrozenSet
+        else:
+            raise ValueError(f"Cannot make a frozen version of {mutable_type.__name__}; only dict, list, and set types are supported")
+        if mutable_type.__module__ == "builtins":
+            name = "Frozen" + mutable_type.__name__.capitalize()
+            module = __name__
+            qualname = name
+        else:
+            name = "Frozen" + mutable_type.__name__
+            module = mutable_type.__module__
+            qualname = mutable_type.__qualname__[0:-len(mutable_type.__name__)] + name
+        result = type(name, (mixin, mutable_type), {
+            "__module__": module,
+            "__qualname__": qualname,
+            _KEY_MUTABLE_TYPE: mutable_type,
+        })
+        if issubclass(mutable_type, ImplicitDict):
+            # Attribute access on ImplicitDicts relies on the fields info having been computed
+            _get_fields(result)
+        result = _frozen_types.setdefault(mutable_type, result)
+    return result
+
+
+def is_frozen(value) -> bool:
+    """Determine whether the specified value is a frozen container produced by `freeze`."""
+    return isinstance(value, _Frozen)
+
+
+def freeze(value: T) -> T:
+    """Produce a deeply-immutable, hashable equivalent of the specified value.
+
+    ImplicitDicts, dicts, lists, and sets (and subclasses of these) are converted to their frozen counterparts (see
+    `frozen_type`) which forbid mutation via both item and attribute assignment.  Tuples are rebuilt with frozen
+    contents and all other values are assumed to be immutable already.  Subtrees which are already frozen are reused
+    rather than copied, so freezing an already-frozen value is free.
+
+    Frozen values compare equal to the mutable values they were produced from, and their hash is computed only once.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES or isinstance(value, _Frozen):
+        return value
+
+    if isinstance(value, dict):
+        result = dict.__new__(frozen_type(value_type))
+        dict.update(result, ((k, freeze(v)) for k, v in dict.items(value)))
+    elif isinstance(value, list):
+        result = list.__new__(frozen_type(value_type))
+        list.extend(result, [freeze(v) for v in value])
+    elif isinstance(value, set):
+        result = set.__new__(frozen_type(value_type))
+        set.update(result, (freeze(v) for v in value))
+    elif value_type is tuple:
+        return tuple(freeze(v) for v in value)
+    else:
+        return value
+
+    instance_dict = getattr(value, "__dict__", None)
+    if instance_dict:
+        object.__getattribute__(result, "__dict__").update(instance_dict)
+    return result
+
+
+def thaw(value: T) -> T:
+    """Produce a mutable equivalent of a value produced by `freeze`.
+
+    Frozen containers are converted back to instances of the types they were frozen from, recursively.  Values which
+    are not frozen are returned unchanged.
+    """
+    if not isinstance(value, _Frozen):
+        if type(value) is tuple:
+            return tuple(thaw(v) for v in value)
+        return value
+
+    mutable_type = getattr(type(value), _KEY_MUTABLE_TYPE)
+    if isinstance(value, dict):
+        result = dict.__new__(mutable_type)
+        dict.update(result, ((k, thaw(v)) for k, v in dict.items(value)))
+    elif isinstance(value, list):
+        result = list.__new__(mutable_type)
+        list.extend(result, [thaw(v) for v in value])
+    else:
+        result = set.__new__(mutable_type)
+        set.update(result, (thaw(v) for v in value))
+
+    instance_dict = {k: v for k, v in object.__getattribute__(value, "__dict__").items() if k != _KEY_HASH}
+    if instance_dict:
+        object.__getattribute__(result, "__dict__").update(instance_dict)
+    return result
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Dict
+
+import implicitdict
+from . import _fullname, _TypeCounters
+
+
+@dataclass
+class TypeStats(object):
+    parses: int
+    """Number of times ImplicitDict.parse was called for this type (including for nested values)."""
+
+    parse_time: float
+    """Cumulative duration of those parses, in seconds, including the time spent parsing nested values."""
+
+    max_parse_time: float
+    """Longest duration of any one of those parses, in seconds."""
+
+    constructions: int
+    """Number of instances of this type constructed (including by parse)."""
+
+    orig_bases_fallbacks: int
+    """Number of values of this type parsed by falling back to its generic base (e.g., class MyList(List[str]))."""
+
+    untyped_fields: int
+    """Number of values passed through parse as-is because the type has no type hint for their key."""
+
+    errors: int
+    """Number of parses of this type which raised an error (including errors in nested values)."""
+
+
+def enable() -> None:
+    """Start recording per-type counters.
+
+    While instrumentation is disabled (the default), the cost to parsing and construction is a single global check.
+    While it is enabled, counters are updated without locking, so counts may be slightly low when the same types are
+    used concurrently from multiple threads.
+    """
+    if implicitdict._type_counters is None:
+        implicitdict._type_counters = {}
+
+
+def disable() -> None:
+    """Stop recording per-type counters and discard all counts."""
+    implicitdict._type_counters = None
+
+
+def is_enabled() -> bool:
+    return implicitdict._type_counters is not None
+
+
+def snapshot() -> Dict[str, TypeStats]:
+    """Get the current counters for each type that has been used since instrumentation was enabled or reset.
+
+    Returns:
+        TypeStats by full type name (module and qualified name).
+    """
+    type_counters = implicitdict._type_counters
+    if type_counters is None:
+        return {}
+    return {_fullname(t): _stats_from(counters) for t, counters in list(type_counters.items())}
+
+
+def reset() -> Dict[str, TypeStats]:
+    """Reset all counters to zero, returning their values immediately before the reset (see snapshot).
+
+    Counts recorded concurrently with the reset are attributed either to the returned values or to the new counters.
+    """
+    type_counters = implicitdict._type_counters
+    if type_counters is None:
+        return {}
+    implicitdict._type_counters = {}
+    return {_fullname(t): _stats_from(counters) for t, counters in list(type_counters.items())}
+
+
+def _stats_from(counters: _TypeCounters) -> TypeStats:
+    return TypeStats(
+        parses=counters.parses,
+        parse_time=counters.parse_time,
+        max_parse_time=counters.max_parse_time,
+        constructions=counters.constructions,
+        orig_bases_fallbacks=counters.orig_bases_fallbacks,
+        untyped_fields=counters.untyped_fields,
+        errors=counters.errors,
+    )
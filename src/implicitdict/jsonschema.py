@@ -1,12 +1,22 @@
+import ast
 import inspect
 from dataclasses import dataclass
 from datetime import datetime
 import enum
+import hashlib
 import json
-import re
-from typing import get_args, get_origin, get_type_hints, Dict, Literal, Optional, Type, Union, Tuple, Callable
+import sys
+import textwrap
+from types import ModuleType
+from typing import get_args, Dict, Iterable, List, Literal, Optional, Type, TypeVar, Union, Tuple, \
+    Callable, TYPE_CHECKING
 
-from . import ImplicitDict, _fullname, _get_fields, StringBasedDateTime, StringBasedTimeDelta
+from . import ImplicitDict, _dependencies_of, _discover_types, _fullname, _generic_origin, _get_fields, _get_hints, \
+    _KEY_GENERIC_ORIGIN, _tagged_union_for, _tuple_item_types, _untagged_union_for, StringBasedDateTime, StringBasedTimeDelta
+from .frozen import freeze
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 @dataclass
@@ -50,10 +60,22 @@ def make_json_schema(
     # Add placeholder to avoid recursive definition attempts while we're making this schema
     schema_repository[schema_vars.name] = {"$generating": True}
 
+    schema_repository[schema_vars.name] = _make_object_schema(schema_type, schema_vars, schema_vars_resolver, schema_repository)
+
+
+def _make_object_schema(
+        schema_type: Type[ImplicitDict],
+        schema_vars: SchemaVars,
+        schema_vars_resolver: SchemaVarsResolver,
+        schema_repository: Dict[str, dict],
+        hints: Optional[Dict[str, Type]] = None,
+) -> dict:
+    """Create the JSON Schema for only the specified schema type, adding any missing dependencies to schema_repository."""
     properties = {"$ref": {"type": "string", "description": "Path to content that replaces the $ref"}}
     all_fields, optional_fields = _get_fields(schema_type)
     required_fields = []
-    hints = get_type_hints(schema_type)
+    if hints is None:
+        hints = _get_hints(schema_type)
     field_docs = _field_docs_for(schema_type)
     for field in all_fields:
         if field in hints:
@@ -98,7 +120,141 @@ def make_json_schema(
         required_fields.sort()
         schema["required"] = required_fields
 
-    schema_repository[schema_vars.name] = schema
+    return schema
+
+
+class _AssumeGenerated(dict):
+    """Schema repository which claims to already contain every schema, so no dependencies are generated into it."""
+
+    def __contains__(self, key) -> bool:
+        return True
+
+
+def make_json_schemas(
+        module_or_types: Union[ModuleType, Type[ImplicitDict], Iterable[Union[ModuleType, Type[ImplicitDict]]]],
+        schema_vars_resolver: SchemaVarsResolver,
+        schema_repository: Dict[str, dict],
+        executor: Optional["Executor"] = None,
+) -> None:
+    """Create JSON Schema for many ImplicitDict types and all their dependencies, generating schemas in parallel.
+
+    The resulting schema_repository is identical (including order) to calling make_json_schema for each ImplicitDict
+    subclass found, in order of discovery.  The dependency graph among all the types is determined first, and then the
+    schema for each type is generated independently in the executor.
+
+    Args:
+        module_or_types: ImplicitDict subclass or module, or iterable of them.  For each module, all ImplicitDict
+            subclasses defined in that module are included, and packages are searched recursively.
+        schema_vars_resolver: Mapping between Python Type and characteristics of the schema for that type.
+        schema_repository: Mapping from reference path to JSON Schema for the corresponding type; see make_json_schema.
+        executor: Executor in which to generate the schemas of individual types; if not specified, schemas are
+            generated in the calling thread.  Schema generation is CPU-bound Python, so a ProcessPoolExecutor is
+            needed for actual parallelism on most interpreters; in that case, schema_vars_resolver and all the types
+            must be picklable (e.g., defined at module level).
+    """
+    # Determine which schemas make_json_schema would generate, in the order it would generate them
+    to_generate: Dict[str, Tuple[Type[ImplicitDict], Dict[str, Type]]] = {}
+
+    def present(t: Type[ImplicitDict]) -> bool:
+        # make_json_schema does not generate (nor descend into) types whose schemas are already present
+        return schema_vars_resolver(t).name in schema_repository
+
+    for t in _dependencies_of(_discover_types(module_or_types), skip=present):
+        name = schema_vars_resolver(t).name
+        if name not in to_generate:
+            to_generate[name] = (t, _get_hints(t))
+
+    names = list(to_generate)
+    types = [to_generate[name][0] for name in names]
+    hints = [to_generate[name][1] for name in names]
+    resolvers = [schema_vars_resolver] * len(types)
+    if executor is None:
+        schemas = list(map(_generate_schema, types, hints, resolvers))
+    else:
+        schemas = list(executor.map(_generate_schema, types, hints, resolvers, chunksize=max(1, len(types) // 64)))
+    for name, schema in zip(names, schemas):
+        schema_repository[name] = schema
+
+
+def _generate_schema(schema_type: Type[ImplicitDict], hints: Dict[str, Type], schema_vars_resolver: SchemaVarsResolver) -> dict:
+    return _make_object_schema(schema_type, schema_vars_resolver(schema_type), schema_vars_resolver, _AssumeGenerated(), hints)
+
+
+@dataclass
+class BundledJsonSchema(object):
+    schema: dict
+    """Single JSON Schema document describing the type, with all dependencies in $defs (frozen)."""
+
+    content: bytes
+    """Canonical UTF-8 JSON serialization of schema (sorted keys, no insignificant whitespace)."""
+
+    etag: str
+    """Strong HTTP entity tag (quoted SHA-256 hex digest) of content."""
+
+
+_bundles: Dict[Tuple[Type, Tuple[Tuple[str, Optional[str], Optional[str]], ...]], BundledJsonSchema] = {}
+_bundled_types: Dict[Type, List[Type[ImplicitDict]]] = {}
+
+
+def make_bundled_json_schema(
+        schema_type: Type[ImplicitDict],
+        schema_vars_resolver: SchemaVarsResolver,
+) -> BundledJsonSchema:
+    """Create a single JSON Schema document for the specified schema type including all dependencies.
+
+    Each type the schema type depends upon is defined once in the document's $defs, keyed by the name provided by
+    schema_vars_resolver, and all references are rewritten to point within the document (path_to is not used).  The
+    resulting document, its serialization, and its ETag are cached per schema type and the name, schema_id, and
+    description schema_vars_resolver provides for each type in the bundle, so repeated requests for the same bundle
+    (e.g., to serve it over HTTP) don't regenerate it, even when a new resolver is provided for each request.
+
+    Args:
+        schema_type: ImplicitDict subclass to produce JSON Schema for.
+        schema_vars_resolver: Mapping between Python Type and characteristics of the schema for that type.
+
+    Returns:
+        Bundled schema.  Since it is shared by all callers, its schema document is frozen (see implicitdict.frozen.thaw
+        to obtain a mutable copy) so that it always matches the content and ETag.
+    """
+    types = _bundled_types.get(schema_type)
+    if types is None:
+        types = _bundled_types.setdefault(schema_type, _dependencies_of([schema_type]))
+    resolved = []
+    for t in types:
+        schema_vars = schema_vars_resolver(t)
+        resolved.append((schema_vars.name, schema_vars.schema_id, schema_vars.description))
+    key = (schema_type, tuple(resolved))
+    result = _bundles.get(key)
+    if result is None:
+        result = _bundles.setdefault(key, _make_bundle(schema_type, schema_vars_resolver))
+    return result
+
+
+def _make_bundle(schema_type: Type[ImplicitDict], schema_vars_resolver: SchemaVarsResolver) -> BundledJsonSchema:
+    root_name = schema_vars_resolver(schema_type).name
+
+    def path_to(t_dest: Type, t_src: Type) -> str:
+        name = schema_vars_resolver(t_dest).name
+        if name == root_name:
+            return "#"
+        return "#/$defs/" + name.replace("~", "~0").replace("/", "~1")
+
+    def bundle_vars_resolver(t: Type) -> SchemaVars:
+        schema_vars = schema_vars_resolver(t)
+        return SchemaVars(name=schema_vars.name, path_to=path_to, schema_id=schema_vars.schema_id,
+                          description=schema_vars.description)
+
+    repository = {}
+    make_json_schema(schema_type, bundle_vars_resolver, repository)
+    schema = repository.pop(root_name)
+    if repository:
+        defs = {}
+        for name, definition in sorted(repository.items()):
+            defs[name] = {k: v for k, v in definition.items() if k != "$schema" and k != "$id"}
+        schema["$defs"] = defs
+
+    content = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return BundledJsonSchema(schema=freeze(schema), content=content, etag='"' + hashlib.sha256(content).hexdigest() + '"')
 
 
 def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, schema_repository: Dict[str, dict], context: Type) -> Tuple[dict, bool]:
@@ -118,7 +274,7 @@ def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, sche
           E.g., _schema_for(Optional[float], ...) would indicate True because an Optional[float] field within an
           ImplicitDict would be an optional field in that object.
     """
-    generic_type = get_origin(value_type)
+    generic_type = _generic_origin(value_type)
     if generic_type:
         # Type is generic
         arg_types = get_args(value_type)
@@ -126,6 +282,20 @@ def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, sche
             items_schema, _ = _schema_for(arg_types[0], schema_vars_resolver, schema_repository, context)
             return {"type": "array", "items": items_schema}, False
 
+        elif generic_type is tuple:
+            item_types = _tuple_item_types(arg_types)
+            if item_types is None:
+                items_schema, _ = _schema_for(arg_types[0], schema_vars_resolver, schema_repository, context)
+                return {"type": "array", "items": items_schema}, False
+            schema = {"type": "array", "minItems": len(item_types), "maxItems": len(item_types)}
+            if item_types:
+                schema["prefixItems"] = [_schema_for(t, schema_vars_resolver, schema_repository, context)[0] for t in item_types]
+            return schema, False
+
+        elif generic_type is set or generic_type is frozenset:
+            items_schema, _ = _schema_for(arg_types[0], schema_vars_resolver, schema_repository, context)
+            return {"type": "array", "items": items_schema, "uniqueItems": True}, False
+
         elif generic_type is dict:
             schema = {
                 "type": "object",
@@ -141,14 +311,44 @@ def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, sche
         elif generic_type is Union and len(arg_types) == 2 and arg_types[1] is type(None):
             # Type is an Optional declaration
             subschema, _ = _schema_for(arg_types[0], schema_vars_resolver, schema_repository, context)
-            schema = json.loads(json.dumps(subschema))
+            # Only top-level keys are replaced below, so nested content may be shared with subschema
+            schema = dict(subschema)
             if "type" in schema:
                 if "null" not in schema["type"]:
                     schema["type"] = [schema["type"], "null"]
+                if "enum" in schema and None not in schema["enum"]:
+                    schema["enum"] = schema["enum"] + [None]
             else:
                 schema = {"oneOf": [{"type": "null"}, schema]}
             return schema, True
 
+        elif generic_type is Union:
+            tagged_union = _tagged_union_for(value_type)
+            if tagged_union is None:
+                untagged_union = _untagged_union_for(value_type)
+                if untagged_union is None:
+                    raise NotImplementedError(f"Automatic JSON schema generation for {value_type} generic type is not yet implemented")
+                # Without a discriminator, a value may conform to multiple alternatives (parsing additionally rejects
+                # values which it can't attribute to exactly one alternative)
+                alternatives = []
+                for t in untagged_union.types:
+                    make_json_schema(t, schema_vars_resolver, schema_repository)
+                    alternatives.append({"$ref": schema_vars_resolver(t).path_to(t, context)})
+                if untagged_union.optional:
+                    alternatives.append({"type": "null"})
+                return {"anyOf": alternatives}, untagged_union.optional
+            # Each alternative requires its own discriminator value so that exactly one alternative matches any value
+            discriminator = tagged_union.discriminator
+            alternatives = []
+            mapping = {}
+            for tag, t in tagged_union.types_by_tag.items():
+                make_json_schema(t, schema_vars_resolver, schema_repository)
+                mapping[tag] = schema_vars_resolver(t).path_to(t, context)
+                alternatives.append({"$ref": mapping[tag], "properties": {discriminator: {"const": tag}}, "required": [discriminator]})
+            if tagged_union.optional:
+                alternatives.append({"type": "null"})
+            return {"oneOf": alternatives, "discriminator": {"propertyName": discriminator, "mapping": mapping}}, tagged_union.optional
+
         elif generic_type is Literal and len(arg_types) == 1:
             # Type is a Literal (parsed value must match specified value)
             return {"type": "string", "enum": [arg_types[0]]}, False
@@ -156,6 +356,12 @@ def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, sche
         else:
             raise NotImplementedError(f"Automatic JSON schema generation for {value_type} generic type is not yet implemented")
 
+    if isinstance(value_type, TypeVar):
+        # Type variable of a generic ImplicitDict that was not specialized
+        if value_type.__bound__ is None:
+            return {}, False
+        return _schema_for(value_type.__bound__, schema_vars_resolver, schema_repository, context)
+
     schema_vars = schema_vars_resolver(value_type)
 
     if issubclass(value_type, ImplicitDict):
@@ -193,19 +399,88 @@ def _schema_for(value_type: Type, schema_vars_resolver: SchemaVarsResolver, sche
     raise NotImplementedError(f"Automatic JSON schema generation for {value_type} type is not yet implemented")
 
 
+_field_docs_by_type: Dict[Type, Dict[str, str]] = {}
+_field_docs_by_module: Dict[str, Dict[str, Optional[Dict[str, str]]]] = {}
+
+
 def _field_docs_for(t: Type[ImplicitDict]) -> Dict[str, str]:
+    """Get the docstrings of each of the fields of the specified type, by field name.
+
+    Attribute docstrings are found by parsing the source of the module defining the type, which is done only once per
+    module for all the classes it contains.  Results are cached per type.
+    """
+    result = _field_docs_by_type.get(t)
+    if result is None:
+        # Specializations of generic types are documented by the source of the generic type
+        result = _field_docs_by_type.setdefault(t, _find_field_docs(t.__dict__.get(_KEY_GENERIC_ORIGIN, t)))
+    return result
+
+
+def _find_field_docs(t: Type) -> Dict[str, str]:
+    module_docs = _field_docs_by_module.get(t.__module__)
+    if module_docs is None:
+        module = sys.modules.get(t.__module__)
+        try:
+            module_docs = _field_docs_in_source(inspect.getsource(module)) if module is not None else {}
+        except (OSError, TypeError, SyntaxError):
+            module_docs = {}
+        module_docs = _field_docs_by_module.setdefault(t.__module__, module_docs)
+
+    result = module_docs.get(t.__qualname__)
+    if result is None:
+        # Either the class is not defined in the module's source (e.g., it was created dynamically), or its qualified
+        # name is ambiguous within the module (e.g., it is defined differently in two branches), so fall back to the
+        # source inspect attributes to the class itself.
+        try:
+            class_docs = _field_docs_in_source(textwrap.dedent(inspect.getsource(t)))
+        except (OSError, TypeError, SyntaxError):
+            class_docs = {}
+        result = class_docs.get(t.__name__) or {}
+    return result
+
+
+def _field_docs_in_source(src: str) -> Dict[str, Optional[Dict[str, str]]]:
+    """Extract the field docstrings of all classes defined in the specified source, by class qualified name.
+
+    The qualified names of classes defined more than once in the source map to None.
+    """
     # Curse Guido for rejecting PEP224!  Fine, we'll do it ourselves.
     result = {}
-    src = inspect.getsource(t)
-    doc_pattern = r"\n([ \t]+)([_a-zA-Z][_a-zA-Z0-9]*)(?:: [^\n]+)?\n\1(?:\"\"\"|''')((?:.|\s)*?)(?:\"\"\"|''')"
-    for m in re.finditer(doc_pattern, src):
-        indent = m.group(1)
-        lines = m.group(3).split("\n")
+    _collect_field_docs(ast.parse(src), "", src.split("\n"), result)
+    return result
+
+
+def _collect_field_docs(node: ast.AST, prefix: str, src_lines: List[str], result: Dict[str, Optional[Dict[str, str]]]) -> None:
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.ClassDef):
+            qualname = prefix + child.name
+            result[qualname] = None if qualname in result else _class_field_docs(child, src_lines)
+            _collect_field_docs(child, qualname + ".", src_lines, result)
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            _collect_field_docs(child, prefix + child.name + ".<locals>.", src_lines, result)
+        elif isinstance(child, ast.stmt) or isinstance(child, ast.excepthandler):
+            _collect_field_docs(child, prefix, src_lines, result)
+
+
+def _class_field_docs(class_def: ast.ClassDef, src_lines: List[str]) -> Dict[str, str]:
+    result = {}
+    for statement, next_statement in zip(class_def.body, class_def.body[1:]):
+        if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+            field = statement.target.id
+        elif isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+            field = statement.targets[0].id
+        else:
+            continue
+        if not (isinstance(next_statement, ast.Expr) and isinstance(next_statement.value, ast.Constant) and isinstance(next_statement.value.value, str)):
+            continue
+
+        line = src_lines[statement.lineno - 1]
+        indent = line[0:len(line) - len(line.lstrip())]
+        lines = next_statement.value.value.split("\n")
         for i in range(1, len(lines)):
             if lines[i].startswith(indent):
                 lines[i] = lines[i][len(indent):]
-        while not lines[-1]:
+        while lines and not lines[-1]:
             lines = lines[0:-1]
-        docstring = "\n".join(lines)
-        result[m.group(2)] = docstring
+        result[field] = "\n".join(lines)
     return result
@@ -0,0 +1,131 @@
+from collections import deque
+from dataclasses import dataclass, field
+import enum
+import random
+import sys
+from types import FunctionType, ModuleType
+from typing import Dict, Optional, Sequence, Set, Union
+
+from . import ImplicitDict, _fullname, _get_fields
+
+
+ROOT_PATH = "<root>"
+"""Path to which the memory of the top-level object itself is attributed."""
+
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, enum.Enum)
+"""Types of objects which are not considered part of any instance tree (e.g., classes and enum members referenced by
+instances)."""
+
+_ATOMIC_TYPES = {str, int, float, bool, bytes, type(None)}
+"""Types of values which contain no other objects."""
+
+
+@dataclass
+class MemoryUsage(object):
+    total: int
+    """Total bytes used by the objects in the tree, counting each object once."""
+
+    by_path: Dict[str, int] = field(default_factory=dict)
+    """Bytes used by the values at each field path, with "[]" denoting each item of a list, tuple, or set and "{}" each
+    value of a dict which is not an ImplicitDict (e.g., "details.volumes[].time_start").  The bytes of each value do not
+    include those of the nested values reported under other field paths, but do include the keys of dicts which are not
+    ImplicitDicts and instance attributes (e.g., the datetime of a StringBasedDateTime)."""
+
+    by_type: Dict[str, int] = field(default_factory=dict)
+    """Bytes used by objects of each type, by full type name."""
+
+    objects: int = 0
+    """Number of distinct objects counted."""
+
+    sampled: bool = False
+    """True if these values were extrapolated from a sample of a batch rather than measured in full."""
+
+
+def memory_usage(obj: Union[ImplicitDict, Sequence[ImplicitDict]], sample_size: Optional[int] = None, seed: int = 0) -> MemoryUsage:
+    """Measure the total memory used by an ImplicitDict (or a batch of ImplicitDicts), including all nested values.
+
+    Unlike sys.getsizeof, which only counts the top-level dict, the entire tree of values is walked (following the fields
+    of each ImplicitDict) and the size of each distinct object is counted once, even when the object is shared between
+    multiple fields or instances.  The field names keying each ImplicitDict are shared
+    by all instances of the type, and classes, modules, functions, and enum members referenced by the tree are not part
+    of any one tree, so none of these are counted.
+
+    Args:
+        obj: ImplicitDict, or list or tuple of ImplicitDicts (a batch), to measure.
+        sample_size: If specified and obj is a batch with more items than sample_size, only a random sample of
+            sample_size items is measured and the sizes of the items are extrapolated to the whole batch.  Objects
+            shared between items are counted once per sampled item in the extrapolation, so an estimate for a batch
+            which shares many objects between its items will be higher than its actual usage.
+        seed: Seed for selecting the sample items.
+
+    Returns:
+        Memory used by obj.
+    """
+    usage = MemoryUsage(total=0)
+    seen: Set[int] = set()
+    if sample_size is not None and isinstance(obj, (list, tuple)) and len(obj) > sample_size:
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be at least 1; found {sample_size}")
+        _count(obj, ROOT_PATH, usage, seen)
+        items = MemoryUsage(total=0)
+        for item in random.Random(seed).sample(list(obj), sample_size):
+            _walk(item, "[]", items, seen)
+        scale = len(obj) / sample_size
+        usage.total += round(items.total * scale)
+        usage.objects += round(items.objects * scale)
+        for path, size in items.by_path.items():
+            usage.by_path[path] = usage.by_path.get(path, 0) + round(size * scale)
+        for type_name, size in items.by_type.items():
+            usage.by_type[type_name] = usage.by_type.get(type_name, 0) + round(size * scale)
+        usage.sampled = True
+    else:
+        _walk(obj, ROOT_PATH, usage, seen)
+    return usage
+
+
+def _walk(root, root_path: str, usage: MemoryUsage, seen: Set[int]) -> None:
+    # Breadth-first, so that shared objects are attributed to the shallowest path at which they are found
+    pending = deque([(root, root_path)])
+    while pending:
+        value, path = pending.popleft()
+        if id(value) in seen or isinstance(value, _OPAQUE_TYPES):
+            continue
+        _count(value, path, usage, seen)
+        if type(value) in _ATOMIC_TYPES:
+            continue
+        prefix = "" if path == ROOT_PATH else path
+
+        if isinstance(value, ImplicitDict):
+            # Field names are shared by every instance of the type, so only the values of fields are counted
+            all_fields, _ = _get_fields(type(value))
+            for k, v in dict.items(value):
+                if k not in all_fields:
+                    pending.append((k, path))
+                pending.append((v, f"{prefix}.{k}" if prefix else k))
+        elif isinstance(value, dict):
+            for k, v in value.items():
+                pending.append((k, path))
+                pending.append((v, prefix + "{}"))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for v in value:
+                pending.append((v, prefix + "[]"))
+        else:
+            # Instance attributes (e.g., StringBasedDateTime.datetime) are attributed to the value that holds them
+            attributes = getattr(value, "__dict__", None)
+            if isinstance(attributes, dict) and id(attributes) not in seen:
+                _count(attributes, path, usage, seen)
+                for v in attributes.values():
+                    pending.append((v, path))
+
+
+def _count(value, path: str, usage: MemoryUsage, seen: Set[int]) -> None:
+    value_id = id(value)
+    if value_id in seen or isinstance(value, _OPAQUE_TYPES):
+        return
+    seen.add(value_id)
+    size = sys.getsizeof(value)
+    usage.total += size
+    usage.objects += 1
+    usage.by_path[path] = usage.by_path.get(path, 0) + size
+    type_name = _fullname(type(value))
+    usage.by_type[type_name] = usage.by_type.get(type_name, 0) + size
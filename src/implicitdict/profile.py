@@ -0,0 +1,225 @@
+"""Profile the cost of parsing each field of an ImplicitDict type.
+
+Usage:
+    python -m implicitdict.profile package.module:TypeName payload.json [-n ITERATIONS] [--ndjson] [--no-memory]
+
+The payload is parsed repeatedly into the specified type, and the time spent and memory used parsing each field path
+(e.g., "details.volumes[].time_start") are reported.  A payload file ending in .ndjson or .jsonl (or any payload
+with --ndjson) is treated as one JSON object per line, each of which is parsed in each iteration.
+"""
+
+import argparse
+from dataclasses import dataclass
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence, Type
+
+from . import ImplicitDict, _bubble_up_parse_error, _get_hints, _parse_step, _PARSING_ERRORS, _ParseAs, _ParseItems, \
+    _ParseObject
+
+
+ROOT_PATH = "<root>"
+"""Path under which the cost of the entire parse is reported."""
+
+_CAN_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+@dataclass
+class FieldProfile(object):
+    path: str
+    """Field path, with "[]" denoting each item of a list, tuple, or set and "{}" each value of a dict (e.g., "details.volumes[].time_start")."""
+
+    calls: int
+    """Number of values parsed at this path, across all iterations."""
+
+    time: float
+    """Total time spent parsing values at this path (including their nested values), in seconds."""
+
+    retained_blocks: Optional[int] = None
+    """Net number of memory blocks still allocated after parsing values at this path (i.e., excluding temporary
+    allocations freed during the parse), or None if memory was not measured."""
+
+    retained_bytes: Optional[int] = None
+    """Net bytes (per tracemalloc) still allocated after parsing values at this path, or None if memory was not
+    measured."""
+
+    peak_bytes: Optional[int] = None
+    """Sum, over the values parsed at this path, of the peak bytes (per tracemalloc) allocated at any point while parsing
+    the value, including temporary allocations freed before its parse finished.  None if memory was not measured or if
+    tracemalloc can't reset its peak (before Python 3.9)."""
+
+
+def profile_parse(
+        sources: Sequence[dict],
+        parse_type: Type[ImplicitDict],
+        iterations: int = 20,
+        measure_memory: bool = True,
+) -> Dict[str, FieldProfile]:
+    """Parse each source into parse_type repeatedly and measure the cost of parsing each field path.
+
+    Time is measured over all iterations without tracing memory.  If measure_memory is True, an additional iteration is
+    then performed with tracemalloc tracing to measure the memory retained by, and the peak memory used during, the
+    parse of each value.
+
+    Returns:
+        FieldProfile by field path, including ROOT_PATH for the total cost of parsing each source.
+    """
+    parser = _ProfilingParser(measure_memory=False)
+    for _ in range(iterations):
+        for source in sources:
+            parser.measured(ROOT_PATH, source, parse_type)
+    result = {path: FieldProfile(path=path, calls=parser.calls[path], time=parser.times[path]) for path in parser.times}
+
+    if measure_memory:
+        parser = _ProfilingParser(measure_memory=True)
+        tracemalloc.start()
+        try:
+            for source in sources:
+                parser.measured(ROOT_PATH, source, parse_type)
+        finally:
+            tracemalloc.stop()
+        for path, profile in result.items():
+            profile.retained_blocks = parser.blocks.get(path, 0) * iterations
+            profile.retained_bytes = parser.bytes.get(path, 0) * iterations
+            if _CAN_RESET_PEAK:
+                profile.peak_bytes = parser.peak_bytes.get(path, 0) * iterations
+    return result
+
+
+class _ProfilingParser(object):
+    """Equivalent of ImplicitDict.parse and _parse_value which measures the cost of parsing each field path."""
+
+    def __init__(self, measure_memory: bool):
+        self._measure_memory = measure_memory
+        self.calls: Dict[str, int] = {}
+        self.times: Dict[str, float] = {}
+        self.blocks: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+        self.peak_bytes: Dict[str, int] = {}
+        # Highest traced memory observed so far during each measurement in progress (outermost first)
+        self._peaks: List[int] = []
+
+    def measured(self, path: str, value, value_type: Type):
+        if self._measure_memory:
+            blocks0 = sys.getallocatedblocks()
+            bytes0, peak = tracemalloc.get_traced_memory()
+            if _CAN_RESET_PEAK:
+                # tracemalloc tracks a single peak, so the peak so far is credited to the enclosing measurement before
+                # resetting it to measure this one
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                tracemalloc.reset_peak()
+                self._peaks.append(bytes0)
+        t0 = time.perf_counter()
+        try:
+            return self.parse_value(value, value_type, path)
+        finally:
+            self.times[path] = self.times.get(path, 0) + time.perf_counter() - t0
+            self.calls[path] = self.calls.get(path, 0) + 1
+            if self._measure_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                self.blocks[path] = self.blocks.get(path, 0) + sys.getallocatedblocks() - blocks0
+                self.bytes[path] = self.bytes.get(path, 0) + current - bytes0
+                if _CAN_RESET_PEAK:
+                    peak = max(self._peaks.pop(), peak)
+                    if self._peaks:
+                        self._peaks[-1] = max(self._peaks[-1], peak)
+                    self.peak_bytes[path] = self.peak_bytes.get(path, 0) + peak - bytes0
+
+    def parse(self, source: dict, parse_type: Type, path: str):
+        if not isinstance(source, dict):
+            raise ValueError(f'Expected to find dictionary data to populate {parse_type.__name__} object but instead found {type(source).__name__} type')
+        kwargs = {}
+        hints = _get_hints(parse_type)
+        for key, value in source.items():
+            if key in hints:
+                try:
+                    kwargs[key] = self.measured(f"{path}.{key}" if path else key, value, hints[key])
+                except _PARSING_ERRORS as e:
+                    raise _bubble_up_parse_error(e, key)
+            else:
+                kwargs[key] = value
+        return parse_type(**kwargs)
+
+    def parse_value(self, value, value_type: Type, path: str):
+        if path == ROOT_PATH:
+            return self.parse(value, value_type, "")
+
+        step = _parse_step(value, value_type)
+        step_type = type(step)
+        if step_type is _ParseItems:
+            item_path = path + ("[]" if step.keys is None else "{}")
+            result = []
+            for i, (v, item_type) in enumerate(zip(step.values, step.types)):
+                try:
+                    result.append(self.measured(item_path, v, item_type))
+                except _PARSING_ERRORS as e:
+                    raise _bubble_up_parse_error(e, step.location(i))
+            return step.finish(result)
+        elif step_type is _ParseObject:
+            return self.parse(step.source, step.parse_type, path)
+        elif step_type is _ParseAs:
+            return step.finish(self.parse_value(step.value, step.value_type, path))
+        return step
+
+
+def _load_type(target: str) -> Type[ImplicitDict]:
+    module_name, _, type_name = target.partition(":")
+    if not module_name or not type_name:
+        raise ValueError(f"Type must be specified as package.module:TypeName; found '{target}'")
+    result = importlib.import_module(module_name)
+    for name in type_name.split("."):
+        result = getattr(result, name)
+    if not (isinstance(result, type) and issubclass(result, ImplicitDict)):
+        raise ValueError(f"{target} is not an ImplicitDict subclass")
+    return result
+
+
+def _load_sources(path: str, ndjson: bool) -> List[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        if ndjson:
+            return [json.loads(line) for line in f if line.strip()]
+        return [json.load(f)]
+
+
+def _format_count(n: float) -> str:
+    for threshold, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if abs(n) >= threshold:
+            return f"{n / threshold:.1f}{suffix}"
+    return f"{n:.0f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m implicitdict.profile", description="Profile the cost of parsing each field of an ImplicitDict type")
+    parser.add_argument("type", help="ImplicitDict type to parse, as package.module:TypeName")
+    parser.add_argument("payload", help="Path to JSON (or NDJSON) payload to parse")
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="Number of times to parse the payload")
+    parser.add_argument("--ndjson", action="store_true", help="Treat the payload as one JSON object per line")
+    parser.add_argument("--no-memory", action="store_true", help="Do not measure memory usage")
+    args = parser.parse_args(argv)
+
+    parse_type = _load_type(args.type)
+    ndjson = args.ndjson or args.payload.endswith(".ndjson") or args.payload.endswith(".jsonl")
+    sources = _load_sources(args.payload, ndjson)
+    profiles = profile_parse(sources, parse_type, args.iterations, measure_memory=not args.no_memory)
+
+    total = profiles[ROOT_PATH].time
+    print(f"Parsed {len(sources)} {parse_type.__name__} object(s) {args.iterations} time(s) in {total:.3f}s")
+    if not args.no_memory and not _CAN_RESET_PEAK:
+        print("Peak memory is not reported because tracemalloc cannot reset its peak before Python 3.9")
+    for path in sorted(profiles):
+        profile = profiles[path]
+        line = f"{path}: {100 * profile.time / total:.0f}% of parse time, {_format_count(profile.calls)} values"
+        if profile.retained_blocks is not None:
+            line += f", {_format_count(profile.retained_blocks)} blocks retained ({_format_count(profile.retained_bytes)}B)"
+        if profile.peak_bytes is not None:
+            line += f", {_format_count(profile.peak_bytes)}B peak"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
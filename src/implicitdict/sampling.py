@@ -0,0 +1,162 @@
+import json
+import queue
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple, Type
+
+from . import ImplicitDict, _fullname, _parse_hooks
+from .serialization import _encode, _serialize_hooks
+from .validation import validate_native
+
+
+_LOCATION_REGEX = re.compile(r'^At ([A-Za-z0-9_.[\]]*):')
+
+_STOP = object()
+
+
+class SamplingValidator(object):
+    """Validates a sample of the ImplicitDicts parsed and serialized by this process against their JSON Schemas.
+
+    Once installed, 1 in every sample_every ImplicitDict.parse (or parse_async) calls (including for nested types) and 1
+    in every sample_every serializations of an ImplicitDict with implicitdict.serialization are selected for each type.
+    The selected data is snapshotted as JSON in the calling thread, and then validated with validation.validate_native
+    in a background thread, at a rate of at most max_validations_per_second.  Samples selected while max_pending samples
+    are already waiting for validation are dropped.
+
+    Violations are aggregated by type and field path; see `violations`.  Since sampling is performed without
+    synchronization on the hot path, the sampling rate is approximate when types are used from multiple threads.
+    """
+
+    sample_every: int
+    max_validations_per_second: float
+    max_pending: int
+
+    def __init__(self, sample_every: int = 1000, max_validations_per_second: float = 10, max_pending: int = 100):
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be at least 1; found {sample_every}")
+        if max_validations_per_second <= 0:
+            raise ValueError(f"max_validations_per_second must be positive; found {max_validations_per_second}")
+        self.sample_every = sample_every
+        self.max_validations_per_second = max_validations_per_second
+        self.max_pending = max_pending
+
+        self._operations: Dict[Type, int] = {}
+        self._pending: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._violations: Dict[Tuple[str, str], int] = {}
+        self._validated = 0
+        self._dropped = 0
+        self._errors = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def install(self) -> None:
+        """Start sampling parse and serialize operations."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="implicitdict-sampling", daemon=True)
+            self._thread.start()
+        if self._on_parse not in _parse_hooks:
+            _parse_hooks.append(self._on_parse)
+        if self._on_serialize not in _serialize_hooks:
+            _serialize_hooks.append(self._on_serialize)
+
+    def uninstall(self, timeout: Optional[float] = None) -> None:
+        """Stop sampling and stop the background thread.
+
+        Samples still pending validation are discarded; call `flush` first to validate them.
+        """
+        if self._on_parse in _parse_hooks:
+            _parse_hooks.remove(self._on_parse)
+        if self._on_serialize in _serialize_hooks:
+            _serialize_hooks.remove(self._on_serialize)
+        if self._thread is not None:
+            self._stopping = True
+            self._pending.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+            self._stopping = False
+
+    def __enter__(self) -> "SamplingValidator":
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.uninstall()
+
+    def flush(self) -> None:
+        """Wait until all pending samples have been validated."""
+        self._pending.join()
+
+    def violations(self) -> Dict[Tuple[str, str], int]:
+        """Number of samples found to violate their schema, by type full name and path of the (first) violation.
+
+        The path is in the same format as ImplicitDict.parse errors (e.g., "details.volumes[0].time_start"), or an
+        empty string for violations at the top level of the object.
+        """
+        with self._lock:
+            return dict(self._violations)
+
+    def stats(self) -> Dict[str, int]:
+        """Number of samples validated, dropped because too many were pending, and which failed to be validated."""
+        with self._lock:
+            return {"validated": self._validated, "dropped": self._dropped, "errors": self._errors}
+
+    def _on_parse(self, source: dict, parse_type: Type) -> None:
+        self._sample(source, parse_type)
+
+    def _on_serialize(self, obj) -> None:
+        if isinstance(obj, ImplicitDict):
+            self._sample(obj, type(obj))
+
+    def _sample(self, value, t: Type) -> None:
+        count = self._operations.get(t, 0) + 1
+        if count < self.sample_every:
+            self._operations[t] = count
+            return
+        self._operations[t] = 0
+        try:
+            snapshot = _encode(value)
+        except (TypeError, ValueError):
+            with self._lock:
+                self._errors += 1
+            return
+        try:
+            self._pending.put_nowait((t, snapshot))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+
+    def _run(self) -> None:
+        interval = 1 / self.max_validations_per_second
+        next_validation = time.monotonic()
+        while True:
+            item = self._pending.get()
+            try:
+                if item is _STOP:
+                    return
+                if self._stopping:
+                    continue
+                delay = next_validation - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_validation = max(next_validation, time.monotonic()) + interval
+                self._validate(*item)
+            finally:
+                self._pending.task_done()
+
+    def _validate(self, t: Type, snapshot: str) -> None:
+        try:
+            validate_native(json.loads(snapshot), t)
+            violation = None
+        except ValueError as e:
+            m = _LOCATION_REGEX.search(str(e))
+            violation = (_fullname(t), m.group(1) if m else "")
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            return
+        with self._lock:
+            self._validated += 1
+            if violation is not None:
+                self._violations[violation] = self._violations.get(violation, 0) + 1
@@ -0,0 +1,159 @@
+import enum
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from typing import get_args, get_origin, Dict, Optional, Type
+
+from . import ImplicitDict, _dependencies_of, _fullname, _get_fields, _get_hints, _KEY_DISCRIMINATOR
+from .jsonschema import make_json_schema, SchemaVars, SchemaVarsResolver
+
+
+_FORMAT_VERSION = 1
+"""Version of the cache entry format and of the fingerprint computation; entries with a different version are stale."""
+
+
+class SchemaCache(object):
+    """On-disk cache of the JSON Schemas produced by jsonschema.make_json_schema.
+
+    Each schema is stored in its own file in the cache directory along with a fingerprint of everything its content
+    depends on: the type's qualified name, its fields and their resolved type hints (including enum values and the
+    $ref paths to other types), defaults, docstrings, and the SchemaVars for the type.  When a schema is requested,
+    fresh entries are loaded directly and only stale or missing entries are regenerated (and then written back to the
+    cache).
+
+    Entries are written to a temporary file and then atomically moved into place, so multiple processes may safely
+    share a cache directory.
+    """
+
+    directory: str
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def make_json_schema(
+            self,
+            schema_type: Type[ImplicitDict],
+            schema_vars_resolver: SchemaVarsResolver,
+            schema_repository: Dict[str, dict],
+    ) -> None:
+        """Equivalent of jsonschema.make_json_schema which uses and populates this cache."""
+        fingerprints = {}
+        for t in _dependencies_of([schema_type]):
+            name = schema_vars_resolver(t).name
+            if name not in schema_repository:
+                fingerprints[name] = (t, _fingerprint(t, _get_hints(t), schema_vars_resolver))
+
+        loaded = set()
+        for name, (t, fingerprint) in fingerprints.items():
+            schema = self._load(name, fingerprint)
+            if schema is not None:
+                schema_repository[name] = schema
+                loaded.add(name)
+
+        for name, (t, fingerprint) in fingerprints.items():
+            if name in loaded:
+                continue
+            # Types reachable only through freshly-loaded types would not be generated by the recursion of
+            # make_json_schema, so each stale type is generated explicitly
+            make_json_schema(t, schema_vars_resolver, schema_repository)
+            self._store(name, fingerprint, schema_repository[name])
+
+    def _path_for(self, name: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(name.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self, name: str, fingerprint: str) -> Optional[dict]:
+        try:
+            with open(self._path_for(name), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("name") != name or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry.get("schema")
+
+    def _store(self, name: str, fingerprint: str, schema: dict) -> None:
+        content = json.dumps({"name": name, "fingerprint": fingerprint, "schema": schema})
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, self._path_for(name))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def _fingerprint(t: Type[ImplicitDict], hints: Dict[str, Type], schema_vars_resolver: SchemaVarsResolver) -> str:
+    schema_vars = schema_vars_resolver(t)
+    all_fields, _ = _get_fields(t)
+    fields = {}
+    for field in sorted(all_fields):
+        field_info = {}
+        if field in hints:
+            field_info["type"] = _describe_type(hints[field], t, schema_vars_resolver)
+        if hasattr(t, field):
+            default = getattr(t, field)
+            field_info["default"] = json.dumps(default, sort_keys=True, default=lambda v: _fullname(type(v)))
+            if field not in hints:
+                field_info["type"] = _describe_type(type(default), t, schema_vars_resolver)
+        fields[field] = field_info
+    description = {
+        "version": _FORMAT_VERSION,
+        "qualname": _fullname(t),
+        "fields": fields,
+        # Inherited class docstrings and field docstrings are defined by the source of the classes declaring them
+        "doc": t.__doc__,
+        "sources": [_source_hash(base) for base in t.__mro__ if issubclass(base, ImplicitDict)],
+        "generator": _source_hash(SchemaVars),
+        "schema_vars": [schema_vars.name, schema_vars.schema_id, schema_vars.description],
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _describe_type(value_type, context: Type, schema_vars_resolver: SchemaVarsResolver):
+    """Describe everything about value_type which affects its JSON Schema within context's schema."""
+    generic_type = get_origin(value_type)
+    if generic_type:
+        return [repr(generic_type)] + [_describe_type(arg, context, schema_vars_resolver) for arg in get_args(value_type)]
+    if not isinstance(value_type, type):
+        return repr(value_type)
+    if issubclass(value_type, ImplicitDict):
+        description = {"$ref": schema_vars_resolver(value_type).path_to(value_type, context)}
+        discriminator = getattr(value_type, _KEY_DISCRIMINATOR, None)
+        if discriminator is not None:
+            # The discriminator value of a type in a tagged union is included in the schema of the union
+            description["discriminator"] = [discriminator, repr(getattr(value_type, discriminator, None)), repr(_get_hints(value_type).get(discriminator))]
+        return description
+    description = {"mro": [_fullname(base) for base in value_type.__mro__]}
+    if issubclass(value_type, enum.Enum):
+        description["values"] = [repr(v.value) for v in value_type]
+    if getattr(value_type, "__orig_bases__", None):
+        description["orig_base"] = _describe_type(value_type.__orig_bases__[0], context, schema_vars_resolver)
+    return description
+
+
+_source_hashes: Dict[str, Optional[str]] = {}
+
+
+def _source_hash(obj) -> Optional[str]:
+    """Hash of the source of the module defining obj, or None if that source is not available."""
+    if obj.__module__ in _source_hashes:
+        return _source_hashes[obj.__module__]
+    else:
+        result = None
+        module = sys.modules.get(obj.__module__)
+        try:
+            path = inspect.getsourcefile(module) if module is not None else None
+            if path:
+                with open(path, "rb") as f:
+                    result = hashlib.sha256(f.read()).hexdigest()
+        except (OSError, TypeError):
+            pass
+        return _source_hashes.setdefault(obj.__module__, result)
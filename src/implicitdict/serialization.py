@@ -0,0 +1,223 @@
+from array import array
+import datetime
+import enum
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Callable, Dict, Iterator, List, Optional, Set, TextIO
+
+from . import ImplicitDict, _get_fields, StringBasedDateTime, StringBasedTimeDelta
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Default approximate size, in characters, of the chunks produced by iter_json."""
+
+_serialize_hooks: List[Callable[[object], None]] = []
+"""Functions called with the top-level value of each serialization performed by this module."""
+
+_ITEM_SEPARATOR = ", "
+_KEY_SEPARATOR = ": "
+
+
+def _to_json_compatible(value):
+    """Convert a value the standard JSON encoder does not understand into one it does."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime.datetime):
+        return StringBasedDateTime(value)
+    if isinstance(value, datetime.timedelta):
+        return StringBasedTimeDelta(value)
+    if isinstance(value, (set, frozenset)):
+        # Sorted when possible, so that equal sets are always serialized identically
+        try:
+            return sorted(value)
+        except TypeError:
+            return list(value)
+    if isinstance(value, array):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# The standard encoder (and its C acceleration) natively handles dicts (including ImplicitDicts), lists, and str/int/float
+# subclasses (including StringBasedDateTime, StringBasedTimeDelta, and str/int enums), so only the remaining types need
+# to be converted.
+_encoder = json.JSONEncoder(default=_to_json_compatible, separators=(_ITEM_SEPARATOR, _KEY_SEPARATOR))
+
+
+def _encode(obj) -> str:
+    try:
+        return _encoder.encode(obj)
+    except TypeError:
+        # The standard encoder enumerates the items of dict subclasses with their items method, which is shadowed in
+        # ImplicitDicts with a field named "items" (e.g., a page of results), so such values are encoded by
+        # _iterencode instead (which raises the same error if the value is actually not serializable).
+        return "".join(_iterencode(obj))
+
+
+def dumps(obj) -> str:
+    """Serialize the specified ImplicitDict (or other JSON-compatible value) to a JSON string.
+
+    The output is identical to `json.dumps(obj)` for values json.dumps supports.  In addition, datetimes and
+    timedeltas are serialized like StringBasedDateTime and StringBasedTimeDelta, enums are serialized as their values,
+    tuples and arrays are serialized as lists, and sets are serialized as lists sorted by value (when their items are
+    comparable).
+    """
+    if _serialize_hooks:
+        for hook in _serialize_hooks:
+            hook(obj)
+    return _encode(obj)
+
+
+def to_json_bytes(obj) -> bytes:
+    """Serialize the specified ImplicitDict (or other JSON-compatible value) to UTF-8-encoded JSON; see `dumps`."""
+    if _serialize_hooks:
+        for hook in _serialize_hooks:
+            hook(obj)
+    return _encode(obj).encode("utf-8")
+
+
+def iter_json(obj, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Serialize the specified ImplicitDict (or other JSON-compatible value) to JSON incrementally.
+
+    The full JSON string is never materialized; instead, it is produced in chunks of approximately chunk_size characters
+    (or slightly more, depending on the size of individual leaf values).  The concatenation of all chunks is identical
+    to `dumps(obj)`.
+    """
+    if _serialize_hooks:
+        for hook in _serialize_hooks:
+            hook(obj)
+    buffer = []
+    size = 0
+    for fragment in _iterencode(obj):
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def dump(obj, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Serialize the specified ImplicitDict (or other JSON-compatible value) to a text file incrementally; see `iter_json`."""
+    for chunk in iter_json(obj, chunk_size):
+        fp.write(chunk)
+
+
+def _float_str(value: float) -> str:
+    if value != value:
+        return "NaN"
+    elif value == float("inf"):
+        return "Infinity"
+    elif value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+_LEAF_ENCODERS = {
+    str: encode_basestring_ascii,
+    StringBasedDateTime: encode_basestring_ascii,
+    StringBasedTimeDelta: encode_basestring_ascii,
+    int: int.__repr__,
+    float: _float_str,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+"""Encoders for common leaf value types, by exact type."""
+
+
+def _key_fragment(key) -> str:
+    # Non-string keys are converted to strings in the same way as json.dumps
+    if isinstance(key, str):
+        return encode_basestring_ascii(key) + _KEY_SEPARATOR
+    elif key is True:
+        key = "true"
+    elif key is False:
+        key = "false"
+    elif key is None:
+        key = "null"
+    elif isinstance(key, float):
+        key = _float_str(key)
+    elif isinstance(key, int):
+        key = int.__repr__(key)
+    else:
+        raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+    return '"' + key + '"' + _KEY_SEPARATOR
+
+
+_KEY_FRAGMENTS = "__implicitdict_key_fragments__"
+
+
+def _key_fragments(implicitdict_type: type) -> Dict[str, str]:
+    """Get the pre-encoded JSON fragments introducing each field of the specified ImplicitDict type.
+
+    The fragments are cached in an attribute of the type itself (not inherited by subclasses), like its FieldsInfo.
+    """
+    fragments = implicitdict_type.__dict__.get(_KEY_FRAGMENTS)
+    if fragments is None:
+        all_fields, _ = _get_fields(implicitdict_type)
+        fragments = {f: _key_fragment(f) for f in all_fields}
+        setattr(implicitdict_type, _KEY_FRAGMENTS, fragments)
+    return fragments
+
+
+def _iterencode(value, markers: Optional[Set[int]] = None) -> Iterator[str]:
+    """Encode value to JSON fragments.
+
+    Args:
+        value: Value to encode.
+        markers: IDs of the containers currently being encoded, which enclose value.  As with json.JSONEncoder's
+            check_circular, encountering one of these again raises ValueError rather than recursing indefinitely.
+    """
+    if isinstance(value, (dict, list, tuple)) and value:
+        if markers is None:
+            markers = set()
+        marker = id(value)
+        if marker in markers:
+            raise ValueError("Circular reference detected")
+        markers.add(marker)
+
+    if isinstance(value, dict):
+        if not value:
+            yield "{}"
+            return
+        fragments = _key_fragments(type(value)) if isinstance(value, ImplicitDict) else {}
+        prefix = "{"
+        for k, v in dict.items(value):
+            key_fragment = fragments.get(k) or _key_fragment(k)
+            leaf_encoder = _LEAF_ENCODERS.get(type(v))
+            if leaf_encoder is not None:
+                yield prefix + key_fragment + leaf_encoder(v)
+            else:
+                yield prefix + key_fragment
+                yield from _iterencode(v, markers)
+            prefix = _ITEM_SEPARATOR
+        yield "}"
+        markers.remove(marker)
+
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            yield "[]"
+            return
+        prefix = "["
+        for v in value:
+            leaf_encoder = _LEAF_ENCODERS.get(type(v))
+            if leaf_encoder is not None:
+                yield prefix + leaf_encoder(v)
+            else:
+                yield prefix
+                yield from _iterencode(v, markers)
+            prefix = _ITEM_SEPARATOR
+        yield "]"
+        markers.remove(marker)
+
+    else:
+        leaf_encoder = _LEAF_ENCODERS.get(type(value))
+        if leaf_encoder is not None:
+            yield leaf_encoder(value)
+        elif isinstance(value, (str, int, float)):
+            # Subclasses (e.g., str and int enums) are encoded like their base types
+            yield _encoder.encode(value)
+        else:
+            # Converted values (e.g., sets) may contain ImplicitDicts, so they are encoded by _iterencode as well
+            yield from _iterencode(_to_json_compatible(value), markers)
@@ -0,0 +1,391 @@
+import json
+import numbers
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING
+
+from . import ImplicitDict, _bubble_up_parse_error, _dependencies_of, _fullname
+from .serialization import dumps
+
+# The jsonschema package is only imported when a jsonschema validator is first compiled, so that validate_native (and
+# SamplingValidator) do not incur its import time.  JSON Schema generation is only imported when the schemas are first
+# generated.
+if TYPE_CHECKING:
+    import jsonschema
+    from .jsonschema import SchemaVars
+
+
+_URN_PREFIX = "urn:implicitdict:"
+
+_validators: Dict[Type, "jsonschema.Draft202012Validator"] = {}
+
+
+def validate(instance: Union[ImplicitDict, dict], t: Type[ImplicitDict]) -> None:
+    """Validate the specified data against the JSON Schema generated for the specified ImplicitDict type.
+
+    The JSON Schema for t (and all the types it depends upon) is generated with jsonschema.make_json_schema and compiled
+    into a validator the first time t is validated; the compiled validator is then reused for all subsequent validations
+    against t.
+
+    Args:
+        instance: Data to validate.  ImplicitDict instances are validated according to their JSON serialization; any
+            other dict is validated as-is, so it should contain only JSON-compatible values (e.g., from json.loads).
+        t: ImplicitDict subclass describing the expected content of instance.
+
+    Raises:
+        ValueError: The instance does not conform to the JSON Schema for t.  The message describes the most relevant
+            violation, and its location within the instance.
+    """
+    from jsonschema.exceptions import best_match
+
+    if isinstance(instance, ImplicitDict):
+        instance = json.loads(dumps(instance))
+    error = best_match(validator_for(t).iter_errors(instance))
+    if error is not None:
+        if error.absolute_path:
+            raise ValueError(f"At {_format_path(error.absolute_path)}: {error.message}")
+        raise ValueError(error.message)
+
+
+def validator_for(t: Type[ImplicitDict]) -> "jsonschema.Draft202012Validator":
+    """Get the compiled jsonschema validator for the JSON Schema of the specified ImplicitDict type."""
+    result = _validators.get(t)
+    if result is None:
+        result = _validators.setdefault(t, _compile_validator(t))
+    return result
+
+
+def _schema_vars(t: Type) -> "SchemaVars":
+    from .jsonschema import SchemaVars
+    return SchemaVars(
+        name=_URN_PREFIX + _fullname(t),
+        path_to=lambda t_dest, t_src: _URN_PREFIX + _fullname(t_dest),
+        schema_id=_URN_PREFIX + _fullname(t),
+    )
+
+
+def _compile_validator(t: Type[ImplicitDict]) -> "jsonschema.Draft202012Validator":
+    import jsonschema
+
+    # Each schema in the repository is identified by its URN, so the repository can be used directly as the store of
+    # the validator's resolver and no $ref will need to be fetched or re-parsed.
+    repository = _schema_repository(t)
+    schema = repository[_schema_vars(t).name]
+    resolver = jsonschema.RefResolver.from_schema(schema, store=repository)
+    return jsonschema.Draft202012Validator(schema, resolver=resolver)
+
+
+def _schema_repository(t: Type[ImplicitDict]) -> Dict[str, dict]:
+    """Generate the JSON Schemas for t and all the types it depends upon, by URN."""
+    from .jsonschema import make_json_schema
+
+    repository = {}
+    make_json_schema(t, _schema_vars, repository)
+    return repository
+
+
+def _format_path(path) -> str:
+    result = ""
+    for element in path:
+        if isinstance(element, int):
+            result += f"[{element}]"
+        elif result:
+            result += f".{element}"
+        else:
+            result = str(element)
+    return result
+
+
+def validate_native(source: dict, t: Type[ImplicitDict]) -> None:
+    """Validate the specified JSON data against the JSON Schema for the specified ImplicitDict type without jsonschema.
+
+    The JSON Schema for t (and all the types it depends upon) is generated with jsonschema.make_json_schema and compiled
+    into native checks the first time t is validated, so exactly the same data is accepted as by `validate` without
+    interpreting the schema on each validation.  No ImplicitDict objects are constructed.
+
+    Args:
+        source: JSON data (e.g., from json.loads) to validate.
+        t: ImplicitDict subclass describing the expected content of source.
+
+    Raises:
+        ValueError: The source does not conform to the JSON Schema for t.  The message describes the first violation
+            found, and its location within the source.
+    """
+    check = _native_checks.get(t)
+    if check is None:
+        check = _native_checks.setdefault(t, _SchemaCompiler(t).compile_ref(_schema_vars(t).name))
+    check(source)
+
+
+_Check = Callable[[object], None]
+"""Function which raises ValueError when its argument does not conform to a particular JSON Schema."""
+
+_native_checks: Dict[Type, _Check] = {}
+
+_ANNOTATIONS = {"$schema", "$id", "description", "format", "discriminator"}
+"""Keywords of the generated JSON Schemas which do not affect validation (jsonschema does not assert formats by
+default, and the discriminator of a oneOf is informational)."""
+
+_ARRAY_KEYWORDS = {"items", "prefixItems", "minItems", "maxItems", "uniqueItems"}
+_OBJECT_KEYWORDS = {"properties", "required", "additionalProperties"}
+
+
+class _ObjectCheck(object):
+    """Check of the object keywords of a JSON Schema (e.g., the schema generated for an ImplicitDict type)."""
+
+    def __init__(self, type_name: Optional[str]):
+        self._type_name = type_name
+        self._required: Tuple[str, ...] = ()
+        self._checks: Dict[str, _Check] = {}
+        self._additional: Optional[_Check] = None
+
+    def __call__(self, value) -> None:
+        if not isinstance(value, dict):
+            if self._type_name is not None:
+                raise ValueError(f"Expected object for {self._type_name} but found {type(value).__name__} value")
+            # Object keywords do not apply to other values
+            return
+        for field in self._required:
+            if field not in value:
+                raise ValueError('Required field "{}" not specified in {}'.format(field, self._type_name or "object"))
+        checks = self._checks
+        additional = self._additional
+        for key, v in dict.items(value):
+            check = checks.get(key, additional)
+            if check is not None:
+                try:
+                    check(v)
+                except ValueError as e:
+                    raise _bubble_up_parse_error(e, key)
+
+
+class _SchemaCompiler(object):
+    """Compiles the JSON Schemas generated for an ImplicitDict type (and the types it depends upon) into checks.
+
+    Only the keywords produced by jsonschema.make_json_schema are supported, so a new kind of schema produced by the
+    generator fails to compile rather than being checked differently than by `validate`.
+    """
+
+    def __init__(self, t: Type[ImplicitDict]):
+        self._repository = _schema_repository(t)
+        self._type_names = {_schema_vars(d).name: d.__name__ for d in _dependencies_of([t])}
+        self._definitions: Dict[str, _ObjectCheck] = {}
+
+    def compile_ref(self, ref: str) -> _Check:
+        result = self._definitions.get(ref)
+        if result is not None:
+            return result
+        if ref not in self._repository:
+            raise NotImplementedError(f"Native validation of $ref {ref} outside the generated schemas is not supported")
+        schema = self._repository[ref]
+        if schema.get("type") != "object" or set(schema) - _ANNOTATIONS - _OBJECT_KEYWORDS - {"type"}:
+            raise NotImplementedError(f"Native validation of schema {ref} with keywords {sorted(schema)} is not supported")
+        # Register this check before compiling its properties so that recursive references resolve to it
+        result = _ObjectCheck(self._type_names.get(ref, ref))
+        self._definitions[ref] = result
+        self._fill_object_check(result, schema)
+        return result
+
+    def compile(self, schema: dict) -> _Check:
+        unsupported = set(schema) - _ANNOTATIONS - _ARRAY_KEYWORDS - _OBJECT_KEYWORDS - {"type", "enum", "const", "$ref", "oneOf", "anyOf"}
+        if unsupported:
+            raise NotImplementedError(f"Native validation of JSON Schema keywords {sorted(unsupported)} is not supported")
+
+        checks = []
+        if "type" in schema:
+            checks.append(_check_type(schema["type"]))
+        if "enum" in schema:
+            checks.append(_check_enum(tuple(schema["enum"])))
+        if "const" in schema:
+            checks.append(_check_enum((schema["const"],)))
+        if _ARRAY_KEYWORDS.intersection(schema):
+            checks.append(self._compile_array_check(schema))
+        if _OBJECT_KEYWORDS.intersection(schema):
+            object_check = _ObjectCheck(None)
+            self._fill_object_check(object_check, schema)
+            checks.append(object_check)
+        # Referenced schemas are checked after the keywords alongside them, so that the alternatives of a tagged union
+        # (which constrain the discriminator alongside a $ref) are rejected by the discriminator before the $ref
+        if "$ref" in schema:
+            checks.append(self.compile_ref(schema["$ref"]))
+        if "anyOf" in schema:
+            checks.append(self._compile_any_of(schema["anyOf"]))
+        if "oneOf" in schema:
+            checks.append(self._compile_one_of(schema["oneOf"]))
+
+        if not checks:
+            return _check_any
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value):
+            for check in checks:
+                check(value)
+        return check_all
+
+    def _fill_object_check(self, result: _ObjectCheck, schema: dict) -> None:
+        result._required = tuple(schema.get("required", ()))
+        result._checks = {k: self.compile(v) for k, v in schema.get("properties", {}).items()}
+        if "additionalProperties" in schema:
+            result._additional = self.compile(schema["additionalProperties"])
+
+    def _compile_array_check(self, schema: dict) -> _Check:
+        prefix_checks = [self.compile(s) for s in schema.get("prefixItems", ())]
+        item_check = self.compile(schema["items"]) if "items" in schema else None
+        min_items = schema.get("minItems", 0)
+        max_items = schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+
+        def check_array(value):
+            if not isinstance(value, list):
+                # Array keywords do not apply to other values
+                return
+            if len(value) < min_items or (max_items is not None and len(value) > max_items):
+                if min_items == max_items:
+                    raise ValueError(f"Expected array of {min_items} items but found {len(value)} items")
+                raise ValueError(f"Expected array of {min_items} to {max_items} items but found {len(value)} items")
+            for i, item in enumerate(value):
+                check = prefix_checks[i] if i < len(prefix_checks) else item_check
+                if check is not None:
+                    try:
+                        check(item)
+                    except ValueError as e:
+                        raise _bubble_up_parse_error(e, f"[{i}]")
+            if unique:
+                _check_unique_items(value)
+        return check_array
+
+    def _compile_any_of(self, schemas: List[dict]) -> _Check:
+        checks = [self.compile(s) for s in schemas]
+
+        def check_any_of(value):
+            errors = []
+            for check in checks:
+                try:
+                    check(value)
+                    return
+                except ValueError as e:
+                    errors.append(str(e))
+            raise ValueError(f"Value does not conform to any alternative ({'; '.join(errors)})")
+        return check_any_of
+
+    def _compile_one_of(self, schemas: List[dict]) -> _Check:
+        # Alternatives constraining only the type (e.g., null, for Optionals) are tested without raising errors
+        predicates = [_type_predicate(s["type"]) for s in schemas if _is_type_only(s)]
+        checks = [self.compile(s) for s in schemas if not _is_type_only(s)]
+
+        def check_one_of(value):
+            matches = 0
+            for predicate in predicates:
+                if predicate(value):
+                    matches += 1
+            errors = []
+            for check in checks:
+                try:
+                    check(value)
+                    matches += 1
+                except ValueError as e:
+                    errors.append(str(e))
+            if matches == 0:
+                raise ValueError(f"Value does not conform to any alternative ({'; '.join(errors) or type(value).__name__ + ' value'})")
+            if matches > 1:
+                raise ValueError(f"Value conforms to {matches} alternatives but must conform to exactly one")
+        return check_one_of
+
+
+def _check_unique_items(value: list) -> None:
+    # Items have already been checked against the set's item type, so booleans are never compared to numbers (which
+    # JSON Schema considers distinct)
+    try:
+        unique = len(set(value)) == len(value)
+    except TypeError:
+        # Unhashable items (e.g., arrays for Set[Tuple[int, int]])
+        unique = all(value[i] != value[j] for i in range(len(value)) for j in range(i))
+    if not unique:
+        raise ValueError("Expected array of unique items but found duplicate items")
+
+
+def _check_any(value) -> None:
+    pass
+
+
+def _is_boolean(value) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_number(value) -> bool:
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return True
+    return not isinstance(value, bool) and isinstance(value, numbers.Number)
+
+
+def _is_integer(value) -> bool:
+    return not isinstance(value, bool) and (isinstance(value, int) or (isinstance(value, float) and value.is_integer()))
+
+
+def _is_string(value) -> bool:
+    return isinstance(value, str)
+
+
+def _is_object(value) -> bool:
+    return isinstance(value, dict)
+
+
+def _is_array(value) -> bool:
+    return isinstance(value, list)
+
+
+def _is_null(value) -> bool:
+    return value is None
+
+
+_TYPE_PREDICATES = {
+    "boolean": _is_boolean,
+    "number": _is_number,
+    "integer": _is_integer,
+    "string": _is_string,
+    "object": _is_object,
+    "array": _is_array,
+    "null": _is_null,
+}
+
+
+def _is_type_only(schema: dict) -> bool:
+    return "type" in schema and not (set(schema) - _ANNOTATIONS - {"type"})
+
+
+def _type_predicate(schema_type: Union[str, List[str]]) -> Callable[[object], bool]:
+    if isinstance(schema_type, str):
+        return _TYPE_PREDICATES[schema_type]
+    predicates = [_TYPE_PREDICATES[t] for t in schema_type]
+
+    def is_any_type(value):
+        for predicate in predicates:
+            if predicate(value):
+                return True
+        return False
+    return is_any_type
+
+
+def _check_type(schema_type: Union[str, List[str]]) -> _Check:
+    if schema_type == "string":
+        # Most common, so checked without calling a predicate
+        def check_string(value):
+            if not isinstance(value, str):
+                raise ValueError(f"Expected string but found {type(value).__name__} value {value!r}")
+        return check_string
+
+    predicate = _type_predicate(schema_type)
+    names = schema_type if isinstance(schema_type, str) else " or ".join(schema_type)
+
+    def check_type(value):
+        if not predicate(value):
+            raise ValueError(f"Expected {names} but found {type(value).__name__} value {value!r}")
+    return check_type
+
+
+def _check_enum(values: tuple) -> _Check:
+    # JSON Schema distinguishes booleans from numbers, unlike Python equality
+    def check_enum(value):
+        if not any(value == v and isinstance(value, bool) == isinstance(v, bool) for v in values):
+            raise ValueError(f"Value {value!r} is not one of {list(values)}")
+    return check_enum
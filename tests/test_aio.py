@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from implicitdict import ImplicitDict
+from implicitdict.aio import iter_json_bytes, write_json
+
+from .test_stacktrace import MassiveNestingData
+from .test_types import CollectionData, ContainerData, NestedDefinitionsData
+
+
+class _RecordingWriter(object):
+    def __init__(self):
+        self.chunks = []
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+def _values() -> list:
+    return [ContainerData.example_value() for _ in range(50)] + [NestedDefinitionsData.example_value()]
+
+
+def test_iter_json_bytes():
+    values = _values()
+
+    async def collect():
+        return [chunk async for chunk in iter_json_bytes(values, chunk_size=256)]
+
+    chunks = asyncio.run(collect())
+    assert len(chunks) > 10
+    assert all(isinstance(chunk, bytes) and len(chunk) < 512 for chunk in chunks)
+    assert json.loads(b"".join(chunks)) == json.loads(json.dumps(values))
+
+
+def test_event_loop_stays_responsive():
+    values = _values()
+    ticks = []
+
+    async def ticker(done: asyncio.Event):
+        while not done.is_set():
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def serialize():
+        done = asyncio.Event()
+        ticker_task = asyncio.create_task(ticker(done))
+        await asyncio.sleep(0)
+        writer = _RecordingWriter()
+        await write_json(writer, values, chunk_size=256)
+        done.set()
+        await ticker_task
+        return writer
+
+    writer = asyncio.run(serialize())
+    assert len(writer.chunks) > 10
+    assert writer.drains == len(writer.chunks)
+    assert len(ticks) >= len(writer.chunks)
+    assert b"".join(writer.chunks).decode("utf-8") == json.dumps(values)
+
+
+def _parse_both(source, parse_type, **kwargs):
+    try:
+        expected = ImplicitDict.parse(source, parse_type)
+    except (ValueError, TypeError) as e:
+        expected = e
+    try:
+        actual = asyncio.run(ImplicitDict.parse_async(source, parse_type, **kwargs))
+    except (ValueError, TypeError) as e:
+        actual = e
+    return expected, actual
+
+
+def test_parse_async():
+    for parse_type, source in (
+            (ContainerData, json.loads(json.dumps(ContainerData.example_value()))),
+            (NestedDefinitionsData, json.loads(json.dumps(NestedDefinitionsData.example_value()))),
+            (MassiveNestingData, json.loads(json.dumps(MassiveNestingData.example_value()))),
+    ):
+        for kwargs in ({}, {"time_slice": 0}, {"executor": ThreadPoolExecutor(1), "offload_threshold": 0}):
+            expected, actual = _parse_both(source, parse_type, **kwargs)
+            assert type(actual) is type(expected)
+            assert json.dumps(actual) == json.dumps(expected)
+
+
+def test_parse_async_errors():
+    mutations = [
+        lambda d: d.update(bar="wrong kind of value"),
+        lambda d: d.update(bar=[]),
+        lambda d: d.update(children="this gets treated as a list"),
+        lambda d: d.update(children=0),
+        lambda d: d["children"][0].update(bar="wrong kind of value"),
+        lambda d: d["children"][1]["children"][0]["children"][2].update(children=2),
+        lambda d: d["children"][1]["children"][0]["children"].append("not a dict"),
+    ]
+    for mutate in mutations:
+        source = json.loads(json.dumps(MassiveNestingData.example_value()))
+        mutate(source)
+        for kwargs in ({"time_slice": 0}, {"executor": ThreadPoolExecutor(1), "offload_threshold": 0}):
+            expected, actual = _parse_both(source, MassiveNestingData, **kwargs)
+            assert isinstance(expected, Exception)
+            assert type(actual) is type(expected)
+            assert str(actual) == str(expected)
+
+
+def test_parse_async_collections():
+    source = json.loads(json.dumps(CollectionData.example_value(), default=sorted))
+    for overrides in (
+            {},
+            {"position": (3, 4), "ids": range(3), "tags": {"a"}, "measurements": "123"},
+            {"position": [1, 2, 3]},
+            {"labeled_point": ["origin", {"x": 0}]},
+            {"measurements": [1, 2, "three"]},
+            {"tags": 1},
+            {"points_by_name": {"corner": "not a dict"}},
+            {"pairs": [[1, 2], [3]]},
+    ):
+        expected, actual = _parse_both(dict(source, **overrides), CollectionData, time_slice=0)
+        assert type(actual) is type(expected)
+        if isinstance(expected, Exception):
+            assert str(actual) == str(expected)
+        else:
+            assert actual == expected
+            assert all(type(actual[k]) is type(expected[k]) for k in expected)
+
+
+def test_parse_async_yields_to_event_loop():
+    source = {"value_list": [str(i) for i in range(1000)], "single_value": "foo", "optional_value_list": [],
+              "list_of_lists": [[str(i) for i in range(10)] for _ in range(100)]}
+    ticks = []
+
+    async def ticker(done: asyncio.Event):
+        while not done.is_set():
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def parse():
+        done = asyncio.Event()
+        ticker_task = asyncio.create_task(ticker(done))
+        await asyncio.sleep(0)
+        result = await ImplicitDict.parse_async(source, ContainerData, time_slice=0)
+        done.set()
+        await ticker_task
+        return result
+
+    result = asyncio.run(parse())
+    assert result == ImplicitDict.parse(source, ContainerData)
+    assert len(ticks) > 1000
@@ -1,4 +1,11 @@
-from .test_types import ContainerData
+import json
+
+import pytest
+
+from implicitdict import ImplicitDict
+from implicitdict.serialization import dumps
+
+from .test_types import CollectionData, ContainerData, Point
 
 
 def test_container_item_value_casting():
@@ -24,3 +31,54 @@ def test_container_item_value_casting():
     assert len(containers.list_of_lists[1]) == 1
     for v in containers.list_of_lists[1]:
         assert v.is_special
+
+
+def test_collection_parsing():
+    data: CollectionData = CollectionData.example_value()
+
+    assert data.position == (1.5, 2.0)
+    assert isinstance(data.position, tuple)
+    assert isinstance(data.position[1], float)
+    assert data.labeled_point[0] == "origin"
+    assert isinstance(data.labeled_point[1], Point)
+    assert data.measurements == (3, 1, 4, 1, 5)
+    assert data.tags == {"a", "b"}
+    assert isinstance(data.tags, set)
+    assert data.ids == frozenset({1, 2})
+    assert isinstance(data.ids, frozenset)
+    assert isinstance(data.points, list)
+    assert isinstance(data.points[0], Point)
+    assert isinstance(data.points_by_name, dict)
+    assert isinstance(data.points_by_name["corner"], Point)
+    assert data.pairs == [(1, 2), (3, 4)]
+
+    # Non-list iterables are accepted too
+    data = ImplicitDict.parse(dict(json.loads(dumps(data)), position=iter([3, 4]), ids=(5, 5)), CollectionData)
+    assert data.position == (3.0, 4.0)
+    assert data.ids == frozenset({5})
+
+
+def test_collection_round_trip():
+    data: CollectionData = CollectionData.example_value()
+    serialized = dumps(data)
+    assert json.loads(serialized)["tags"] == ["a", "b"]
+    assert ImplicitDict.parse(json.loads(serialized), CollectionData) == data
+
+
+def test_collection_errors():
+    source = json.loads(dumps(CollectionData.example_value()))
+
+    with pytest.raises(ValueError, match=r"^At position: Expected 2 items to populate tuple type .* but found 3"):
+        ImplicitDict.parse(dict(source, position=[1, 2, 3]), CollectionData)
+    with pytest.raises(ValueError, match=r"^At position: Expected 2 items to populate tuple type .* but found 1"):
+        ImplicitDict.parse(dict(source, position=[1]), CollectionData)
+    with pytest.raises(ValueError, match=r'^At labeled_point\[1\]: Required field "y" not specified'):
+        ImplicitDict.parse(dict(source, labeled_point=["origin", {"x": 0}]), CollectionData)
+    with pytest.raises(ValueError, match=r"^At measurements\[2\]: "):
+        ImplicitDict.parse(dict(source, measurements=[1, 2, "three"]), CollectionData)
+    with pytest.raises(ValueError, match=r"^At ids\[1\]: "):
+        ImplicitDict.parse(dict(source, ids=[1, "two"]), CollectionData)
+    with pytest.raises(ValueError, match=r"^At tags: Cannot parse non-iterable value '1' of type 'int' into set type"):
+        ImplicitDict.parse(dict(source, tags=1), CollectionData)
+    with pytest.raises(ValueError, match=r"^At pairs\[1\]: Expected 2 items"):
+        ImplicitDict.parse(dict(source, pairs=[[1, 2], [3]]), CollectionData)
@@ -0,0 +1,65 @@
+import copy
+import json
+
+from .test_types import MutabilityData, SpecialListClass, SpecialSubclassesContainer, SpecialTypesData
+
+
+def test_deepcopy():
+    original = MutabilityData.example_value()
+    object.__setattr__(original, "custom_attribute", ["not", "a", "field"])
+    copied = copy.deepcopy(original)
+    assert copied == original
+    assert type(copied) is MutabilityData
+    assert type(copied.subtype) is MutabilityData
+    assert json.dumps(copied) == json.dumps(original)
+
+    copied.list_of_primitives.append("three")
+    copied.generic_dict["level2"]["baz"][0] = 3
+    copied.subtype.primitive = "changed"
+    copied.custom_attribute.append("!")
+    assert original.list_of_primitives == ["one", "two"]
+    assert original.generic_dict["level2"]["baz"] == [1, 2]
+    assert original.subtype.primitive == "nested"
+    assert original.custom_attribute == ["not", "a", "field"]
+
+
+def test_deepcopy_shares_immutable_values():
+    original = SpecialTypesData.example_value()
+    copied = copy.deepcopy(original)
+    assert copied == original
+    assert copied is not original
+    assert copied.datetime is original.datetime
+    assert copied.timedelta is original.timedelta
+    assert copied.datetime.datetime == original.datetime.datetime
+
+
+def test_deepcopy_preserves_aliasing():
+    shared = ["shared"]
+    original = MutabilityData(primitive="foo", list_of_primitives=shared, generic_dict={"alias": shared})
+    original.subtype = original
+    copied = copy.deepcopy(original)
+    assert copied.list_of_primitives is copied.generic_dict["alias"]
+    assert copied.list_of_primitives is not shared
+    assert copied.subtype is copied
+
+
+def test_deepcopy_subclasses():
+    original = SpecialSubclassesContainer.example_value()
+    copied = copy.deepcopy(original)
+    assert copied == original
+    assert type(copied.special_list) is SpecialListClass
+    assert copied.special_list is not original.special_list
+    assert copied.special_complex_list[0].hello() == "MySubclass"
+
+
+def test_copy():
+    original = MutabilityData.example_value()
+    object.__setattr__(original, "custom_attribute", "value")
+    copied = copy.copy(original)
+    assert copied == original
+    assert copied is not original
+    assert copied.list_of_primitives is original.list_of_primitives
+    assert copied.custom_attribute == "value"
+
+    copied.primitive = "changed"
+    assert original.primitive == "foo"
@@ -0,0 +1,223 @@
+import json
+
+import pytest
+
+from implicitdict import ImplicitDict
+from implicitdict.diff import apply_patch, diff, merge_diff
+from implicitdict.evolution import evolve_in
+from implicitdict.frozen import freeze, is_frozen
+from implicitdict.serialization import dumps
+
+from .test_types import CollectionData, Drawing, MutabilityData, NestedDefinitionsData, OptionalData, Point, \
+    SpecialListClass, SpecialSubclassesContainer, SpecialTypesData, Square
+
+
+def _json(value):
+    return json.loads(dumps(value))
+
+
+def test_diff():
+    a = MutabilityData.example_value()
+    assert diff(a, a) == []
+    assert diff(a, ImplicitDict.parse(_json(a), MutabilityData)) == []
+
+    b = evolve_in(a, "subtype.list_of_primitives[0]", "four")
+    assert diff(a, b) == [{"op": "replace", "path": "/subtype/list_of_primitives/0", "value": "four"}]
+
+    b = ImplicitDict.parse(_json(a), MutabilityData)
+    b.list_of_primitives.append("three")
+    b.generic_dict["level2"]["new/key"] = True
+    del b.generic_dict["level1"]
+    del b["subtype"]
+    assert diff(a, b) == [
+        {"op": "add", "path": "/list_of_primitives/2", "value": "three"},
+        {"op": "remove", "path": "/generic_dict/level1"},
+        {"op": "add", "path": "/generic_dict/level2/new~1key", "value": True},
+        {"op": "remove", "path": "/subtype"},
+    ]
+    assert _json(apply_patch(a, diff(a, b))) == _json(b)
+
+
+def test_diff_skips_shared_subtrees():
+    class Exploding(dict):
+        def items(self):
+            raise AssertionError("Shared subtree should not be inspected")
+
+    a = MutabilityData.example_value()
+    a.generic_dict = Exploding(a.generic_dict)
+    b = evolve_in(a, "subtype.primitive", "changed")
+    assert b.generic_dict is a.generic_dict
+    assert diff(a, b) == [{"op": "replace", "path": "/subtype/primitive", "value": "changed"}]
+    assert merge_diff(a, b) == {"subtype": {"primitive": "changed"}}
+
+
+def test_diff_compares_json():
+    a = SpecialTypesData.example_value()
+    b = ImplicitDict.parse(_json(a), SpecialTypesData)
+    assert diff(a, b) == []
+    assert diff(_json(a), b) == []
+    assert diff({"v": 1}, {"v": True}) == [{"op": "replace", "path": "/v", "value": True}]
+    assert diff({"v": (1, 2)}, {"v": [1, 2]}) == []
+
+
+def test_merge_diff():
+    a = MutabilityData.example_value()
+    b = ImplicitDict.parse(_json(a), MutabilityData)
+    assert merge_diff(a, b) == {}
+
+    b.list_of_primitives.append("three")
+    b.generic_dict["level2"]["baz"] = [1]
+    del b["subtype"]
+    patch = merge_diff(a, b)
+    assert patch == {"list_of_primitives": ["one", "two", "three"], "generic_dict": {"level2": {"baz": [1]}}, "subtype": None}
+    assert _json(apply_patch(a, patch)) == _json(b)
+
+
+def test_apply_patch_shares_untouched_subtrees():
+    a = MutabilityData.example_value()
+    b = apply_patch(a, [{"op": "replace", "path": "/subtype/list_of_primitives/0", "value": "four"}])
+    assert b.subtype.list_of_primitives == ["four"]
+    assert a.subtype.list_of_primitives == ["three"]
+    assert type(b.subtype) is MutabilityData
+    assert b.list_of_primitives is a.list_of_primitives
+    assert b.generic_dict is a.generic_dict
+    assert b.subtype.generic_dict is a.subtype.generic_dict
+
+
+def test_apply_patch_parses_values():
+    drawing = Drawing.example_value()
+    patched = apply_patch(drawing, [{"op": "add", "path": "/layers/-", "value": {"kind": "square", "side": "3"}}])
+    assert isinstance(patched.layers[-1], Square)
+    assert patched.layers[-1].side == 3
+    assert patched.layers[0] is drawing.layers[0]
+
+    patched = apply_patch(drawing, {"background": {"kind": "square", "side": 1}})
+    assert isinstance(patched.background, Square)
+    assert patched.shape is drawing.shape
+
+    data = CollectionData.example_value()
+    patched = apply_patch(data, [{"op": "replace", "path": "/pairs/1", "value": [5, "6"]}])
+    assert patched.pairs == [(1, 2), (5, 6)]
+    patched = apply_patch(data, [{"op": "add", "path": "/points_by_name/other", "value": {"x": 5, "y": 6}}])
+    assert patched.points_by_name["other"].x == 5
+
+    with pytest.raises(ValueError, match=r"^In patch operation 0: At layers\[2\]"):
+        apply_patch(drawing, [{"op": "add", "path": "/layers/-", "value": {"kind": "hexagon"}}])
+    with pytest.raises(ValueError, match=r"^In patch operation 1: At pairs\[0\]: Expected 2 items"):
+        apply_patch(data, [{"op": "test", "path": "/pairs/0", "value": [1, 2]}, {"op": "replace", "path": "/pairs/0", "value": [1]}])
+
+
+def test_apply_patch_operations():
+    a = MutabilityData.example_value()
+    b = apply_patch(a, [
+        {"op": "test", "path": "/subtype/primitive", "value": "nested"},
+        {"op": "add", "path": "/list_of_primitives/0", "value": "zero"},
+        {"op": "remove", "path": "/list_of_primitives/2"},
+        {"op": "move", "from": "/generic_dict/level1", "path": "/generic_dict/moved"},
+        {"op": "copy", "from": "/list_of_primitives", "path": "/subtype/list_of_primitives"},
+    ])
+    assert b.list_of_primitives == ["zero", "one"]
+    assert b.generic_dict == {"moved": "bar", "level2": {"baz": [1, 2]}}
+    assert b.subtype.list_of_primitives == ["zero", "one"]
+    assert _json(a) == _json(MutabilityData.example_value())
+
+    b = apply_patch(a, [{"op": "replace", "path": "", "value": _json(b)}])
+    assert type(b) is MutabilityData
+    assert b.list_of_primitives == ["zero", "one"]
+
+    for operation, message in (
+            ({"op": "test", "path": "/primitive", "value": "bar"}, "does not match"),
+            ({"op": "replace", "path": "/not_a_field", "value": 1}, "No value present"),
+            ({"op": "add", "path": "/not_a_field", "value": 1}, 'Field "not_a_field" is not defined'),
+            ({"op": "remove", "path": "/primitive"}, r'^In patch operation 0: At primitive: Required field "primitive" may not be removed'),
+            ({"op": "remove", "path": "/list_of_primitives/2"}, r"^In patch operation 0: At list_of_primitives: List index 2 is out of range"),
+            ({"op": "replace", "path": "/list_of_primitives/01", "value": "x"}, "not a valid list index"),
+            ({"op": "move", "from": "/subtype", "path": "/subtype/subtype"}, "own children"),
+            ({"op": "frobnicate", "path": "/primitive"}, "Unsupported patch operation"),
+            ({"op": "replace", "path": "primitive", "value": "x"}, "JSON Pointer"),
+    ):
+        with pytest.raises(ValueError, match=message):
+            apply_patch(a, [operation])
+
+
+def test_apply_patch_optional():
+    original = OptionalData(required_field="foo", optional_field1="bar")
+    patched = apply_patch(original, [{"op": "replace", "path": "/optional_field1", "value": None}])
+    assert "optional_field1" not in patched
+    patched = apply_patch(original, {"optional_field1": None, "optional_field2_with_none_default": "baz"})
+    assert "optional_field1" not in patched
+    assert patched.optional_field2_with_none_default == "baz"
+    with pytest.raises(ValueError, match='Required field "required_field" may not be removed'):
+        apply_patch(original, {"required_field": None})
+
+
+def test_apply_patch_frozen():
+    a = freeze(NestedDefinitionsData.example_value())
+    b = apply_patch(a, [{"op": "replace", "path": "/special_types/yesno", "value": "No"}])
+    assert is_frozen(b)
+    assert is_frozen(b.special_types)
+    assert b.special_types.yesno == "No"
+    assert diff(a, b) == [{"op": "replace", "path": "/special_types/yesno", "value": "No"}]
+
+
+def test_merge_patch_reuses_list_items():
+    drawing = Drawing.example_value()
+    changed = apply_patch(drawing, [{"op": "replace", "path": "/layers/0/radius", "value": 7}])
+    patch = merge_diff(drawing, changed)
+    assert patch == {"layers": changed.layers}
+    patched = apply_patch(drawing, patch)
+    assert patched.layers[0] == changed.layers[0]
+    assert patched.layers[1] is drawing.layers[1]
+    assert _json(patched) == _json(changed)
+
+    patched = apply_patch(drawing, {"layers": [_json(drawing.layers[0])]})
+    assert len(patched.layers) == 1
+    assert type(patched.layers[0]) is type(drawing.layers[0])
+
+
+
+def test_patch_preserves_list_subclasses():
+    a = SpecialSubclassesContainer.example_value()
+    for patch in (
+            {"special_list": ["x", "y"]},
+            [{"op": "replace", "path": "/special_list", "value": ["x", "y"]}],
+            [{"op": "add", "path": "/special_list/-", "value": "y"}, {"op": "replace", "path": "/special_list/0", "value": "x"}],
+    ):
+        patched = apply_patch(a, patch)
+        assert type(patched.special_list) is SpecialListClass, patch
+        assert patched.special_list == ["x", "y"]
+        assert patched.special_list.hello() == "SpecialListClass"
+
+    b = apply_patch(a, {"special_list": ["x", "y"]})
+    for patch in (merge_diff(a, b), diff(a, b)):
+        assert type(apply_patch(a, patch).special_list) is SpecialListClass
+
+    frozen = apply_patch(freeze(a), {"special_list": ["x", "y"]})
+    assert is_frozen(frozen.special_list)
+    assert isinstance(frozen.special_list, SpecialListClass)
+
+def test_diff_collections():
+    a = CollectionData.example_value()
+    assert diff(a, a) == []
+    assert diff(_json(a), a) == []
+
+    changed = _json(a)
+    changed["position"] = [1.5, 3]
+    changed["labeled_point"][1]["y"] = 1
+    changed["measurements"].append(9)
+    changed["tags"] = ["c"]
+    changed["pairs"][1] = [5, 6]
+    b = ImplicitDict.parse(changed, CollectionData)
+    patch = diff(a, b)
+    assert patch == [
+        {"op": "replace", "path": "/position", "value": (1.5, 3.0)},
+        {"op": "replace", "path": "/labeled_point", "value": b.labeled_point},
+        {"op": "replace", "path": "/measurements", "value": (3, 1, 4, 1, 5, 9)},
+        {"op": "replace", "path": "/tags", "value": {"c"}},
+        {"op": "replace", "path": "/pairs/1", "value": (5, 6)},
+    ]
+    patched = apply_patch(a, patch)
+    assert patched == b
+    assert isinstance(patched.labeled_point[1], Point)
+    assert patched.points is a.points
+    assert apply_patch(a, json.loads(dumps(patch))) == b
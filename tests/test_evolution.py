@@ -0,0 +1,70 @@
+import pytest
+
+from implicitdict.evolution import evolve, evolve_in
+from implicitdict.frozen import freeze, is_frozen
+
+from .test_types import MutabilityData, OptionalData
+
+
+def test_evolve():
+    original = MutabilityData.example_value()
+    evolved = evolve(original, primitive="changed")
+    assert type(evolved) is MutabilityData
+    assert evolved.primitive == "changed"
+    assert original.primitive == "foo"
+    assert evolved.list_of_primitives is original.list_of_primitives
+    assert evolved.subtype is original.subtype
+    assert evolved == MutabilityData(original, primitive="changed")
+
+    with pytest.raises(ValueError):
+        evolve(original, not_a_field="value")
+
+
+def test_evolve_optional_none():
+    original = OptionalData(required_field="foo", optional_field1="bar")
+    for changes in (
+            {"optional_field1": None},
+            {"optional_field2_with_none_default": None},
+            {"optional_field3_with_default": None},
+            {"required_field": None},
+    ):
+        assert evolve(original, **changes) == OptionalData(original, **changes)
+
+
+def test_evolve_in():
+    original = MutabilityData.example_value()
+    evolved = evolve_in(original, "subtype.list_of_primitives[0]", "four")
+    assert evolved.subtype.list_of_primitives == ["four"]
+    assert original.subtype.list_of_primitives == ["three"]
+    assert type(evolved.subtype) is MutabilityData
+    assert evolved.list_of_primitives is original.list_of_primitives
+    assert evolved.generic_dict is original.generic_dict
+    assert evolved.subtype.generic_dict is original.subtype.generic_dict
+
+    evolved = evolve_in(original, ["generic_dict", "level2", "baz", 1], 3)
+    assert evolved.generic_dict["level2"]["baz"] == [1, 3]
+    assert original.generic_dict["level2"]["baz"] == [1, 2]
+    assert evolved.subtype is original.subtype
+
+    with pytest.raises(ValueError, match=r"^At subtype.subtype:"):
+        evolve_in(original, "subtype.subtype.primitive", "value")
+    with pytest.raises(ValueError, match=r"^At list_of_primitives\[5]:"):
+        evolve_in(original, "list_of_primitives[5]", "value")
+    with pytest.raises(ValueError):
+        evolve_in(original, "subtype.not_a_field", "value")
+    with pytest.raises(ValueError):
+        evolve_in(original, "subtype..primitive", "value")
+
+
+def test_evolve_frozen():
+    original = freeze(MutabilityData.example_value())
+    evolved = evolve(original, list_of_primitives=["new"])
+    assert is_frozen(evolved)
+    assert is_frozen(evolved.list_of_primitives)
+    assert hash(evolved) != hash(original)
+    assert evolved.subtype is original.subtype
+
+    evolved = evolve_in(original, "generic_dict.level2.baz[0]", [5])
+    assert is_frozen(evolved.generic_dict["level2"]["baz"][0])
+    assert evolved.generic_dict["level2"]["baz"] == [[5], 2]
+    assert evolved == evolve_in(MutabilityData.example_value(), "generic_dict.level2.baz[0]", [5])
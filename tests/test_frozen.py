@@ -0,0 +1,119 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from implicitdict.frozen import freeze, frozen_type, is_frozen, thaw
+
+from .test_types import ContainerData, InheritanceData, MutabilityData, MySubclass, SpecialListClass, \
+    SpecialSubclassesContainer
+
+
+def test_freeze_forbids_mutation():
+    data = freeze(MutabilityData.example_value())
+    assert is_frozen(data)
+    assert isinstance(data, MutabilityData)
+
+    with pytest.raises(AttributeError):
+        data.primitive = "changed"
+    with pytest.raises(AttributeError):
+        data.not_a_field = "changed"
+    with pytest.raises(TypeError):
+        data["primitive"] = "changed"
+    with pytest.raises(TypeError):
+        del data["primitive"]
+    with pytest.raises(TypeError):
+        data.update({"primitive": "changed"})
+    with pytest.raises(TypeError):
+        data.list_of_primitives.append("three")
+    with pytest.raises(TypeError):
+        data.generic_dict["level2"]["baz"][0] = 3
+    with pytest.raises(AttributeError):
+        data.subtype.primitive = "changed"
+    assert data.primitive == "foo"
+
+
+def test_freeze_equality_and_hash():
+    mutable = MutabilityData.example_value()
+    frozen1 = freeze(mutable)
+    frozen2 = freeze(MutabilityData.example_value())
+    assert frozen1 is not frozen2
+    assert frozen1 == mutable
+    assert frozen1 == frozen2
+    assert hash(frozen1) == hash(frozen2)
+    assert len({frozen1, frozen2}) == 1
+
+    other = MutabilityData.example_value()
+    other.subtype.primitive = "different"
+    frozen3 = freeze(other)
+    assert frozen1 != frozen3
+    assert not (frozen1 == frozen3)
+    assert len({frozen1: 1, frozen3: 3}) == 2
+
+    with pytest.raises(TypeError):
+        hash(mutable)
+
+
+def test_freeze_reuses_frozen_values():
+    frozen = freeze(MutabilityData.example_value())
+    assert freeze(frozen) is frozen
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+
+    outer = InheritanceData(foo="outer", baz=frozen)
+    assert freeze(outer).baz is frozen
+
+
+def test_thaw():
+    mutable = MutabilityData.example_value()
+    thawed = thaw(freeze(mutable))
+    assert not is_frozen(thawed)
+    assert type(thawed) is MutabilityData
+    assert type(thawed.subtype) is MutabilityData
+    assert type(thawed.list_of_primitives) is list
+    assert thawed == mutable
+    assert json.dumps(thawed) == json.dumps(mutable)
+
+    thawed.primitive = "changed"
+    thawed.list_of_primitives.append("three")
+    thawed.generic_dict["level2"]["baz"][0] = 3
+    assert thawed.primitive == "changed"
+    assert mutable.list_of_primitives == ["one", "two"]
+
+
+def test_subclass_types_preserved():
+    data = SpecialSubclassesContainer.example_value()
+    frozen = freeze(data)
+    assert isinstance(frozen.special_list, SpecialListClass)
+    assert frozen.special_list.hello() == "SpecialListClass"
+    assert isinstance(frozen.special_complex_list[0], MySubclass)
+    assert frozen.special_complex_list[0].hello() == "MySubclass"
+
+    thawed = thaw(frozen)
+    assert type(thawed.special_list) is SpecialListClass
+    assert type(thawed.special_complex_list[0]) is MySubclass
+    assert thawed == data
+
+
+def test_frozen_type():
+    t = frozen_type(ContainerData)
+    assert issubclass(t, ContainerData)
+    assert frozen_type(ContainerData) is t
+    assert frozen_type(t) is t
+
+    data = freeze(ContainerData.example_value())
+    assert type(data) is t
+    assert data.single_value == "foo"
+    assert data.has_field_with_value("optional_list")
+
+
+def test_serialization():
+    data = MutabilityData.example_value()
+    frozen = freeze(data)
+    assert json.dumps(frozen) == json.dumps(data)
+
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    assert is_frozen(unpickled)
+    assert unpickled == frozen
+    assert hash(unpickled) == hash(frozen)
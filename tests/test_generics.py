@@ -0,0 +1,165 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+from typing import List, Optional, Tuple
+
+import pytest
+
+from implicitdict import ImplicitDict, _get_fields, _get_hints
+from implicitdict.aio import parse as parse_async
+from implicitdict.diff import apply_patch, diff, merge_diff
+from implicitdict.frozen import freeze, is_frozen
+from implicitdict.jsonschema import make_json_schema, SchemaVars
+from implicitdict.serialization import dumps, iter_json, to_json_bytes
+from implicitdict.validation import validate, validate_native
+
+from .test_types import LabeledPage, Page, Point, PointPage, T, TreeNode
+
+
+def _resolver(t) -> SchemaVars:
+    return SchemaVars(name=t.__module__ + "." + t.__qualname__, path_to=lambda t_dest, t_src: "#/definitions/" + t_dest.__qualname__)
+
+
+def test_specialization():
+    page = ImplicitDict.parse({"items": [{"x": 1, "y": 2}], "cursor": "abc"}, Page[Point])
+    assert isinstance(page, Page)
+    assert type(page) is Page[Point]
+    assert isinstance(page.items[0], Point)
+    assert page.cursor == "abc"
+
+    # Specializations are created once and then reused
+    assert Page[Point] is Page[Point]
+    assert Page[T] is Page
+    assert Page[Point].__qualname__ == f"Page[{Point.__module__}.Point]"
+
+    numbers = ImplicitDict.parse({"items": ["1", 2.0]}, Page[int])
+    assert numbers.items == [1, 2]
+    assert all(type(v) is int for v in numbers.items)
+
+
+def test_specialization_metadata():
+    assert _get_hints(Page[Point])["items"] == List[Point]
+    assert _get_hints(Page[int])["items"] == List[int]
+    assert _get_hints(Page)["items"] == List[T]
+    assert _get_fields(Page[Point]) == ({"items", "cursor"}, {"cursor"})
+    assert _get_fields(Page[Optional[int]]) == ({"items", "cursor"}, {"cursor"})
+
+    # Optionality of a field depends on the specialization
+    assert _get_fields(TreeNode[int])[1] == {"children"}
+    assert _get_fields(TreeNode[Optional[int]])[1] == {"value", "children"}
+
+
+def test_recursive_specialization():
+    tree = ImplicitDict.parse({"value": {"x": 1, "y": 1}, "children": [{"value": {"x": 2, "y": 2}}]}, TreeNode[Point])
+    assert type(tree.children[0]) is TreeNode[Point]
+    assert isinstance(tree.children[0].value, Point)
+    assert _get_hints(TreeNode[Point])["children"] == Optional[List[TreeNode[Point]]]
+
+
+def test_generic_subclasses():
+    page = ImplicitDict.parse({"items": [["origin", {"x": 0, "y": 0}]], "label": "points"}, LabeledPage[Point])
+    assert page.items[0][0] == "origin"
+    assert isinstance(page.items[0][1], Point)
+    assert _get_hints(LabeledPage[Point])["items"] == List[Tuple[str, Point]]
+
+    page = ImplicitDict.parse({"items": [{"x": 0, "y": 0}]}, PointPage)
+    assert isinstance(page.items[0], Point)
+    assert page.total == 0
+    with pytest.raises(TypeError):
+        PointPage[int]
+
+
+def test_specialization_pickling():
+    page = ImplicitDict.parse({"items": [{"x": 1, "y": 2}], "cursor": "abc"}, Page[Point])
+    unpickled = pickle.loads(pickle.dumps(page))
+    assert type(unpickled) is Page[Point]
+    assert unpickled == page
+    assert isinstance(unpickled.items[0], Point)
+
+    frozen = pickle.loads(pickle.dumps(freeze(page)))
+    assert is_frozen(frozen)
+    assert frozen == page
+
+    for t in (Page[Point], Page[Page[Point]], TreeNode[int], LabeledPage[int], List[Page[Point]], PointPage):
+        assert pickle.loads(pickle.dumps(t)) == t
+    tree = ImplicitDict.parse({"value": 1, "children": [{"value": 2}]}, TreeNode[int])
+    assert type(pickle.loads(pickle.dumps(tree)).children[0]) is TreeNode[int]
+
+    with ProcessPoolExecutor(1) as executor:
+        parsed = asyncio.run(parse_async({"items": [{"x": 1, "y": 2}]}, Page[Point], executor=executor, offload_threshold=1))
+    assert type(parsed) is Page[Point]
+
+
+def test_unspecialized():
+    page = ImplicitDict.parse({"items": [{"x": 1, "y": 2}]}, Page)
+    assert page.items == [{"x": 1, "y": 2}]
+    assert not isinstance(page.items[0], Point)
+
+
+def test_invalid_specialization():
+    with pytest.raises(TypeError, match="not a generic class"):
+        Point[int]
+    with pytest.raises(TypeError, match="Too many arguments"):
+        Page[int, str]
+
+
+def test_specialization_schema():
+    repo = {}
+    make_json_schema(Page[Point], _resolver, repo)
+    make_json_schema(Page[int], _resolver, repo)
+    point_page = repo[_resolver(Page[Point]).name]
+    int_page = repo[_resolver(Page[int]).name]
+
+    assert point_page["properties"]["items"]["items"] == {"$ref": "#/definitions/Point"}
+    assert int_page["properties"]["items"]["items"] == {"type": "integer"}
+    assert point_page["description"] == "One page of results."
+    assert point_page["properties"]["items"]["description"] == "Results on this page."
+
+    unspecialized = {}
+    make_json_schema(Page, _resolver, unspecialized)
+    assert unspecialized[_resolver(Page).name]["properties"]["items"]["items"] == {}
+
+    data = {"items": [{"x": 1, "y": 2}], "cursor": "abc"}
+    validate(data, Page[Point])
+    validate_native(data, Page[Point])
+    data["items"].append({"x": "one"})
+    with pytest.raises(ValueError, match=r"^At items\[1\]"):
+        validate(data, Page[Point])
+    with pytest.raises(ValueError, match=r"^At items\[1\]"):
+        validate_native(data, Page[Point])
+    validate(data, Page)
+    validate_native(data, Page)
+
+
+def test_specialization_serialization():
+    # The items field of Page shadows dict.items
+    source = {"items": [{"x": 1, "y": 2}], "cursor": "abc"}
+    page = ImplicitDict.parse(source, Page[Point])
+    expected = '{"items": [{"x": 1.0, "y": 2.0}], "cursor": "abc"}'
+    assert dumps(page) == "".join(iter_json(page)) == expected
+    assert to_json_bytes(page) == expected.encode("utf-8")
+    assert dumps({"pages": [page], "points": (Point(x=3, y=4),)}) == '{"pages": [' + expected + '], "points": [{"x": 3, "y": 4}]}'
+    assert ImplicitDict.parse(json.loads(dumps(page)), Page[Point]) == page
+
+    validate(page, Page[Point])
+    validate_native(page, Page[Point])
+    validate(PointPage(items=[Point(x=1, y=2)], total=1), PointPage)
+
+
+def test_specialization_diff():
+    a = ImplicitDict.parse({"items": [{"x": 1, "y": 2}], "cursor": "abc"}, Page[Point])
+    b = ImplicitDict.parse({"items": [{"x": 1, "y": 3}, {"x": 5, "y": 6}]}, Page[Point])
+
+    assert diff(a, b) == [
+        {"op": "replace", "path": "/items/0/y", "value": 3.0},
+        {"op": "add", "path": "/items/1", "value": b.items[1]},
+        {"op": "remove", "path": "/cursor"},
+    ]
+    assert merge_diff(a, b) == {"items": [{"x": 1, "y": 3}, {"x": 5, "y": 6}], "cursor": None}
+    assert diff(a, a) == [] and merge_diff(a, a) == {}
+    for patch in (diff(a, b), merge_diff(a, b)):
+        patched = apply_patch(a, patch)
+        assert patched == b
+        assert type(patched) is Page[Point]
+        assert type(patched.items[1]) is Point
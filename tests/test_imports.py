@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import implicitdict
+
+
+_DEFERRED_MODULES = ("arrow", "dateutil", "pytimeparse", "inspect", "dataclasses", "jsonschema")
+
+
+def _run(code: str) -> str:
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(implicitdict.__file__))
+    env["PYTHONPATH"] = src + os.pathsep + env.get("PYTHONPATH", "")
+    return subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+
+
+def test_heavy_imports_deferred():
+    loaded = _run(f"import sys, implicitdict; print(' '.join(m for m in {_DEFERRED_MODULES!r} if m in sys.modules))")
+    assert loaded.split() == []
+
+    loaded = _run(f"import sys, implicitdict.sampling; print(' '.join(m for m in {_DEFERRED_MODULES!r} if m in sys.modules))")
+    assert "jsonschema" not in loaded.split()
+
+
+def test_deferred_imports_used():
+    result = _run(
+        "import implicitdict; "
+        "print(implicitdict.StringBasedDateTime('2024-01-02T03:04:05Z').datetime.year, "
+        "implicitdict.StringBasedTimeDelta('1h').timedelta.total_seconds(), "
+        "implicitdict.memory_usage(implicitdict.ImplicitDict()).total > 0)"
+    )
+    assert result.split() == ["2024", "3600.0", "True"]
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+import pytest
+
+from implicitdict import ImplicitDict, _fullname
+from implicitdict import instrumentation
+from implicitdict.serialization import dumps
+
+from .test_types import NestedDefinitionsData, SpecialListClass, SpecialSubclassesContainer, SpecialTypesData
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.enable()
+    try:
+        yield
+    finally:
+        instrumentation.disable()
+
+
+def test_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    NestedDefinitionsData.example_value()
+    assert instrumentation.snapshot() == {}
+
+
+def test_counters(enabled):
+    for _ in range(3):
+        NestedDefinitionsData.example_value()
+    SpecialSubclassesContainer.example_value()
+    ImplicitDict.parse({"special_types": SpecialTypesData.example_value(), "extra": 1}, NestedDefinitionsData)
+    with pytest.raises(ValueError):
+        ImplicitDict.parse({"special_types": {"yesno": "Maybe"}}, NestedDefinitionsData)
+    SpecialTypesData(datetime="2024-01-01T00:00:00Z", timedelta="1h", yesno="Yes", boolean=True)
+
+    stats = instrumentation.snapshot()
+    outer = stats[_fullname(NestedDefinitionsData)]
+    assert outer.parses == 5
+    assert outer.errors == 1
+    assert outer.constructions == 4
+    assert outer.untyped_fields == 1
+    assert 0 < outer.max_parse_time <= outer.parse_time
+
+    inner = stats[_fullname(SpecialTypesData)]
+    assert inner.parses == 6
+    assert inner.errors == 1
+    assert inner.constructions == 6
+
+    assert stats[_fullname(SpecialListClass)].orig_bases_fallbacks == 1
+
+    before_reset = instrumentation.reset()
+    assert before_reset[_fullname(NestedDefinitionsData)].parses == 5
+    assert instrumentation.snapshot() == {}
+    NestedDefinitionsData.example_value()
+    assert instrumentation.snapshot()[_fullname(NestedDefinitionsData)].parses == 1
+
+
+def test_async_counters(enabled):
+    source = json.loads(dumps(NestedDefinitionsData.example_value()))
+    instrumentation.reset()
+    asyncio.run(ImplicitDict.parse_async(dict(source, extra=1), NestedDefinitionsData))
+    with pytest.raises(ValueError):
+        asyncio.run(ImplicitDict.parse_async({"special_types": {"yesno": "Maybe"}}, NestedDefinitionsData))
+
+    stats = instrumentation.snapshot()
+    outer = stats[_fullname(NestedDefinitionsData)]
+    assert outer.parses == 2
+    assert outer.errors == 1
+    assert outer.constructions == 1
+    assert outer.untyped_fields == 1
+    assert 0 < outer.max_parse_time <= outer.parse_time
+    assert stats[_fullname(SpecialTypesData)].parses == stats[_fullname(SpecialTypesData)].constructions + 1
@@ -1,13 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
 import json
 from typing import Type
 
 import implicitdict.jsonschema
 from implicitdict.jsonschema import SchemaVars
 from implicitdict import ImplicitDict
+from implicitdict.frozen import thaw
+from implicitdict.serialization import dumps
 import jsonschema
+import pytest
 
-from .test_types import ContainerData, InheritanceData, NestedDefinitionsData, NormalUsageData, OptionalData, \
-    PropertiesData, SpecialTypesData, SpecialSubclassesContainer
+from . import test_types
+from .test_types import CollectionData, ContainerData, InheritanceData, NestedDefinitionsData, NormalUsageData, OptionalData, \
+    PropertiesData, SpecialTypesData, SpecialSubclassesContainer, ValidationData, ValidationNode
 
 
 def _resolver(t: Type) -> SchemaVars:
@@ -69,6 +75,33 @@ def test_containers():
     _verify_schema_validation(containers, ContainerData)
 
 
+def test_collections():
+    repo = {}
+    implicitdict.jsonschema.make_json_schema(CollectionData, _resolver, repo)
+    props = repo[_resolver(CollectionData).name]["properties"]
+    assert props["position"]["prefixItems"] == [{"type": "number"}, {"type": "number"}]
+    assert props["position"]["minItems"] == props["position"]["maxItems"] == 2
+    assert props["measurements"]["items"] == {"type": "integer"}
+    assert "prefixItems" not in props["measurements"]
+    assert props["tags"]["uniqueItems"] is True
+    assert props["ids"]["uniqueItems"] is True
+    assert props["points"]["items"] == {"$ref": _resolver(CollectionData).path_to(test_types.Point, CollectionData)}
+    assert "additionalProperties" in props["points_by_name"]
+
+
+def test_collections_serialization():
+    # Tuples and sets are not serializable by json.dumps, so CollectionData is serialized with implicitdict's dumps
+    repo = {}
+    implicitdict.jsonschema.make_json_schema(CollectionData, _resolver, repo)
+    schema = dict(repo[_resolver(CollectionData).name], definitions=repo)
+    jsonschema.Draft202012Validator.check_schema(schema)
+    validator = jsonschema.Draft202012Validator(schema)
+    data = json.loads(dumps(CollectionData.example_value()))
+    assert not list(validator.iter_errors(data))
+    for field, value in (("position", [1, 2, 3]), ("tags", ["a", "a"]), ("labeled_point", ["origin", "point"])):
+        assert list(validator.iter_errors(dict(data, **{field: value}))), field
+
+
 def test_inheritance():
     data = InheritanceData.example_value()
     _verify_schema_validation(data, InheritanceData)
@@ -102,3 +135,115 @@ def test_special_types():
 def test_nested_definitions():
     data = NestedDefinitionsData.example_value()
     _verify_schema_validation(data, NestedDefinitionsData)
+
+
+class DocumentedOuterData(ImplicitDict):
+    class InnerData(ImplicitDict):
+        value: int
+        """Value of the nested class."""
+
+    inner_count = 0
+    """Fields without annotations may be documented too."""
+
+
+def _make_local_type() -> Type[ImplicitDict]:
+    class LocalData(ImplicitDict):
+        value: int
+        """Value of the class local to a function.
+
+        Second line."""
+
+    return LocalData
+
+
+def test_field_docstrings_nested_classes():
+    assert implicitdict.jsonschema._field_docs_for(DocumentedOuterData) == {
+        "inner_count": "Fields without annotations may be documented too."}
+    assert implicitdict.jsonschema._field_docs_for(DocumentedOuterData.InnerData) == {
+        "value": "Value of the nested class."}
+    assert implicitdict.jsonschema._field_docs_for(_make_local_type()) == {
+        "value": "Value of the class local to a function.\n\nSecond line."}
+
+
+def test_bundled_schema():
+    for obj, obj_type in (
+            (ValidationData.example_value(), ValidationData),
+            (NestedDefinitionsData.example_value(), NestedDefinitionsData),
+            (SpecialSubclassesContainer.example_value(), SpecialSubclassesContainer),
+    ):
+        bundle = implicitdict.jsonschema.make_bundled_json_schema(obj_type, _resolver)
+        assert implicitdict.jsonschema.make_bundled_json_schema(obj_type, _resolver) is bundle
+        assert json.loads(bundle.content) == bundle.schema
+        assert bundle.etag == '"' + hashlib.sha256(bundle.content).hexdigest() + '"'
+
+        repo = {}
+        implicitdict.jsonschema.make_json_schema(obj_type, _resolver, repo)
+        assert set(bundle.schema.get("$defs", {})) == set(repo) - {_resolver(obj_type).name}
+        for definition in bundle.schema.get("$defs", {}).values():
+            assert "$schema" not in definition
+
+        jsonschema.Draft202012Validator.check_schema(bundle.schema)
+        validator = jsonschema.Draft202012Validator(bundle.schema)
+        assert not list(validator.iter_errors(json.loads(json.dumps(obj))))
+
+    schema = implicitdict.jsonschema.make_bundled_json_schema(ValidationData, _resolver).schema
+    node_name = _resolver(ValidationNode).name
+    assert schema["$defs"][node_name]["properties"]["children"]["items"] == {"$ref": "#/$defs/" + node_name}
+    validator = jsonschema.Draft202012Validator(schema)
+    invalid = json.loads(json.dumps(ValidationData.example_value()))
+    invalid["nodes"][0]["children"][1]["children"] = [{"value": "one"}]
+    assert list(validator.iter_errors(invalid))
+
+
+def test_bundled_schema_cache():
+    bundle = implicitdict.jsonschema.make_bundled_json_schema(ValidationData, _resolver)
+    bundles = len(implicitdict.jsonschema._bundles)
+
+    # A resolver created for each request producing the same schema vars reuses the cached bundle
+    for _ in range(3):
+        assert implicitdict.jsonschema.make_bundled_json_schema(ValidationData, lambda t: _resolver(t)) is bundle
+    assert len(implicitdict.jsonschema._bundles) == bundles
+
+    # The shared schema can't be modified to no longer match its content and ETag
+    with pytest.raises(TypeError):
+        bundle.schema["$defs"].clear()
+    with pytest.raises(TypeError):
+        bundle.schema["properties"]["integer"]["type"] = "string"
+    schema = thaw(bundle.schema)
+    schema["$defs"].clear()
+    assert json.loads(bundle.content) == bundle.schema != schema
+
+    # A resolver producing different schema vars produces a different bundle
+    def described(t):
+        schema_vars = _resolver(t)
+        return SchemaVars(name=schema_vars.name, description="Described")
+    assert implicitdict.jsonschema.make_bundled_json_schema(ValidationData, described).etag != bundle.etag
+
+
+def test_make_json_schemas():
+    expected = {}
+    for t in vars(test_types).values():
+        if isinstance(t, type) and issubclass(t, ImplicitDict) and t is not ImplicitDict and t.__module__ == test_types.__name__:
+            implicitdict.jsonschema.make_json_schema(t, _resolver, expected)
+
+    for executor in (None, ThreadPoolExecutor(4), ProcessPoolExecutor(2)):
+        repo = {}
+        implicitdict.jsonschema.make_json_schemas(test_types, _resolver, repo, executor=executor)
+        assert list(repo.items()) == list(expected.items())
+        if executor is not None:
+            executor.shutdown()
+
+    repo = {}
+    implicitdict.jsonschema.make_json_schemas([ValidationData, NestedDefinitionsData], _resolver, repo)
+    expected = {}
+    implicitdict.jsonschema.make_json_schema(ValidationData, _resolver, expected)
+    implicitdict.jsonschema.make_json_schema(NestedDefinitionsData, _resolver, expected)
+    assert list(repo.items()) == list(expected.items())
+
+    # Types whose schemas are already present are neither regenerated nor traversed
+    node_name = _resolver(ValidationNode).name
+    repo = {node_name: {"placeholder": True}}
+    implicitdict.jsonschema.make_json_schemas([ValidationData], _resolver, repo)
+    expected = {node_name: {"placeholder": True}}
+    implicitdict.jsonschema.make_json_schema(ValidationData, _resolver, expected)
+    assert list(repo.items()) == list(expected.items())
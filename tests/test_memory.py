@@ -0,0 +1,68 @@
+import sys
+
+import pytest
+
+from implicitdict import memory_usage, _fullname, StringBasedDateTime
+
+from .test_types import ContainerData, MutabilityData, NestedDefinitionsData, SpecialTypesData
+
+
+def test_memory_usage():
+    data = NestedDefinitionsData.example_value()
+    usage = memory_usage(data)
+
+    assert not usage.sampled
+    assert usage.total > sys.getsizeof(data) + sys.getsizeof(data.special_types)
+    assert usage.total == sum(usage.by_path.values()) == sum(usage.by_type.values())
+    assert set(usage.by_path) >= {"<root>", "special_types", "special_types.datetime", "special_types.timedelta"}
+    # Enum members are shared by everything referencing them
+    assert "special_types.yesno" not in usage.by_path
+    assert usage.by_type[_fullname(SpecialTypesData)] == sys.getsizeof(data.special_types)
+
+    # The datetime of a StringBasedDateTime is attributed to the field holding it
+    assert usage.by_type["datetime.datetime"] == sys.getsizeof(data.special_types.datetime.datetime)
+    assert usage.by_path["special_types.datetime"] > sys.getsizeof(data.special_types.datetime) + sys.getsizeof(data.special_types.datetime.datetime)
+    assert usage.by_type[_fullname(StringBasedDateTime)] == sys.getsizeof(data.special_types.datetime)
+
+
+def test_field_names_not_counted():
+    data = MutabilityData(primitive="foo", list_of_primitives=[], generic_dict={"key": 1})
+    usage = memory_usage(data)
+    # Only the value of primitive and the key of generic_dict are counted, not the field names keying data
+    assert usage.by_type["str"] == sys.getsizeof("foo") + sys.getsizeof("key")
+
+    data["ad_hoc"] = 1.5
+    assert memory_usage(data).by_type["str"] == usage.by_type["str"] + sys.getsizeof("ad_hoc")
+
+
+def test_shared_objects_counted_once():
+    shared = ["x" * 1000]
+    data = MutabilityData(primitive="foo", list_of_primitives=shared, generic_dict={"a": shared, "b": shared})
+    usage = memory_usage(data)
+    assert usage.by_type["str"] < 2 * sys.getsizeof(shared[0])
+    assert "list_of_primitives" in usage.by_path
+    assert "generic_dict{}" not in usage.by_path
+    assert usage.by_path["list_of_primitives[]"] == sys.getsizeof(shared[0])
+    assert "generic_dict{}[]" not in usage.by_path
+
+    # An object containing itself is counted once, rather than recursing indefinitely
+    data.subtype = data
+    cyclic = memory_usage(data)
+    assert cyclic.total >= usage.total
+    assert "subtype" not in cyclic.by_path
+    assert cyclic.by_path["list_of_primitives[]"] == sys.getsizeof(shared[0])
+
+
+def test_sampled_batch():
+    batch = [ContainerData.example_value() for _ in range(50)]
+    exact = memory_usage(batch)
+    assert set(exact.by_path) >= {"<root>", "[]", "[].value_list[]", "[].list_of_lists[][]"}
+
+    estimate = memory_usage(batch, sample_size=5)
+    assert estimate.sampled
+    assert abs(estimate.total - exact.total) < 0.1 * exact.total
+    assert set(estimate.by_path) <= set(exact.by_path)
+    assert memory_usage(batch, sample_size=50) == exact
+
+    with pytest.raises(ValueError):
+        memory_usage(batch, sample_size=0)
@@ -0,0 +1,120 @@
+import json
+import tracemalloc
+
+import pytest
+
+from implicitdict import ImplicitDict
+from implicitdict.profile import main, profile_parse, ROOT_PATH
+
+from .test_types import CollectionData, ContainerData, NestedDefinitionsData, SpecialSubclassesContainer, ValidationData
+
+
+def _validation_source() -> dict:
+    source = json.loads(json.dumps(ValidationData.example_value()))
+    del source["undescribable"]
+    return source
+
+
+def test_profile_paths():
+    profiles = profile_parse([_validation_source()], ValidationData, iterations=3)
+
+    assert profiles[ROOT_PATH].calls == 3
+    for path in ("integer", "nodes", "nodes[]", "nodes[].children[]", "nodes[].children[].value", "int_map{}", "nested.yesno", "matrix[][]", "special_list[]"):
+        assert path in profiles, path
+    assert profiles["nodes[].children[]"].calls == 6
+    assert profiles["matrix[][]"].calls == 9
+    for profile in profiles.values():
+        assert 0 <= profile.time <= profiles[ROOT_PATH].time
+        assert profile.retained_blocks is not None
+    assert profiles[ROOT_PATH].retained_bytes > 0
+
+    profiles = profile_parse([_validation_source()], ValidationData, iterations=1, measure_memory=False)
+    assert profiles[ROOT_PATH].retained_blocks is None
+    assert profiles[ROOT_PATH].peak_bytes is None
+
+
+@pytest.mark.skipif(not hasattr(tracemalloc, "reset_peak"), reason="tracemalloc.reset_peak requires Python 3.9+")
+def test_profile_peak_memory():
+    profiles = profile_parse([_validation_source()], ValidationData, iterations=2)
+    for path, profile in profiles.items():
+        # Temporary allocations are included in the peak, so it is never less than what is retained
+        assert profile.peak_bytes >= profile.retained_bytes, path
+
+
+def test_profile_parse_equivalent():
+    from implicitdict.profile import _ProfilingParser
+
+    for example in (ContainerData.example_value(), NestedDefinitionsData.example_value(), SpecialSubclassesContainer.example_value()):
+        source = json.loads(json.dumps(example))
+        parsed = _ProfilingParser(measure_memory=False).measured(ROOT_PATH, source, type(example))
+        assert parsed == ImplicitDict.parse(source, type(example))
+        assert type(parsed.get("special_list", parsed)) is type(example.get("special_list", example))
+
+    with pytest.raises(ValueError, match=r"^At nodes\[0\]\.value:"):
+        source = _validation_source()
+        source["nodes"][0]["value"] = "one"
+        profile_parse([source], ValidationData, iterations=1)
+
+
+def test_profile_parse_collections():
+    from implicitdict.profile import _ProfilingParser
+
+    source = json.loads(json.dumps(CollectionData.example_value(), default=sorted))
+    for overrides in (
+            {},
+            {"position": (3, 4), "ids": range(3), "tags": {"a"}, "measurements": "123"},
+            {"position": [1, 2, 3]},
+            {"labeled_point": ["origin", {"x": 0}]},
+            {"measurements": [1, 2, "three"]},
+            {"tags": 1},
+            {"points_by_name": {"corner": "not a dict"}},
+            {"pairs": [[1, 2], [3]]},
+    ):
+        data = dict(source, **overrides)
+        try:
+            expected = ImplicitDict.parse(data, CollectionData)
+        except ValueError as e:
+            with pytest.raises(ValueError) as actual:
+                _ProfilingParser(measure_memory=False).measured(ROOT_PATH, data, CollectionData)
+            assert str(actual.value) == str(e)
+            continue
+        parser = _ProfilingParser(measure_memory=False)
+        parsed = parser.measured(ROOT_PATH, data, CollectionData)
+        assert parsed == expected
+        assert all(type(parsed[k]) is type(expected[k]) for k in expected)
+        for path in ("position[]", "labeled_point[].x", "measurements[]", "tags[]", "ids[]", "points_by_name{}.y", "pairs[][]"):
+            assert path in parser.calls, path
+        assert parser.calls["position[]"] == 2
+
+
+def test_profile_cli(tmp_path, capsys):
+    payload = tmp_path / "payload.ndjson"
+    payload.write_text("\n".join(json.dumps(ContainerData.example_value()) for _ in range(2)) + "\n")
+
+    assert main([f"{ContainerData.__module__}:ContainerData", str(payload), "-n", "2"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("Parsed 2 ContainerData object(s) 2 time(s)")
+    assert any(line.startswith("list_of_lists[][]: ") and "blocks retained" in line for line in lines)
+    assert any(line.startswith(f"{ROOT_PATH}: 100% of parse time, 4 values") for line in lines)
+    peak_reported = hasattr(tracemalloc, "reset_peak")
+    assert all(("B peak" in line) == peak_reported for line in lines if ": " in line)
+    assert any(line.startswith("Peak memory is not reported") for line in lines) != peak_reported
+
+
+def test_profile_cli_without_peak(tmp_path, capsys, monkeypatch):
+    import implicitdict.profile
+
+    monkeypatch.setattr(implicitdict.profile, "_CAN_RESET_PEAK", False)
+    payload = tmp_path / "payload.json"
+    payload.write_text(json.dumps(ContainerData.example_value()))
+
+    assert main([f"{ContainerData.__module__}:ContainerData", str(payload), "-n", "1"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1] == "Peak memory is not reported because tracemalloc cannot reset its peak before Python 3.9"
+    assert not any("peak" in line for line in lines[2:])
+    assert not any("None" in line for line in lines)
+
+    assert main([f"{ContainerData.__module__}:ContainerData", str(payload), "-n", "1", "--no-memory"]) == 0
+    assert not any("Peak" in line for line in capsys.readouterr().out.splitlines())
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+from implicitdict import ImplicitDict, _fullname
+from implicitdict.sampling import SamplingValidator
+from implicitdict.serialization import dumps
+
+from .test_types import NestedDefinitionsData, NormalUsageData, SpecialTypesData, ValidationData, ValidationNode
+
+
+def test_sampling_rate():
+    source = json.loads(json.dumps(NestedDefinitionsData.example_value()))
+    with SamplingValidator(sample_every=3, max_validations_per_second=1e6) as sampler:
+        for _ in range(9):
+            ImplicitDict.parse(source, NestedDefinitionsData)
+        sampler.flush()
+        # Nested SpecialTypesData are sampled independently from NestedDefinitionsData
+        assert sampler.stats() == {"validated": 6, "dropped": 0, "errors": 0}
+        assert sampler.violations() == {}
+
+    ImplicitDict.parse(source, NestedDefinitionsData)
+    assert sampler.stats()["validated"] == 6
+
+
+def test_sampling_async_parses():
+    source = json.loads(json.dumps(NestedDefinitionsData.example_value()))
+    with SamplingValidator(sample_every=1, max_validations_per_second=1e6) as sampler:
+        asyncio.run(ImplicitDict.parse_async(source, NestedDefinitionsData))
+        bad = json.loads(json.dumps(ValidationData.example_value()))
+        del bad["undescribable"]  # Union types can't be parsed
+        bad["nodes"][0]["value"] = 3.5
+        asyncio.run(ImplicitDict.parse_async(bad, ValidationData))
+        sampler.flush()
+        assert sampler.stats()["validated"] >= 3
+        assert sampler.violations()[(_fullname(ValidationData), "nodes[0].value")] == 1
+
+
+def test_violations():
+    with SamplingValidator(sample_every=1, max_validations_per_second=1e6) as sampler:
+        for _ in range(2):
+            dumps(NormalUsageData(foo=1))
+        data = json.loads(json.dumps(ValidationData.example_value()))
+        del data["undescribable"]  # Union types can't be parsed
+        data["nodes"][0]["children"][1]["value"] = 3.5
+        ImplicitDict.parse(data, ValidationData)
+        dumps(SpecialTypesData.example_value())
+        sampler.flush()
+        assert sampler.violations() == {
+            (_fullname(NormalUsageData), "foo"): 2,
+            (_fullname(ValidationData), "nodes[0].children[1].value"): 1,
+            (_fullname(ValidationNode), "children[1].value"): 1,
+            (_fullname(ValidationNode), "value"): 1,
+            # SpecialTypesData.example_value parses a string as its boolean field
+            (_fullname(SpecialTypesData), "boolean"): 1,
+        }
+
+
+def test_dropped_when_saturated():
+    source = {"foo": "foo"}
+    sampler = SamplingValidator(sample_every=1, max_validations_per_second=1, max_pending=2)
+    sampler.install()
+    try:
+        for _ in range(10):
+            ImplicitDict.parse(source, NormalUsageData)
+        assert sampler.stats()["dropped"] >= 7
+    finally:
+        sampler.uninstall(timeout=0)
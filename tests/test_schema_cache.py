@@ -0,0 +1,75 @@
+import json
+import os
+
+import implicitdict.schema_cache
+from implicitdict.jsonschema import make_json_schema, SchemaVars
+from implicitdict.schema_cache import SchemaCache
+
+from .test_jsonschema import _resolver
+from .test_types import ContainerData, NestedDefinitionsData, SpecialSubclassesContainer
+
+
+def _generate(t) -> dict:
+    repo = {}
+    make_json_schema(t, _resolver, repo)
+    return repo
+
+
+def test_cache_matches_generation(tmp_path):
+    for t in (ContainerData, NestedDefinitionsData, SpecialSubclassesContainer):
+        cache = SchemaCache(str(tmp_path / t.__name__))
+        for _ in range(2):
+            repo = {}
+            cache.make_json_schema(t, _resolver, repo)
+            assert repo == _generate(t)
+
+
+def test_fresh_entries_are_loaded(tmp_path, monkeypatch):
+    SchemaCache(str(tmp_path)).make_json_schema(NestedDefinitionsData, _resolver, {})
+    files = sorted(os.listdir(tmp_path))
+    assert files and all(f.endswith(".json") for f in files)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Schema should have been loaded from the cache")
+
+    monkeypatch.setattr(implicitdict.schema_cache, "make_json_schema", fail)
+    repo = {}
+    SchemaCache(str(tmp_path)).make_json_schema(NestedDefinitionsData, _resolver, repo)
+    assert repo == _generate(NestedDefinitionsData)
+    assert sorted(os.listdir(tmp_path)) == files
+
+
+def test_stale_entries_are_regenerated(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    cache.make_json_schema(NestedDefinitionsData, _resolver, {})
+
+    # Corrupt the cached content of one entry without changing its fingerprint
+    name = _resolver(NestedDefinitionsData).name
+    path = cache._path_for(name)
+    with open(path, "r") as f:
+        entry = json.load(f)
+    entry["schema"] = {"corrupted": True}
+    with open(path, "w") as f:
+        json.dump(entry, f)
+    repo = {}
+    cache.make_json_schema(NestedDefinitionsData, _resolver, repo)
+    assert repo[name] == {"corrupted": True}
+
+    # Change the schema vars for the type, which makes the entry stale
+    def described_resolver(t):
+        schema_vars = _resolver(t)
+        return SchemaVars(name=schema_vars.name, path_to=schema_vars.path_to, description="Changed")
+
+    repo = {}
+    cache.make_json_schema(NestedDefinitionsData, described_resolver, repo)
+    expected = {}
+    make_json_schema(NestedDefinitionsData, described_resolver, expected)
+    assert repo == expected
+
+    # Invalid cache files are treated as missing
+    with open(path, "w") as f:
+        f.write("{not json")
+    repo = {}
+    cache.make_json_schema(NestedDefinitionsData, _resolver, repo)
+    assert repo == _generate(NestedDefinitionsData)
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")]
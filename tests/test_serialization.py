@@ -0,0 +1,113 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+import enum
+import io
+import json
+from typing import List, Optional
+
+import pytest
+
+from implicitdict import ImplicitDict, StringBasedDateTime, StringBasedTimeDelta
+from implicitdict.serialization import dump, dumps, iter_json, to_json_bytes
+
+from .test_types import ContainerData, InheritanceData, MutabilityData, NestedDefinitionsData, OptionalData, \
+    SpecialSubclassesContainer, SpecialTypesData
+
+
+class Color(enum.Enum):
+    Red = 1
+    Green = "green"
+
+
+class ExtendedTypesData(ImplicitDict):
+    timestamp: datetime
+    duration: timedelta
+    color: Color
+    samples: array
+    tags: set
+    nested: Optional[List[SpecialTypesData]]
+
+
+def _standard_values() -> list:
+    return [
+        ContainerData.example_value(),
+        InheritanceData.example_value(),
+        NestedDefinitionsData.example_value(),
+        SpecialSubclassesContainer.example_value(),
+        SpecialTypesData.example_value(),
+        *OptionalData.example_values().values(),
+        {"unicode": "é☃\n\"", 1: 1.5, 2.5: None, True: False, None: [float("nan"), float("inf"), -float("inf")]},
+        [[], {}, (), "", 0, -1, 1e100],
+        "top-level string",
+    ]
+
+
+def test_matches_json_dumps():
+    for value in _standard_values():
+        expected = json.dumps(value)
+        assert dumps(value) == expected
+        assert to_json_bytes(value) == expected.encode("utf-8")
+        assert "".join(iter_json(value)) == expected
+        assert "".join(iter_json(value, chunk_size=1)) == expected
+        f = io.StringIO()
+        dump(value, f, chunk_size=16)
+        assert f.getvalue() == expected
+
+
+def test_chunk_size():
+    value = [ContainerData.example_value() for _ in range(100)]
+    chunks = list(iter_json(value, chunk_size=100))
+    assert len(chunks) > 10
+    assert all(len(chunk) < 200 for chunk in chunks)
+    assert "".join(chunks) == json.dumps(value)
+
+
+def test_circular_reference():
+    data = MutabilityData.example_value()
+    data.subtype = data
+    cyclic_list = [1]
+    cyclic_list.append({"list": cyclic_list})
+    cyclic_tuple = ([],)
+    cyclic_tuple[0].append(cyclic_tuple)
+    for value in (data, cyclic_list, cyclic_tuple):
+        with pytest.raises(ValueError, match="^Circular reference detected$"):
+            json.dumps(value)
+        with pytest.raises(ValueError, match="^Circular reference detected$"):
+            "".join(iter_json(value))
+        with pytest.raises(ValueError, match="^Circular reference detected$"):
+            dumps(value)
+
+    # Values referenced more than once, but not from within themselves, are not circular
+    shared = MutabilityData.example_value()
+    value = {"a": shared, "b": [shared, shared]}
+    assert "".join(iter_json(value)) == dumps(value) == json.dumps(value)
+
+
+def test_extended_types():
+    t = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    data = ExtendedTypesData(
+        timestamp=t,
+        duration=timedelta(hours=1),
+        color=Color.Green,
+        samples=array("d", [1.0, 2.5]),
+        tags={"tag"},
+        nested=[SpecialTypesData.example_value()],
+    )
+    for s in (dumps(data), to_json_bytes(data).decode("utf-8"), "".join(iter_json(data, chunk_size=1))):
+        result = json.loads(s)
+        assert result["timestamp"] == "2024-01-02T03:04:05Z"
+        assert StringBasedDateTime(result["timestamp"]).datetime == t
+        assert StringBasedTimeDelta(result["duration"]).timedelta == timedelta(hours=1)
+        assert result["color"] == "green"
+        assert result["samples"] == [1.0, 2.5]
+        assert result["tags"] == ["tag"]
+        assert result["nested"] == json.loads(json.dumps(data.nested))
+
+    assert dumps({"b", "c", "a"}) == '["a", "b", "c"]'
+    assert dumps(frozenset({3, 1, 2})) == "[1, 2, 3]"
+    assert json.loads(dumps({(1, "a"), ("b",)})) in ([[1, "a"], ["b"]], [["b"], [1, "a"]])
+    assert dumps(Color.Red) == "1"
+    with pytest.raises(TypeError):
+        dumps(object())
+    with pytest.raises(TypeError):
+        "".join(iter_json({object(): 1}))
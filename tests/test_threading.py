@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import List, Optional
+
+from implicitdict import ImplicitDict, _get_fields_info, _KEY_FIELDS_INFO
+
+from .test_types import InheritanceData, MySubclass
+
+
+N_THREADS = 8
+
+
+def _concurrently(fn) -> list:
+    barrier = threading.Barrier(N_THREADS)
+
+    def run():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        return [f.result() for f in [executor.submit(run) for _ in range(N_THREADS)]]
+
+
+def test_concurrent_first_use():
+    for _ in range(20):
+        # The forward reference defers the metadata for Node until its first use
+        class Node(ImplicitDict):
+            value: int
+            children: Optional[List["Node"]]
+
+        globals()["Node"] = Node
+        try:
+            results = _concurrently(lambda: ImplicitDict.parse({"value": "1", "children": [{"value": 2}]}, Node))
+            infos = _concurrently(lambda: _get_fields_info(Node))
+        finally:
+            del globals()["Node"]
+
+        assert all(r == {"value": 1, "children": [{"value": 2}]} for r in results)
+        assert all(isinstance(r.children[0], Node) for r in results)
+        assert all(info is infos[0] for info in infos)
+        assert Node.__dict__[_KEY_FIELDS_INFO] is infos[0]
+
+
+def test_metadata_not_inherited():
+    assert MySubclass.__dict__[_KEY_FIELDS_INFO] is not InheritanceData.__dict__[_KEY_FIELDS_INFO]
+    assert _get_fields_info(InheritanceData).all_fields < _get_fields_info(MySubclass).all_fields
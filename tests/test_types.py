@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, FrozenSet, Generic, Literal, Mapping, Optional, List, Sequence, Set, Tuple, TypeVar, Union
 
 from implicitdict import ImplicitDict, StringBasedDateTime, StringBasedTimeDelta
 
@@ -80,6 +80,16 @@ class MutabilityData(ImplicitDict):
     generic_dict: dict
     subtype: Optional["MutabilityData"]
 
+    @staticmethod
+    def example_value():
+        return ImplicitDict.parse(
+            {
+                "primitive": "foo",
+                "list_of_primitives": ["one", "two"],
+                "generic_dict": {"level1": "bar", "level2": {"baz": [1, 2]}},
+                "subtype": {"primitive": "nested", "list_of_primitives": ["three"], "generic_dict": {}},
+            }, MutabilityData)
+
 
 class NormalUsageData(ImplicitDict):
     foo: str
@@ -180,3 +190,154 @@ class NestedDefinitionsData(ImplicitDict):
     @staticmethod
     def example_value():
         return ImplicitDict.parse({"special_types": {"datetime": datetime.now(timezone.utc).isoformat(), "timedelta": "12h", "yesno": "Yes", "boolean": "true"}}, NestedDefinitionsData)
+
+
+class ValidationNode(ImplicitDict):
+    value: int
+    children: Optional[List["ValidationNode"]]
+
+
+class ValidationData(ImplicitDict):
+    integer: int
+    number: float
+    boolean: bool
+    string: str
+    yesno: YesNo
+    optional_yesno: Optional[YesNo]
+    literal: Literal["fixed"]
+    timestamp: StringBasedDateTime
+    duration: Optional[StringBasedTimeDelta]
+    int_map: Dict[str, int]
+    any_dict: dict
+    nodes: Optional[List[ValidationNode]]
+    nested: SpecialTypesData
+    matrix: List[List[Optional[float]]]
+    special_list: SpecialListClass
+    undescribable: Union[int, str] = 0
+    with_default: str = "default"
+    untyped_default = 3
+
+    @staticmethod
+    def example_value():
+        return ImplicitDict.parse(
+            {
+                "integer": 1,
+                "number": 1.5,
+                "boolean": True,
+                "string": "foo",
+                "yesno": "No",
+                "optional_yesno": "Yes",
+                "literal": "fixed",
+                "timestamp": "2024-01-02T03:04:05Z",
+                "duration": "1h",
+                "int_map": {"a": 1, "b": 2},
+                "any_dict": {"anything": ["goes"]},
+                "nodes": [{"value": 1, "children": [{"value": 2}, {"value": 3, "children": []}]}],
+                "nested": {"datetime": "2024-01-02T03:04:05Z", "timedelta": "12h", "yesno": "Yes", "boolean": False},
+                "matrix": [[1.0, None], [], [2]],
+                "special_list": ["foo"],
+            }, ValidationData)
+
+
+class Shape(ImplicitDict):
+    __discriminator__ = "kind"
+
+
+class Circle(Shape):
+    kind: Literal["circle"] = "circle"
+    radius: float
+
+
+class Square(Shape):
+    kind: Literal["square"] = "square"
+    side: float
+
+
+class Triangle(Shape):
+    kind = "triangle"
+    sides: List[float]
+
+
+class Drawing(ImplicitDict):
+    shape: Union[Circle, Square, Triangle]
+    background: Optional[Union[Circle, Square]]
+    layers: List[Union[Circle, Square, Triangle]]
+
+    @staticmethod
+    def example_value():
+        return ImplicitDict.parse(
+            {
+                "shape": {"kind": "square", "side": 2},
+                "layers": [{"kind": "circle", "radius": 1}, {"kind": "triangle", "sides": [3, 4, 5]}],
+            }, Drawing)
+
+
+class Point(ImplicitDict):
+    x: float
+    y: float
+
+
+class Address(ImplicitDict):
+    street: str
+    city: str
+    postal_code: Optional[str]
+
+
+class Named(ImplicitDict):
+    name: str
+
+
+class Location(ImplicitDict):
+    place: Union[Point, Address]
+    alternate: Optional[Union[Point, Address, Named]]
+
+
+class CollectionData(ImplicitDict):
+    position: Tuple[float, float]
+    labeled_point: Tuple[str, Point]
+    measurements: Tuple[int, ...]
+    tags: Set[str]
+    ids: FrozenSet[int]
+    points: Sequence[Point]
+    points_by_name: Mapping[str, Point]
+    pairs: Optional[List[Tuple[int, int]]]
+
+    @staticmethod
+    def example_value():
+        return ImplicitDict.parse(
+            {
+                "position": [1.5, 2],
+                "labeled_point": ["origin", {"x": 0, "y": 0}],
+                "measurements": [3, 1, 4, 1, 5],
+                "tags": ["b", "a", "b"],
+                "ids": [2, 1],
+                "points": [{"x": 1, "y": 2}],
+                "points_by_name": {"corner": {"x": 3, "y": 4}},
+                "pairs": [[1, 2], [3, 4]],
+            }, CollectionData)
+
+
+T = TypeVar("T")
+
+
+class Page(ImplicitDict, Generic[T]):
+    """One page of results."""
+
+    items: List[T]
+    """Results on this page."""
+
+    cursor: Optional[str]
+    """Cursor for the next page, if any."""
+
+
+class TreeNode(ImplicitDict, Generic[T]):
+    value: T
+    children: Optional[List["TreeNode[T]"]]
+
+
+class LabeledPage(Page[Tuple[str, T]]):
+    label: str
+
+
+class PointPage(Page[Point]):
+    total: int = 0
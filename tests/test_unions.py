@@ -0,0 +1,183 @@
+import json
+from typing import Literal, Union
+
+import pytest
+
+from implicitdict import ImplicitDict
+from implicitdict.jsonschema import make_json_schema, SchemaVars
+from implicitdict.validation import validate, validate_native
+
+from .test_types import Address, Circle, Drawing, Location, Named, Point, Shape, Square, Triangle
+
+
+def test_tagged_union_parse():
+    drawing = Drawing.example_value()
+    assert isinstance(drawing.shape, Square)
+    assert drawing.shape.side == 2
+    assert [type(layer) for layer in drawing.layers] == [Circle, Triangle]
+    assert "background" not in drawing
+
+    drawing = ImplicitDict.parse(json.loads(json.dumps(drawing)), Drawing)
+    assert isinstance(drawing.shape, Square)
+    assert isinstance(drawing.layers[1], Triangle)
+    assert drawing.layers[1].sides == [3.0, 4.0, 5.0]
+
+    drawing = ImplicitDict.parse({"shape": {"kind": "circle", "radius": 1}, "background": None, "layers": []}, Drawing)
+    assert "background" not in drawing
+    drawing = ImplicitDict.parse({"shape": {"kind": "circle", "radius": 1}, "background": {"kind": "circle", "radius": 2}, "layers": []}, Drawing)
+    assert isinstance(drawing.background, Circle)
+
+
+def test_tagged_union_errors():
+    with pytest.raises(ValueError, match=r'^At shape: Discriminator field "kind" not specified'):
+        ImplicitDict.parse({"shape": {"side": 2}, "layers": []}, Drawing)
+    with pytest.raises(ValueError, match=r"^At layers\[0\]\.kind: Value 'hexagon' is not one of \['circle', 'square', 'triangle'\]"):
+        ImplicitDict.parse({"shape": {"kind": "square", "side": 2}, "layers": [{"kind": "hexagon"}]}, Drawing)
+    with pytest.raises(ValueError, match=r"^At background\.kind: Value 'triangle' is not one of \['circle', 'square'\]"):
+        ImplicitDict.parse({"shape": {"kind": "square", "side": 2}, "background": {"kind": "triangle", "sides": []}, "layers": []}, Drawing)
+    with pytest.raises(ValueError, match=r"^At shape\.side:"):
+        ImplicitDict.parse({"shape": {"kind": "square", "side": "two"}, "layers": []}, Drawing)
+    with pytest.raises(ValueError, match=r"^At shape: Expected to find dictionary data"):
+        ImplicitDict.parse({"shape": "square", "layers": []}, Drawing)
+
+
+def test_tagged_union_declaration_errors():
+    class Ellipse(Shape):
+        kind: Literal["circle"] = "circle"
+
+    class Line(ImplicitDict):
+        __discriminator__ = "type"
+        type: Literal["line"] = "line"
+
+    class Unknown(Shape):
+        size: float
+
+    for union, message in (
+            (Union[Circle, Ellipse], 'both use discriminator value "circle"'),
+            (Union[Circle, Line], "must all declare the same __discriminator__"),
+            (Union[Circle, Unknown], 'Unknown must declare its value for discriminator field "kind"'),
+    ):
+        holder = type("Holder", (ImplicitDict,), {"__annotations__": {"value": union}})
+        with pytest.raises(ValueError, match=message):
+            ImplicitDict.parse({"value": {"kind": "circle", "radius": 1}}, holder)
+
+
+def _schema_vars(t):
+    return SchemaVars(name=t.__name__, path_to=lambda t_dest, t_src: "#/definitions/" + t_dest.__name__)
+
+
+def test_tagged_union_schema():
+    repo = {}
+    make_json_schema(Drawing, _schema_vars, repo)
+    schema = repo["Drawing"]
+
+    shape = schema["properties"]["shape"]
+    assert shape["discriminator"] == {
+        "propertyName": "kind",
+        "mapping": {"circle": "#/definitions/Circle", "square": "#/definitions/Square", "triangle": "#/definitions/Triangle"},
+    }
+    assert shape["oneOf"][1] == {"$ref": "#/definitions/Square", "properties": {"kind": {"const": "square"}}, "required": ["kind"]}
+    assert {"type": "null"} in schema["properties"]["background"]["oneOf"]
+    assert "background" not in schema["required"]
+    assert "shape" in schema["required"]
+    assert {"Circle", "Square", "Triangle"} <= set(repo)
+
+
+@pytest.mark.parametrize("source", [
+    {"shape": {"kind": "square", "side": 2}, "layers": []},
+    {"shape": {"kind": "triangle", "sides": [1]}, "background": None, "layers": [{"kind": "circle", "radius": 1}]},
+    {"shape": {"kind": "square"}, "layers": []},
+    {"shape": {"kind": "square", "side": "two"}, "layers": []},
+    {"shape": {"side": 2}, "layers": []},
+    {"shape": {"kind": "hexagon"}, "layers": []},
+    {"shape": {"kind": 5}, "layers": []},
+    {"shape": "square", "layers": []},
+    {"shape": {"kind": "circle", "radius": 1}, "background": {"kind": "triangle"}, "layers": []},
+    {"shape": {"kind": "circle", "radius": 1}, "layers": [None]},
+])
+def test_tagged_union_validation(source):
+    try:
+        validate(source, Drawing)
+        valid = True
+    except ValueError:
+        valid = False
+    try:
+        validate_native(source, Drawing)
+        native_valid = True
+    except ValueError:
+        native_valid = False
+    assert native_valid == valid
+
+
+def test_untagged_union_parse():
+    location = ImplicitDict.parse({"place": {"x": 1, "y": "2"}, "alternate": {"street": "Main", "city": "Town", "postal_code": "1"}}, Location)
+    assert isinstance(location.place, Point)
+    assert location.place.y == 2.0
+    assert isinstance(location.alternate, Address)
+
+    # Unrecognized fields are allowed when no type recognizes all the fields
+    location = ImplicitDict.parse({"place": {"x": 1, "y": 2, "z": 3}, "alternate": {"name": "Home"}}, Location)
+    assert isinstance(location.place, Point)
+    assert isinstance(location.alternate, Named)
+
+    location = ImplicitDict.parse({"place": {"street": "Main", "city": "Town"}, "alternate": None}, Location)
+    assert isinstance(location.place, Address)
+    assert "alternate" not in location
+
+
+def test_untagged_union_errors():
+    with pytest.raises(ValueError, match=r"^At place: Fields \['street'\] do not match any of Point, Address \(Point requires \['x', 'y'\]; Address requires \['city'\]\)"):
+        ImplicitDict.parse({"place": {"street": "Main"}}, Location)
+    with pytest.raises(ValueError, match=r"^At place\.x:"):
+        ImplicitDict.parse({"place": {"x": "one", "y": 2}}, Location)
+    with pytest.raises(ValueError, match=r"^At alternate: Value is ambiguous between Address, Named"):
+        ImplicitDict.parse({"place": {"x": 1, "y": 2}, "alternate": {"street": "Main", "city": "Town", "name": "Home"}}, Location)
+    with pytest.raises(ValueError, match=r"^At place: Expected to find dictionary data"):
+        ImplicitDict.parse({"place": [1, 2]}, Location)
+
+
+def test_untagged_union_trial_parse():
+    class Count(ImplicitDict):
+        value: int
+
+    class Label(ImplicitDict):
+        value: str
+        language: str = "en"
+
+    holder = type("Holder", (ImplicitDict,), {"__annotations__": {"item": Union[Count, Label]}})
+    assert isinstance(ImplicitDict.parse({"item": {"value": "three"}}, holder).item, Label)
+    assert isinstance(ImplicitDict.parse({"item": {"value": "3", "language": "fr"}}, holder).item, Label)
+    with pytest.raises(ValueError, match="ambiguous between Count, Label"):
+        ImplicitDict.parse({"item": {"value": "3"}}, holder)
+
+
+def test_untagged_union_schema():
+    repo = {}
+    make_json_schema(Location, _schema_vars, repo)
+    schema = repo["Location"]
+    assert schema["properties"]["place"] == {"anyOf": [{"$ref": "#/definitions/Point"}, {"$ref": "#/definitions/Address"}]}
+    assert schema["properties"]["alternate"]["anyOf"][-1] == {"type": "null"}
+    assert schema["required"] == ["place"]
+
+
+@pytest.mark.parametrize("source", [
+    {"place": {"x": 1, "y": 2}},
+    {"place": {"street": "Main", "city": "Town"}, "alternate": None},
+    {"place": {"x": 1}},
+    {"place": {"x": "one", "y": 2}},
+    {"place": {"x": 1, "y": 2}, "alternate": {"name": 5}},
+    {"place": {"x": 1, "y": 2}, "alternate": {"name": "Home"}},
+    {"place": [1, 2]},
+])
+def test_untagged_union_validation(source):
+    try:
+        validate(source, Location)
+        valid = True
+    except ValueError:
+        valid = False
+    try:
+        validate_native(source, Location)
+        native_valid = True
+    except ValueError:
+        native_valid = False
+    assert native_valid == valid
@@ -0,0 +1,138 @@
+import json
+import random
+
+import pytest
+
+from implicitdict.serialization import dumps
+from implicitdict.validation import _SchemaCompiler, validate, validate_native, validator_for
+
+from .test_types import CollectionData, ContainerData, InheritanceData, NestedDefinitionsData, NormalUsageData, OptionalData, \
+    SpecialSubclassesContainer, SpecialTypesData, ValidationData
+
+
+def test_valid_data():
+    values = [
+        CollectionData.example_value(),
+        ContainerData.example_value(),
+        InheritanceData.example_value(),
+        NestedDefinitionsData.example_value(),
+        SpecialSubclassesContainer.example_value(),
+        SpecialTypesData.example_value(),
+        ValidationData.example_value(),
+        *OptionalData.example_values().values(),
+    ]
+    for value in values:
+        validate(value, type(value))
+        validate(json.loads(dumps(value)), type(value))
+        validate_native(json.loads(dumps(value)), type(value))
+
+
+def test_invalid_data():
+    with pytest.raises(ValueError, match="'foo' is a required property"):
+        validate({"bar": 1}, NormalUsageData)
+    with pytest.raises(ValueError, match=r"^At bar: 'one' is not of type 'integer'"):
+        validate({"foo": "asdf", "bar": "one"}, NormalUsageData)
+
+    data = json.loads(json.dumps(NestedDefinitionsData.example_value()))
+    data["special_types"]["yesno"] = "Maybe"
+    with pytest.raises(ValueError, match=r"^At special_types.yesno: 'Maybe' is not one of"):
+        validate(data, NestedDefinitionsData)
+
+    data = json.loads(json.dumps(ContainerData.example_value()))
+    data["list_of_lists"][1].append(2)
+    with pytest.raises(ValueError, match=r"^At list_of_lists\[1\]\[1\]: 2 is not of type 'string'"):
+        validate(data, ContainerData)
+
+    data = {"special_list": ["foo"], "special_complex_list": [{"foo": "oof", "bar": "zero"}]}
+    with pytest.raises(ValueError, match=r"^At special_complex_list\[0\].bar: 'zero' is not of type 'integer'"):
+        validate(data, SpecialSubclassesContainer)
+
+
+def test_validator_is_cached():
+    assert validator_for(NestedDefinitionsData) is validator_for(NestedDefinitionsData)
+    assert validator_for(NestedDefinitionsData) is not validator_for(SpecialTypesData)
+
+
+_REPLACEMENTS = [None, True, False, 0, 1, -2, 1.5, 2.0, "", "foo", "fixed", "Yes", "No", "1h",
+                 [], [1], [None], ["foo"], {}, {"value": 1}, {"a": 1}, {"$ref": 1}, {"$ref": "foo"}]
+
+
+def _mutate(data, rng: random.Random) -> None:
+    """Replace or remove one randomly-selected value within data (which must be a dict or list)."""
+    while True:
+        keys = list(data.keys()) if isinstance(data, dict) else list(range(len(data)))
+        if not keys:
+            return
+        key = rng.choice(keys)
+        child = data[key]
+        if isinstance(child, (dict, list)) and child and rng.random() < 0.6:
+            data = child
+            continue
+        if isinstance(data, dict) and rng.random() < 0.2:
+            del data[key]
+        else:
+            data[key] = json.loads(json.dumps(rng.choice(_REPLACEMENTS)))
+        return
+
+
+def _is_valid(validate_fn, data, t) -> bool:
+    try:
+        validate_fn(data, t)
+        return True
+    except ValueError:
+        return False
+
+
+def test_native_matches_jsonschema():
+    rng = random.Random(12345)
+    examples = [ValidationData.example_value(), NestedDefinitionsData.example_value(), ContainerData.example_value(),
+                SpecialSubclassesContainer.example_value(), CollectionData.example_value(), *OptionalData.example_values().values()]
+    n_invalid = 0
+    for _ in range(2000):
+        example = rng.choice(examples)
+        data = json.loads(dumps(example))
+        for _ in range(rng.randint(1, 3)):
+            _mutate(data, rng)
+        expected = _is_valid(validate, data, type(example))
+        assert _is_valid(validate_native, data, type(example)) == expected, json.dumps(data)
+        n_invalid += 0 if expected else 1
+    assert 500 < n_invalid < 1900
+
+
+def test_native_errors():
+    data = json.loads(json.dumps(ValidationData.example_value()))
+    data["nodes"][0]["children"][1]["children"] = [{"value": "one"}]
+    with pytest.raises(ValueError, match=r"^At nodes\[0\].children\[1\].children\[0\].value: Expected integer"):
+        validate_native(data, ValidationData)
+
+    data = json.loads(json.dumps(ValidationData.example_value()))
+    del data["nested"]["yesno"]
+    with pytest.raises(ValueError, match=r'^At nested: Required field "yesno" not specified in SpecialTypesData'):
+        validate_native(data, ValidationData)
+
+    data = json.loads(json.dumps(ValidationData.example_value()))
+    data["optional_yesno"] = None
+    validate(data, ValidationData)
+    validate_native(data, ValidationData)
+
+
+def test_native_collection_errors():
+    data = json.loads(dumps(CollectionData.example_value()))
+    for field, value, message in (
+            ("position", [1, 2, 3], r"^At position: Expected array of 2 items but found 3 items"),
+            ("labeled_point", ["origin", {"x": "0", "y": 0}], r"^At labeled_point\[1\].x: Expected number"),
+            ("tags", ["a", "b", "a"], r"^At tags: Expected array of unique items"),
+            ("ids", [1, 1.0], r"^At ids: Expected array of unique items"),
+    ):
+        invalid = dict(data, **{field: value})
+        assert not _is_valid(validate, invalid, CollectionData)
+        with pytest.raises(ValueError, match=message):
+            validate_native(invalid, CollectionData)
+
+
+def test_native_unsupported_keywords():
+    # Native checks are compiled from the generated JSON Schema, so keywords the compiler does not know fail loudly
+    compiler = _SchemaCompiler(NormalUsageData)
+    compiler.compile({"type": ["string", "null"], "format": "date-time", "description": "Annotations are ignored"})
+    with pytest.raises(NotImplementedError, match="pattern"):
+        compiler.compile({"type": "string", "pattern": "^a"})
@@ -0,0 +1,97 @@
+import gc
+import sys
+import types
+import weakref
+from typing import List, Optional
+
+import pytest
+
+from implicitdict import ImplicitDict, warmup, _KEY_FIELDS_INFO
+from implicitdict.serialization import iter_json
+
+from .test_types import MutabilityData, NestedDefinitionsData, SpecialSubclassesContainer, SpecialTypesData, MySubclass
+
+
+_FORWARD_REFERENCE_MODULE = '''
+from typing import List, Optional
+from implicitdict import ImplicitDict
+
+class Route(ImplicitDict):
+    waypoints: List["Waypoint"]
+    alternate: Optional["Route"]
+
+class Waypoint(ImplicitDict):
+    name: str
+'''
+
+
+@pytest.fixture
+def forward_reference_module():
+    module = types.ModuleType("implicitdict_test_forward_references")
+    sys.modules[module.__name__] = module
+    try:
+        exec(_FORWARD_REFERENCE_MODULE, module.__dict__)
+        yield module
+    finally:
+        del sys.modules[module.__name__]
+
+
+def _computed(t) -> bool:
+    return _KEY_FIELDS_INFO in t.__dict__
+
+
+def test_metadata_computed_at_definition():
+    class Eager(ImplicitDict):
+        foo: str
+        bar: Optional[List[int]]
+        baz: int = 0
+
+    assert _computed(Eager)
+    assert Eager.__dict__[_KEY_FIELDS_INFO].all_fields == {"foo", "bar", "baz"}
+    assert Eager.__dict__[_KEY_FIELDS_INFO].hints == {"foo": str, "bar": Optional[List[int]], "baz": int}
+    assert ImplicitDict.parse({"foo": "x", "bar": ["1"]}, Eager).bar == [1]
+
+
+def test_metadata_does_not_retain_types():
+    def make_type():
+        Local = type("Local", (ImplicitDict,), {"__annotations__": {"foo": str}})
+        "".join(iter_json(ImplicitDict.parse({"foo": "x"}, Local)))
+        return weakref.ref(Local)
+
+    ref = make_type()
+    gc.collect()
+    assert ref() is None
+
+
+def test_metadata_errors_raised_at_definition():
+    with pytest.raises(SyntaxError):
+        class Malformed(ImplicitDict):
+            foo: "List[int"
+
+
+def test_warmup_forward_references(forward_reference_module):
+    Route = forward_reference_module.Route
+    Waypoint = forward_reference_module.Waypoint
+    assert not _computed(Route)
+    assert _computed(Waypoint)
+
+    assert set(warmup(forward_reference_module)) == {Route, Waypoint}
+    assert Route.__dict__[_KEY_FIELDS_INFO].hints["waypoints"] == List[Waypoint]
+    route = ImplicitDict.parse({"waypoints": [{"name": "a"}], "alternate": {"waypoints": []}}, Route)
+    assert isinstance(route.alternate, Route)
+    assert isinstance(route.waypoints[0], Waypoint)
+
+
+def test_warmup_referenced_types():
+    warmed = warmup([NestedDefinitionsData, MutabilityData, SpecialSubclassesContainer])
+    assert set(warmed) == {NestedDefinitionsData, SpecialTypesData, MutabilityData, SpecialSubclassesContainer, MySubclass}
+    for t in warmed:
+        assert _computed(t)
+
+
+def test_warmup_unresolvable():
+    class Unresolvable(ImplicitDict):
+        missing: "NotDefinedAnywhere"  # noqa: F821
+
+    with pytest.raises(NameError):
+        warmup(Unresolvable)